@@ -3,6 +3,7 @@
 import karrio.lib as lib
 import karrio.api.proxy as proxy
 import karrio.providers.allied_express.utils as provider_utils
+import karrio.providers.allied_express.fanout as provider_fanout
 import karrio.mappers.allied_express.settings as provider_settings
 
 
@@ -52,10 +53,12 @@ class Proxy(proxy.Proxy):
         return lib.Deserializable(response, provider_utils.parse_response)
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        response = lib.run_asynchronously(
+        response = provider_fanout.run(
+            self.settings,
             lambda payload: (
                 payload["shipmentno"],
-                lib.request(
+                provider_fanout.request(
+                    self.settings,
                     url=f"{self.settings.server_url}/getShipmentsStatus/{payload['shipmentno']}",
                     trace=self.trace_as("json"),
                     method="POST",
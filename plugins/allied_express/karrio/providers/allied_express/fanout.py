@@ -0,0 +1,126 @@
+"""Bounded and rate limited fan-out of Allied Express tracking requests.
+
+The connection config options below tune the fan-out:
+    - max_in_flight: maximum number of concurrent requests (default 8)
+    - rate_limit: maximum number of requests started per second per carrier
+    - max_retries: retries of 429 and 5xx responses (default 2), each one
+      delayed by a jittered exponential backoff
+"""
+
+import time
+import random
+import typing
+import threading
+import contextvars
+import concurrent.futures
+import karrio.lib as lib
+
+T = typing.TypeVar("T")
+S = typing.TypeVar("S")
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_DELAY = 1.0
+RETRY_JITTER = 0.5
+RETRY_ON_STATUS = [429, 500, 502, 503, 504]
+
+
+class TokenBucket:
+    """A thread safe token bucket refilled with `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate,
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+BUCKETS: typing.Dict[tuple, TokenBucket] = {}
+BUCKETS_LOCK = threading.Lock()
+
+
+def get_bucket(carrier_name: str, rate: float) -> TokenBucket:
+    """Return the process wide token bucket of a carrier."""
+    with BUCKETS_LOCK:
+        if (carrier_name, rate) not in BUCKETS:
+            BUCKETS[(carrier_name, rate)] = TokenBucket(rate)
+
+        return BUCKETS[(carrier_name, rate)]
+
+
+def run(
+    settings,
+    predicate: typing.Callable[[S], T],
+    sequence: typing.Iterable[S],
+) -> typing.List[T]:
+    """Apply the predicate to every item with bounded concurrency.
+
+    Results are returned in the order of the sequence. Every call runs in a
+    copy of the caller context so that context variables such as the Sentry
+    scope reach the worker threads.
+    """
+    items = list(sequence)
+    config = settings.connection_config
+    max_in_flight = config.max_in_flight.state or DEFAULT_MAX_IN_FLIGHT
+    bucket = lib.identity(
+        get_bucket(settings.carrier_name, config.rate_limit.state)
+        if config.rate_limit.state
+        else None
+    )
+
+    if not items:
+        return []
+
+    def call(item: S) -> T:
+        if bucket is not None:
+            bucket.acquire()
+
+        return predicate(item)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_in_flight, len(items))
+    ) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, call, item)
+            for item in items
+        ]
+
+        return [future.result() for future in futures]
+
+
+def request(settings, send: typing.Callable[..., str] = None, **kwargs) -> str:
+    """A `lib.request` also retrying throttled (429) responses.
+
+    The retry delay is drawn per call within `RETRY_JITTER` of
+    `DEFAULT_RETRY_DELAY` so that requests throttled together do not all
+    retry at the same instants. `send` overrides the underlying request
+    function (`lib.request`).
+    """
+    max_retries = settings.connection_config.max_retries.state
+    jitter = random.uniform(-RETRY_JITTER, RETRY_JITTER)
+
+    return (send or lib.request)(
+        max_retries=DEFAULT_MAX_RETRIES if max_retries is None else max_retries,
+        retry_delay=DEFAULT_RETRY_DELAY * (1 + jitter),
+        retry_on_status=RETRY_ON_STATUS,
+        **kwargs,
+    )
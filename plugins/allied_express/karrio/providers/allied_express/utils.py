@@ -1,6 +1,9 @@
+import re
 import attr
+import json
 import base64
 import typing
+import functools
 import karrio.lib as lib
 import karrio.core as core
 
@@ -48,6 +51,11 @@ class ConnectionConfig(lib.Enum):
     text_color = lib.OptionEnum("text_color")
     brand_color = lib.OptionEnum("brand_color")
 
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+
 
 @attr.s(auto_attribs=True)
 class AlliedResponse:
@@ -60,15 +68,7 @@ class AlliedResponse:
 
 
 def parse_response(response: str) -> AlliedResponse:
-    _response = lib.failsafe(
-        lambda: lib.to_dict(
-            (
-                response.replace("soapenv:", "soapenv")
-                .replace("@xmlns:", "xmlns")
-                .replace("ns1:", "ns1")
-            )
-        )
-    )
+    _response = lib.failsafe(lambda: decode_response(response))
 
     if _response is None:
         _error = response[: response.find(": {")].strip()
@@ -79,58 +79,16 @@ def parse_response(response: str) -> AlliedResponse:
 
     _envelope = _response.get("soapenvEnvelope") or {}
     _body = _envelope.get("soapenvBody") or _response.get("soapenvBody") or {}
+    operation = next((key for key in _body if key in OPERATIONS), None)
 
-    if "ns1getShipmentsStatusResponse" in _body:
-        _data = _body["ns1getShipmentsStatusResponse"]
+    if operation is not None:
+        _data = _body[operation]
         return AlliedResponse(
             data=_data,
             body=_body,
             envelope=_envelope,
             response=_response,
-            is_error=(
-                ("statusError" in (_data or {}).get("result", {}))
-                or ("errors" in (_data or {}).get("result", {}))
-            ),
-        )
-
-    if "ns1calculatePriceResponse" in _body:
-        _data = _body["ns1calculatePriceResponse"]
-        return AlliedResponse(
-            data=_data,
-            body=_body,
-            envelope=_envelope,
-            response=_response,
-            is_error=(
-                ("statusError" in (_data or {}).get("result", {}))
-                or ("errors" in (_data or {}).get("result", {}))
-            ),
-        )
-
-    if "ns1cancelDispatchJobResponse" in _body:
-        _data = _body["ns1cancelDispatchJobResponse"]
-        return AlliedResponse(
-            data=_data,
-            body=_body,
-            envelope=_envelope,
-            response=_response,
-            is_error=(
-                ((_data or {}).get("result") != "0")
-                or ("statusError" in (_data or {}).get("result", {}))
-                or ("errors" in (_data or {}).get("result", {}))
-            ),
-        )
-
-    if "ns1getLabelResponse" in _body:
-        _data = _body["ns1getLabelResponse"]
-        return AlliedResponse(
-            data=_data,
-            body=_body,
-            envelope=_envelope,
-            response=_response,
-            is_error=(
-                ("statusError" in (_data or {}).get("result", {}))
-                or ("errors" in (_data or {}).get("result", {}))
-            ),
+            is_error=OPERATIONS[operation](_data),
         )
 
     return AlliedResponse(
@@ -139,3 +97,61 @@ def parse_response(response: str) -> AlliedResponse:
         envelope=_envelope,
         response=_response,
     )
+
+
+def decode_response(response: str) -> dict:
+    """Decode a JSON encoded SOAP response in a single pass.
+
+    Namespace prefixes are stripped from the keys (`soapenv:Body` becomes
+    `soapenvBody`) and empty values dropped as objects are decoded, like
+    `lib.to_dict` does on the prefix-stripped response.
+    """
+    try:
+        return json.loads(response, object_hook=_decode_object)
+    except json.JSONDecodeError:
+        # tolerate the trailing commas `lib.to_dict` accepts
+        response = re.sub(",[ \t\r\n]+}", "}", response)
+        response = re.sub(r",[ \t\r\n]+\]", "]", response)
+
+        return json.loads(response, object_hook=_decode_object)
+
+
+def _decode_object(data: dict) -> dict:
+    return {
+        _strip_prefixes(key): value
+        for key, value in data.items()
+        if value not in (None, [], "")
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _strip_prefixes(key: str) -> str:
+    for prefix, replacement in NAMESPACE_PREFIXES:
+        key = key.replace(prefix, replacement)
+
+    return key
+
+
+def _result_has_errors(data: dict) -> bool:
+    return ("statusError" in (data or {}).get("result", {})) or (
+        "errors" in (data or {}).get("result", {})
+    )
+
+
+def _cancel_has_errors(data: dict) -> bool:
+    return ((data or {}).get("result") != "0") or _result_has_errors(data)
+
+
+NAMESPACE_PREFIXES = [
+    ("soapenv:", "soapenv"),
+    ("@xmlns:", "xmlns"),
+    ("ns1:", "ns1"),
+]
+
+# Response body operations and how their result reports errors.
+OPERATIONS: typing.Dict[str, typing.Callable[[dict], bool]] = {
+    "ns1getShipmentsStatusResponse": _result_has_errors,
+    "ns1calculatePriceResponse": _result_has_errors,
+    "ns1cancelDispatchJobResponse": _cancel_has_errors,
+    "ns1getLabelResponse": _result_has_errors,
+}
@@ -0,0 +1,107 @@
+"""Benchmark the Allied Express SOAP response decoding.
+
+Run from the plugin directory with
+`python -m tests.allied_express.bench_parse_response`.
+"""
+
+import json
+import timeit
+import tracemalloc
+import karrio.lib as lib
+import karrio.providers.allied_express.utils as provider_utils
+
+COUNT = 1_000
+
+
+def main():
+    response = json.dumps(
+        {
+            "soapenv:Envelope": {
+                "@xmlns:soapenv": "http://schemas.xmlsoap.org/soap/envelope/",
+                "soapenv:Body": {
+                    "ns1:getShipmentsStatusResponse": {
+                        "@xmlns:ns1": "http://neptune.alliedexpress.com.au/ttws-ejb",
+                        "result": {
+                            "statusBarcodesList": [
+                                {
+                                    "consignmentNote": f"AOE{_:08d}R",
+                                    "depotLocation": "BANKSTOWN AERODROME",
+                                    "scannedBarcode": f"AOE{_:08d}R-001",
+                                    "scannedStatus": "Freight has been delivered",
+                                    "scannnedTimestamp": "2023-10-26T14:03:55.000+11:00",
+                                }
+                                for _ in range(COUNT)
+                            ]
+                        },
+                    }
+                },
+            }
+        },
+        indent=2,
+    )
+
+    assert _replace_and_probe(response) == provider_utils.parse_response(response)
+    print(
+        f"getShipmentsStatus response: {COUNT:,} shipments, "
+        f"{len(response) // 1024} KiB"
+    )
+
+    for name, parse in [
+        ("replace and probe", lambda: _replace_and_probe(response)),
+        ("parse_response", lambda: provider_utils.parse_response(response)),
+    ]:
+        print(
+            f"{name}: {_best(parse) * 1000:.2f} ms, "
+            f"{_peak_allocation(parse) / 2 ** 20:.2f} MiB peak allocation"
+        )
+
+
+def _replace_and_probe(response: str) -> provider_utils.AlliedResponse:
+    # the decoding used before `decode_response`, with the error rule of
+    # every operation but cancelDispatchJob
+    _response = lib.to_dict(
+        response.replace("soapenv:", "soapenv")
+        .replace("@xmlns:", "xmlns")
+        .replace("ns1:", "ns1")
+    )
+    _envelope = _response.get("soapenvEnvelope") or {}
+    _body = _envelope.get("soapenvBody") or _response.get("soapenvBody") or {}
+
+    for operation in [
+        "ns1getShipmentsStatusResponse",
+        "ns1calculatePriceResponse",
+        "ns1cancelDispatchJobResponse",
+        "ns1getLabelResponse",
+    ]:
+        if operation in _body:
+            _data = _body[operation]
+            return provider_utils.AlliedResponse(
+                data=_data,
+                body=_body,
+                envelope=_envelope,
+                response=_response,
+                is_error=(
+                    ("statusError" in (_data or {}).get("result", {}))
+                    or ("errors" in (_data or {}).get("result", {}))
+                ),
+            )
+
+
+def _peak_allocation(func) -> int:
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def _best(func, number: int = 20) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -17,14 +17,12 @@ def parse_tracking_response(
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _response.deserialize()
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=_)
-            for _, response in responses
-            if response.is_error
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for _, response in responses
+        if response.is_error
+        for message in error.parse_error_response(response, settings, tracking_number=_)
+    ]
     tracking_details = [
         _extract_details(details.data["result"], settings)
         for _, details in responses
@@ -41,13 +39,8 @@ def _extract_details(
     result = lib.to_object(tracking.ResultType, data)
     description = result.statusBarcodesList.scannedStatus or "In Transit"
     delivered = "delivered" in description
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if description in status.value
-        ),
-        provider_units.TrackingStatus.in_transit.name,
+    status = provider_units.find_tracking_status(
+        description, provider_units.TrackingStatus.in_transit.name
     )
 
     return models.TrackingDetails(
@@ -71,21 +64,11 @@ def _extract_details(
                     result.statusBarcodesList.scannnedTimestamp,
                     current_format="%Y-%m-%dT%H:%M:%S.%f%z",
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if result.statusBarcodesList.scannedBarcode in s.value
-                    ),
-                    None,
+                status=provider_units.find_tracking_status(
+                    result.statusBarcodesList.scannedBarcode
                 ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if result.statusBarcodesList.scannedBarcode in r.value
-                    ),
-                    None,
+                reason=provider_units.find_incident_reason(
+                    result.statusBarcodesList.scannedBarcode
                 ),
             )
         ],
@@ -4,6 +4,7 @@ from .fixture import gateway
 
 import karrio.sdk as karrio
 import karrio.lib as lib
+import karrio.providers.allied_express_local.utils as provider_utils
 import karrio.core.models as models
 
 
@@ -57,6 +58,23 @@ class TestAlliedExpressTracking(unittest.TestCase):
             self.assertListEqual(lib.to_dict(parsed_response), ParsedErrorResponse)
 
 
+    def test_decode_response_strips_namespace_prefixes(self):
+        decoded = provider_utils.decode_response(TrackingResponse)
+        lenient = provider_utils.decode_response(
+            TrackingResponse.replace('"123456789"\n', '"123456789",\n')
+            .replace("}\n    }\n  }", "},\n    }\n  }")
+        )
+
+        self.assertDictEqual(
+            decoded,
+            lib.to_dict(
+                TrackingResponse.replace("soapenv:", "soapenv")
+                .replace("@xmlns:", "xmlns")
+                .replace("ns1:", "ns1")
+            ),
+        )
+        self.assertDictEqual(lenient, decoded)
+
 if __name__ == "__main__":
     unittest.main()
 
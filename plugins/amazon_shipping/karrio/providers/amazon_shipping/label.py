@@ -0,0 +1,243 @@
+"""Amazon Shipping PNG/JPEG label to PDF conversion.
+
+`images_to_pdf` writes one PDF page per label and embeds the label image
+as-is: PNG image data is copied into a FlateDecode stream with PNG
+predictors and JPEG files into a DCTDecode stream, so labels are neither
+decoded nor re-encoded. Interlaced, alpha and transparent (tRNS) PNGs are
+flattened with Pillow first. Malformed PNGs raise a `ValueError`.
+"""
+
+import io
+import base64
+import struct
+import typing
+import PIL.Image
+
+# Pages are sized like `lib.image_to_pdf` which renders images at 300 dpi.
+DPI = 300
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8"
+PNG_COLORS = {0: 1, 2: 3, 3: 1}
+JPEG_COLOR_SPACES = {1: "/DeviceGray", 3: "/DeviceRGB"}
+# JPEG start of frame markers (excluding DHT, JPG and DAC)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class Image(typing.NamedTuple):
+    width: int
+    height: int
+    bits: int
+    color_space: str
+    filter: str
+    decode_parms: str
+    data: bytes
+
+
+def images_to_pdf(base64_strings: typing.Iterable[str]) -> str:
+    """Return a base64 PDF with a page per PNG or JPEG base64 label."""
+    writer = _PdfWriter()
+
+    for b64_str in base64_strings:
+        writer.add_image(read_image(base64.b64decode(b64_str)))
+
+    return base64.b64encode(writer.close()).decode("utf-8")
+
+
+def read_image(content: bytes) -> Image:
+    if content.startswith(PNG_SIGNATURE):
+        return _read_png(content) or _read_png(_flatten(content))
+
+    if content.startswith(JPEG_SIGNATURE):
+        return _read_jpeg(content) or _read_png(_flatten(content))
+
+    return _read_png(_flatten(content))
+
+
+def _read_png(content: bytes) -> typing.Optional[Image]:
+    """Read the compressed image data of a non interlaced, opaque PNG."""
+    offset = len(PNG_SIGNATURE)
+    header, palette, data = None, b"", io.BytesIO()
+
+    while offset < len(content):
+        if offset + 12 > len(content):
+            raise ValueError("Invalid PNG label: truncated chunk")
+
+        (length,) = struct.unpack(">I", content[offset : offset + 4])
+        kind = content[offset + 4 : offset + 8]
+        chunk = content[offset + 8 : offset + 8 + length]
+        offset += length + 12
+
+        if offset > len(content):
+            raise ValueError(f"Invalid PNG label: truncated {kind!r} chunk")
+
+        if kind == b"IHDR" and length == 13:
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif kind == b"PLTE":
+            palette = chunk
+        elif kind == b"tRNS":
+            # transparency has no PDF equivalent here, Pillow flattens it
+            return None
+        elif kind == b"IDAT":
+            data.write(chunk)
+        elif kind == b"IEND":
+            break
+
+    if header is None:
+        raise ValueError("Invalid PNG label: missing IHDR chunk")
+
+    if data.tell() == 0:
+        raise ValueError("Invalid PNG label: missing IDAT chunk")
+
+    width, height, bits, color_type, _, _, interlace = header
+    colors = PNG_COLORS.get(color_type)
+
+    if colors is None or interlace != 0:
+        return None
+
+    color_space = {
+        0: "/DeviceGray",
+        2: "/DeviceRGB",
+        3: f"[ /Indexed /DeviceRGB {len(palette) // 3 - 1} <{palette.hex()}> ]",
+    }[color_type]
+
+    return Image(
+        width=width,
+        height=height,
+        bits=bits,
+        color_space=color_space,
+        filter="/FlateDecode",
+        decode_parms=(
+            f"<< /Predictor 15 /Colors {colors} "
+            f"/BitsPerComponent {bits} /Columns {width} >>"
+        ),
+        data=data.getvalue(),
+    )
+
+
+def _read_jpeg(content: bytes) -> typing.Optional[Image]:
+    """Read the frame header of a grayscale or RGB JPEG."""
+    offset = len(JPEG_SIGNATURE)
+
+    while offset + 4 <= len(content):
+        marker, length = struct.unpack(">xBH", content[offset : offset + 4])
+
+        if marker in JPEG_SOF_MARKERS:
+            bits, height, width, components = struct.unpack(
+                ">BHHB", content[offset + 4 : offset + 10]
+            )
+            color_space = JPEG_COLOR_SPACES.get(components)
+
+            if color_space is None:
+                return None
+
+            return Image(
+                width=width,
+                height=height,
+                bits=bits,
+                color_space=color_space,
+                filter="/DCTDecode",
+                decode_parms=None,
+                data=content,
+            )
+
+        offset += length + 2
+
+    return None
+
+
+def _flatten(content: bytes) -> bytes:
+    """Re-encode an image Pillow can read as an RGB PNG on a white background."""
+    image = PIL.Image.open(io.BytesIO(content)).convert("RGBA")
+    flat = PIL.Image.new("RGB", image.size, "white")
+    flat.paste(image, mask=image)
+    buffer = io.BytesIO()
+    flat.save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+class _PdfWriter:
+    # Object numbers of the page tree and the catalog, written on close.
+    PAGES, CATALOG = 1, 2
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self.offsets: typing.List[int] = [0, 0]
+        self.kids: typing.List[int] = []
+        self.buffer.write(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+
+    def add_image(self, image: Image):
+        number = len(self.offsets) + 1
+        page, content, xobject = number, number + 1, number + 2
+        width, height = image.width * 72 / DPI, image.height * 72 / DPI
+        drawing = f"q {width:.2f} 0 0 {height:.2f} 0 0 cm /Im0 Do Q".encode("latin-1")
+
+        self._write(
+            page,
+            f"<< /Type /Page /Parent {self.PAGES} 0 R "
+            f"/MediaBox [ 0 0 {width:.2f} {height:.2f} ] "
+            f"/Resources << /XObject << /Im0 {xobject} 0 R >> >> "
+            f"/Contents {content} 0 R >>".encode("latin-1"),
+        )
+        self._write(content, _stream(f"<< /Length {len(drawing)} >>", drawing))
+        self._write(
+            xobject,
+            _stream(
+                "".join(
+                    [
+                        "<< /Type /XObject /Subtype /Image ",
+                        f"/Width {image.width} /Height {image.height} ",
+                        f"/ColorSpace {image.color_space} ",
+                        f"/BitsPerComponent {image.bits} /Filter {image.filter} ",
+                        (
+                            f"/DecodeParms {image.decode_parms} "
+                            if image.decode_parms
+                            else ""
+                        ),
+                        f"/Length {len(image.data)} >>",
+                    ]
+                ),
+                image.data,
+            ),
+        )
+        self.kids.append(page)
+
+    def close(self) -> bytes:
+        kids = " ".join(f"{kid} 0 R" for kid in self.kids)
+        self._write(
+            self.PAGES,
+            f"<< /Type /Pages /Kids [ {kids} ] /Count {len(self.kids)} >>".encode(
+                "latin-1"
+            ),
+        )
+        self._write(
+            self.CATALOG,
+            f"<< /Type /Catalog /Pages {self.PAGES} 0 R >>".encode("latin-1"),
+        )
+
+        xref = self.buffer.tell()
+        self.buffer.write(
+            "".join(
+                [
+                    f"xref\n0 {len(self.offsets) + 1}\n0000000000 65535 f \n",
+                    *(f"{offset:010d} 00000 n \n" for offset in self.offsets),
+                    f"trailer\n<< /Size {len(self.offsets) + 1} "
+                    f"/Root {self.CATALOG} 0 R >>\n",
+                    f"startxref\n{xref}\n%%EOF\n",
+                ]
+            ).encode("latin-1")
+        )
+
+        return self.buffer.getvalue()
+
+    def _write(self, number: int, body: bytes):
+        if number > len(self.offsets):
+            self.offsets.append(self.buffer.tell())
+        else:
+            self.offsets[number - 1] = self.buffer.tell()
+
+        self.buffer.write(f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n")
+
+
+def _stream(dictionary: str, data: bytes) -> bytes:
+    return dictionary.encode("latin-1") + b"\nstream\n" + data + b"\nendstream"
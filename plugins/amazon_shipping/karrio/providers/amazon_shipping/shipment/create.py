@@ -4,6 +4,8 @@ import typing
 import karrio.lib as lib
 import karrio.core.models as models
 import karrio.providers.amazon_shipping.error as error
+import karrio.providers.amazon_shipping.label as provider_label
+import karrio.providers.amazon_shipping.bundle as provider_bundle
 import karrio.providers.amazon_shipping.utils as provider_utils
 import karrio.providers.amazon_shipping.units as provider_units
 import karrio.schemas.amazon_shipping.one_click_shipment_response as amazon
@@ -51,12 +53,17 @@ def _extract_details(
         ),
         "PNG",
     )
-    label = lib.bundle_base64(labels, label_format) if len(labels) > 1 else next(iter(labels), None)
 
-    # Convert PNG to PDF if needed
-    if label and label_format == "PNG":
-        label = lib.image_to_pdf(label)
+    # Convert PNG labels to PDF with a page per package
+    if any(labels) and label_format == "PNG":
+        label = provider_label.images_to_pdf(labels)
         label_format = "PDF"
+    else:
+        label = (
+            provider_bundle.bundle_base64(labels, label_format)
+            if len(labels) > 1
+            else next(iter(labels), None)
+        )
 
     return models.ShipmentDetails(
         carrier_id=settings.carrier_id,
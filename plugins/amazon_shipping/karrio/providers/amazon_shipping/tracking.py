@@ -16,14 +16,14 @@ def parse_tracking_response(
     """Parse tracking response from Amazon Shipping API."""
     responses = _response.deserialize()
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=tracking_id)
-            for tracking_id, response in responses
-            if response.get("errors")
-        ],
-        [],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for tracking_id, response in responses
+        if response.get("errors")
+        for message in error.parse_error_response(
+            response, settings, tracking_number=tracking_id
+        )
+    ]
 
     trackers = [
         _extract_details(tracking_id, response, settings)
@@ -50,14 +50,7 @@ def _extract_details(
     # Get status from the latest event
     latest_event = next(iter(events), None)
     status = lib.failsafe(
-        lambda: next(
-            (
-                s.name
-                for s in list(provider_units.TrackingStatus)
-                if latest_event.eventCode in s.value
-            ),
-            None,
-        )
+        lambda: provider_units.find_tracking_status(latest_event.eventCode)
     )
 
     return models.TrackingDetails(
@@ -88,22 +81,8 @@ def _extract_details(
                     event.eventTime,
                     current_format="%Y-%m-%dT%H:%M:%SZ",
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.eventCode in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.eventCode in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.eventCode),
+                reason=provider_units.find_incident_reason(event.eventCode),
             )
             for event in events
         ],
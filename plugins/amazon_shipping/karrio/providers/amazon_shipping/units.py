@@ -1,5 +1,7 @@
 """Karrio Amazon Shipping units and enums."""
 
+import typing
+import functools
 import karrio.lib as lib
 
 
@@ -147,3 +149,20 @@ class TrackingIncidentReason(lib.Enum):
     payment_issue = ["PaymentNotReady", "OtpNotAvailable"]
     hazmat = ["HazmatShipment"]
     unknown = []
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -2,3 +2,5 @@ from tests.amazon_shipping.test_authentication import *
 from tests.amazon_shipping.test_rate import *
 from tests.amazon_shipping.test_tracking import *
 from tests.amazon_shipping.test_shipment import *
+from tests.amazon_shipping.test_label import *
+from tests.amazon_shipping.test_bundle import *
@@ -0,0 +1,88 @@
+"""Benchmark the Amazon Shipping PNG to PDF label conversion.
+
+Run from the plugin directory with `python -m tests.amazon_shipping.bench_label`.
+"""
+
+import io
+import base64
+import random
+import timeit
+import tracemalloc
+import PIL.Image
+import PIL.ImageDraw
+import karrio.lib as lib
+import karrio.providers.amazon_shipping.label as provider_label
+
+LABELS = [
+    ((812, 1218), "1", 1),
+    ((812, 1218), "1", 5),
+    ((1200, 1800), "L", 1),
+    ((1200, 1800), "L", 5),
+    ((1200, 1800), "RGB", 5),
+]
+
+
+def main():
+    for size, mode, packages in LABELS:
+        labels = [create_label(size, mode, seed=_) for _ in range(packages)]
+        name = f"{size[0]}x{size[1]} {mode:<3} x{packages}"
+
+        for path, convert in [
+            ("image_to_pdf", lambda: _image_to_pdf(labels)),
+            ("images_to_pdf", lambda: provider_label.images_to_pdf(labels)),
+        ]:
+            output = convert()
+            print(
+                f"{name} ({path}): {_best(convert) * 1000:.2f} ms, "
+                f"{len(base64.b64decode(output)) // 1024} KiB, "
+                f"{_peak_allocation(convert) / 2 ** 20:.1f} MiB peak allocation"
+            )
+
+
+def create_label(size: tuple, mode: str, seed: int = 0) -> str:
+    """Return a base64 PNG with label-like text blocks and barcode bars."""
+    generator = random.Random(seed)
+    image = PIL.Image.new("L", size, 255)
+    draw = PIL.ImageDraw.Draw(image)
+    width, height = size
+
+    for top in range(height // 20, height // 2, height // 25):
+        draw.text((width // 20, top), "AMZN " * generator.randint(2, 8), fill=0)
+
+    left = width // 10
+    while left < width * 9 // 10:
+        bar = generator.randint(2, 8)
+        draw.rectangle((left, height * 6 // 10, left + bar, height * 8 // 10), fill=0)
+        left += bar + generator.randint(2, 8)
+
+    buffer = io.BytesIO()
+    image.convert(mode).save(buffer, "PNG")
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def _image_to_pdf(labels: list) -> str:
+    # the conversion used before `images_to_pdf`
+    label = lib.bundle_base64(labels, "PNG") if len(labels) > 1 else labels[0]
+
+    return lib.image_to_pdf(label)
+
+
+def _peak_allocation(func) -> int:
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def _best(func, number: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Amazon Shipping label conversion tests."""
+
+import io
+import zlib
+import base64
+import struct
+import unittest
+import PIL.Image
+import PyPDF2
+import karrio.providers.amazon_shipping.label as provider_label
+
+
+class TestAmazonShippingLabelConversion(unittest.TestCase):
+    def test_images_to_pdf_adds_a_page_per_label(self):
+        labels = [create_label((812, 1218), "1"), create_label((1200, 1800), "L")]
+
+        document = read_pdf(provider_label.images_to_pdf(labels))
+
+        self.assertEqual(len(document.pages), 2)
+        self.assertListEqual(
+            [[float(_) for _ in page.mediabox] for page in document.pages],
+            [[0, 0, 194.88, 292.32], [0, 0, 288.0, 432.0]],
+        )
+
+    def test_png_data_is_embedded_as_is(self):
+        for mode in ["1", "L", "RGB", "P"]:
+            with self.subTest(mode=mode):
+                label = create_label((400, 600), mode)
+                image = provider_label.read_image(base64.b64decode(label))
+
+                self.assertEqual(image.filter, "/FlateDecode")
+                self.assertEqual((image.width, image.height), (400, 600))
+                self.assertIn(image.data, base64.b64decode(label))
+
+    def test_jpeg_data_is_embedded_as_is(self):
+        label = create_label((400, 600), "L", format="JPEG")
+        image = provider_label.read_image(base64.b64decode(label))
+
+        self.assertEqual(image.filter, "/DCTDecode")
+        self.assertEqual((image.width, image.height), (400, 600))
+        self.assertEqual(image.data, base64.b64decode(label))
+
+    def test_alpha_pngs_are_flattened(self):
+        label = create_label((100, 150), "RGBA")
+        image = provider_label.read_image(base64.b64decode(label))
+
+        self.assertEqual(image.color_space, "/DeviceRGB")
+        self.assertEqual((image.width, image.height), (100, 150))
+
+    def test_interlaced_pngs_are_flattened(self):
+        # a 1x1 gray Adam7 PNG: its single pixel is in the first pass
+        content = b"".join(
+            [
+                b"\x89PNG\r\n\x1a\n",
+                png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 1)),
+                png_chunk(b"IDAT", zlib.compress(b"\x00\x80")),
+                png_chunk(b"IEND", b""),
+            ]
+        )
+        image = provider_label.read_image(content)
+
+        self.assertEqual(image.color_space, "/DeviceRGB")
+        self.assertNotIn(zlib.compress(b"\x00\x80"), image.data)
+
+    def test_transparent_pngs_are_flattened(self):
+        label = create_label((100, 150), "P", transparency=0)
+        content = base64.b64decode(label)
+        image = provider_label.read_image(content)
+
+        self.assertIn(b"tRNS", content)
+        self.assertEqual(image.color_space, "/DeviceRGB")
+        self.assertNotIn(image.data, content)
+
+    def test_malformed_pngs_raise_a_clear_error(self):
+        content = b"".join(
+            [
+                b"\x89PNG\r\n\x1a\n",
+                png_chunk(b"IDAT", zlib.compress(b"\x00\x80")),
+                png_chunk(b"IEND", b""),
+            ]
+        )
+
+        with self.assertRaisesRegex(ValueError, "missing IHDR"):
+            provider_label.read_image(content)
+
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            provider_label.read_image(content[:-6])
+
+
+def create_label(size: tuple, mode: str, format: str = "PNG", **options) -> str:
+    image = PIL.Image.new("L", size, 255)
+    image.paste(0, (size[0] // 4, size[1] // 4, size[0] // 2, size[1] // 2))
+    buffer = io.BytesIO()
+    image.convert(mode).save(buffer, format, **options)
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return b"".join(
+        [
+            struct.pack(">I", len(data)),
+            kind,
+            data,
+            struct.pack(">I", zlib.crc32(kind + data)),
+        ]
+    )
+
+
+def read_pdf(b64_str: str) -> PyPDF2.PdfReader:
+    return PyPDF2.PdfReader(io.BytesIO(base64.b64decode(b64_str)), strict=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,7 +54,7 @@ class TestAmazonShippingShipment(unittest.TestCase):
             response = karrio.Shipment.create(self.ShipmentRequest).from_(gateway)
 
             with patch(
-                "karrio.providers.amazon_shipping.shipment.create.lib.image_to_pdf"
+                "karrio.providers.amazon_shipping.shipment.create.provider_label.images_to_pdf"
             ) as pdf_mock:
                 pdf_mock.return_value = "base64_pdf_label"
                 parsed_response = response.parse()
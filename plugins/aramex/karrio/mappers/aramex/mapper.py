@@ -18,3 +18,10 @@ class Mapper(mapper.Mapper):
         self, response: lib.Deserializable
     ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
         return provider.parse_tracking_response(response, self.settings)
+
+    def stream_tracking_response(
+        self, response: lib.Deserializable
+    ) -> typing.Iterator[
+        typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]
+    ]:
+        return provider.stream_tracking_response(response, self.settings)
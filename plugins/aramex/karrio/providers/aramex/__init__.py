@@ -20,5 +20,6 @@ from karrio.providers.aramex.utils import Settings
 # )
 from karrio.providers.aramex.tracking import (
     parse_tracking_response,
+    stream_tracking_response,
     tracking_request,
 )
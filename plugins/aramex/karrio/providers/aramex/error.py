@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, List
 from karrio.schemas.aramex.tracking import Notification
 from karrio.core.utils import Element, XP
 from karrio.core.models import Message
@@ -7,7 +7,11 @@ from karrio.providers.aramex import Settings
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
     errors = response.xpath(".//*[local-name() = $name]", name="Notification")
-    return [_extract_error(node, settings) for node in errors]
+    return parse_error_nodes(errors, settings)
+
+
+def parse_error_nodes(nodes: Iterable[Element], settings: Settings) -> List[Message]:
+    return [_extract_error(node, settings) for node in nodes]
 
 
 def _extract_error(node: Element, settings: Settings) -> Message:
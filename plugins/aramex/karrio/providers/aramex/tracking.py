@@ -1,5 +1,6 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Union
 from functools import partial
+import lxml.etree
 from karrio.schemas.aramex.array_of_string import ArrayOfstring
 from karrio.schemas.aramex.tracking import (
     ShipmentTrackingRequest,
@@ -20,15 +21,28 @@ from karrio.core.models import (
     Message,
 )
 from karrio.providers.aramex.utils import Settings
-from karrio.providers.aramex.error import parse_error_response
+from karrio.providers.aramex.error import parse_error_response, parse_error_nodes
 import karrio.lib as lib
 import karrio.providers.aramex.units as provider_units
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def parse_tracking_response(
     _response: lib.Deserializable[lib.Element],
     settings: Settings,
 ) -> Tuple[List[TrackingDetails], List[Message]]:
+    if settings.connection_config.stream_tracking.state:
+        try:
+            streamed = list(stream_tracking_response(_response, settings))
+
+            return (
+                [detail for details, _ in streamed for detail in details],
+                [message for _, messages in streamed for message in messages],
+            )
+        except lxml.etree.XMLSyntaxError:
+            pass  # not well-formed XML, leave it to the lenient DOM parser below
+
     response = _response.deserialize()
     non_existents = next(
         (
@@ -46,6 +60,59 @@ def parse_tracking_response(
     return tracking_details, errors
 
 
+def stream_tracking_response(
+    _response: lib.Deserializable[lib.Element],
+    settings: Settings,
+) -> Iterator[Tuple[List[TrackingDetails], List[Message]]]:
+    """Parse the raw tracking response incrementally without building its DOM.
+
+    The details of every tracking result are yielded as soon as the element
+    is parsed, then discarded. The non existing waybills and notifications
+    are yielded last, in the order `parse_tracking_response` reports them.
+    """
+    non_existents: ArrayOfstring = None
+    notifications: List[Message] = []
+
+    for node in _iterparse(
+        _response.value, "TrackingResult", "NonExistingWaybills", "Notification"
+    ):
+        tag = node.tag.rpartition("}")[-1]
+
+        if tag == "Notification":
+            notifications.extend(parse_error_nodes([node], settings))
+            continue
+
+        if tag == "NonExistingWaybills":
+            non_existents = non_existents or XP.to_object(ArrayOfstring, node)
+            continue
+
+        yield [_extract_detail(node, settings)], []
+
+        # results are wrapped per waybill (KeyValueOf...>Key,Value>TrackingResult):
+        # drop the parsed elements preceding the result and each of its wrappers
+        node.clear()
+        element = node
+        while element.getparent() is not None:
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            element = element.getparent()
+
+    yield [], _extract_errors(non_existents or ArrayOfstring(), settings) + notifications
+
+
+def _iterparse(text: Union[str, bytes], *tags: str) -> Iterator[Element]:
+    parser = lxml.etree.XMLPullParser(
+        events=("end",), tag=[f"{{*}}{tag}" for tag in tags]
+    )
+
+    for start in range(0, len(text), STREAM_CHUNK_SIZE):
+        parser.feed(text[start : start + STREAM_CHUNK_SIZE])
+        yield from (node for _, node in parser.read_events())
+
+    parser.close()
+    yield from (node for _, node in parser.read_events())
+
+
 def _extract_errors(non_existents: ArrayOfstring, settings: Settings) -> List[Message]:
     return [
         Message(
@@ -72,14 +139,7 @@ def _extract_detail(node: Element, settings: Settings) -> TrackingDetails:
                 code=detail.UpdateCode,
                 time=DF.ftime(detail.UpdateDateTime, "%Y-%m-%dT%H:%M:%S"),
                 timestamp=lib.fiso_timestamp(detail.UpdateDateTime, current_format="%Y-%m-%dT%H:%M:%S"),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if detail.UpdateCode in r.value
-                    ),
-                    None,
-                ),
+                reason=provider_units.find_incident_reason(detail.UpdateCode),
             )
         ],
     )
@@ -1,5 +1,7 @@
 """ Aramex Native Types """
 
+import typing
+import functools
 import karrio.lib as lib
 
 
@@ -73,3 +75,16 @@ class TrackingIncidentReason(lib.Enum):
 #     carrier_saturday_delivery = "SATURDAY DELIVERY CODE"
 #     carrier_dry_ice = "DRY ICE CODE"
 #
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -1,3 +1,4 @@
+import karrio.lib as lib
 from karrio.core.utils import XP, apply_namespaceprefix, Envelope, Header
 from karrio.core import Settings as BaseSettings
 
@@ -24,6 +25,13 @@ class Settings(BaseSettings):
     def server_url(self):
         return "http://ws.dev.aramex.net" if self.test_mode else "http://ws.aramex.net"
 
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
     @staticmethod
     def standard_request_serializer(
         envelope: Envelope,
@@ -46,3 +54,7 @@ class Settings(BaseSettings):
             apply_namespaceprefix(node, version, special_prefixes)
 
         return XP.export(envelope, namespacedef_=namespacedef_)
+
+
+class ConnectionConfig(lib.Enum):
+    stream_tracking = lib.OptionEnum("stream_tracking", bool)
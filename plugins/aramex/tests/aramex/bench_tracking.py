@@ -0,0 +1,94 @@
+"""Benchmark the Aramex tracking response parsing, DOM against streaming.
+
+Run from the plugin directory with `python -m tests.aramex.bench_tracking`.
+"""
+
+import time
+import resource
+import multiprocessing
+import karrio.lib as lib
+import karrio.sdk as karrio
+
+COUNT = 5_000
+
+
+def main():
+    response = create_response(COUNT)
+    print(f"tracking response: {COUNT:,} waybills, {len(response) / 2 ** 20:.1f} MiB")
+
+    # each parse runs in a fresh process as lxml memory is invisible to
+    # tracemalloc and the max RSS never goes down
+    context = multiprocessing.get_context("spawn")
+
+    for stream in [False, True]:
+        with context.Pool(1) as pool:
+            elapsed, growth, count = pool.apply(_parse, (response, stream))
+
+        print(
+            f"{'stream' if stream else 'DOM':<6}: {elapsed * 1000:.0f} ms, "
+            f"+{growth / 2 ** 10:.1f} MiB max RSS, {count:,} details"
+        )
+
+
+def create_response(count: int) -> str:
+    results = "".join(
+        f"""
+            <a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>
+               <a:Key>{3_000_000_000 + _}</a:Key>
+               <a:Value>
+                  <TrackingResult>
+                     <WaybillNumber>{3_000_000_000 + _}</WaybillNumber>
+                     <UpdateCode>SH005</UpdateCode>
+                     <UpdateDescription>Delivered</UpdateDescription>
+                     <UpdateDateTime>2021-03-02T11:45:00</UpdateDateTime>
+                     <UpdateLocation>Amman, Jordan</UpdateLocation>
+                     <Comments/>
+                     <ProblemCode/>
+                  </TrackingResult>
+               </a:Value>
+            </a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>"""
+        for _ in range(count)
+    )
+
+    return f"""<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <ShipmentTrackingResponse xmlns="http://ws.aramex.net/ShippingAPI/v1/">
+         <Transaction i:nil="true" xmlns:i="http://www.w3.org/2001/XMLSchema-instance"/>
+         <Notifications xmlns:i="http://www.w3.org/2001/XMLSchema-instance"/>
+         <HasErrors>false</HasErrors>
+         <TrackingResults xmlns:a="http://schemas.microsoft.com/2003/10/Serialization/Arrays" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">{results}
+         </TrackingResults>
+      </ShipmentTrackingResponse>
+   </s:Body>
+</s:Envelope>
+"""
+
+
+def _parse(response: str, stream: bool):
+    gateway = karrio.gateway["aramex"].create(
+        dict(
+            username="username",
+            password="password",
+            account_number="20016",
+            account_pin="331421",
+            account_entity="AMM",
+            account_country_code="JO",
+            config=dict(stream_tracking=stream),
+        )
+    )
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    details, _ = gateway.mapper.parse_tracking_response(
+        lib.Deserializable(response, lib.to_element)
+    )
+    elapsed = time.perf_counter() - start
+
+    return (
+        elapsed,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before,
+        len(details),
+    )
+
+
+if __name__ == "__main__":
+    main()
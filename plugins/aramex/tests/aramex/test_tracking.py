@@ -1,5 +1,7 @@
 import unittest
 from unittest.mock import patch
+import karrio.lib as lib
+import karrio.sdk as karrio
 from karrio.core.utils import DP
 from karrio.sdk import Tracking
 from karrio.core.models import TrackingRequest
@@ -60,6 +62,49 @@ class TestCarrierTracking(unittest.TestCase):
                 DP.to_dict(parsed_response), DP.to_dict(ParsedErrorResponse)
             )
 
+    def test_parse_streamed_tracking_response(self):
+        streaming_gateway = karrio.gateway["aramex"].create(
+            dict(
+                username="testingapi@aramex.com",
+                password="R123456789$r",
+                account_number="20016",
+                account_pin="331421",
+                account_entity="AMM",
+                account_country_code="JO",
+                config=dict(stream_tracking=True),
+            )
+        )
+
+        for response in [
+            TrackingResultsResponseXML,
+            TrackingNonExistentResponseXML,
+            ErrorResponseXML,
+        ]:
+            self.assertEqual(
+                streaming_gateway.mapper.parse_tracking_response(
+                    lib.Deserializable(response, lib.to_element)
+                ),
+                gateway.mapper.parse_tracking_response(
+                    lib.Deserializable(response, lib.to_element)
+                ),
+            )
+
+    def test_stream_tracking_response(self):
+        streamed = list(
+            gateway.mapper.stream_tracking_response(
+                lib.Deserializable(TrackingResultsResponseXML, lib.to_element)
+            )
+        )
+
+        self.assertListEqual(
+            [[_.tracking_number for _ in details] for details, _ in streamed],
+            [["3000000001"], ["3000000002"], []],
+        )
+        self.assertListEqual(
+            [_.message for _ in streamed[-1][1]],
+            ['Waybill "1Z12345E6205277936" Not Found'],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -155,3 +200,47 @@ ErrorResponseXML = """
    </s:Body>
 </s:Envelope>
 """
+
+TrackingResultsResponseXML = """<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <ShipmentTrackingResponse xmlns="http://ws.aramex.net/ShippingAPI/v1/">
+         <Transaction i:nil="true" xmlns:i="http://www.w3.org/2001/XMLSchema-instance"/>
+         <Notifications xmlns:i="http://www.w3.org/2001/XMLSchema-instance"/>
+         <HasErrors>false</HasErrors>
+         <TrackingResults xmlns:a="http://schemas.microsoft.com/2003/10/Serialization/Arrays" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+            <a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>
+               <a:Key>3000000001</a:Key>
+               <a:Value>
+                  <TrackingResult>
+                     <WaybillNumber>3000000001</WaybillNumber>
+                     <UpdateCode>SH005</UpdateCode>
+                     <UpdateDescription>Delivered</UpdateDescription>
+                     <UpdateDateTime>2021-03-02T11:45:00</UpdateDateTime>
+                     <UpdateLocation>Amman, Jordan</UpdateLocation>
+                     <Comments/>
+                     <ProblemCode/>
+                  </TrackingResult>
+               </a:Value>
+            </a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>
+            <a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>
+               <a:Key>3000000002</a:Key>
+               <a:Value>
+                  <TrackingResult>
+                     <WaybillNumber>3000000002</WaybillNumber>
+                     <UpdateCode>SH003</UpdateCode>
+                     <UpdateDescription>Out for Delivery</UpdateDescription>
+                     <UpdateDateTime>2021-03-01T08:10:00</UpdateDateTime>
+                     <UpdateLocation>Dubai, United Arab Emirates</UpdateLocation>
+                     <Comments/>
+                     <ProblemCode/>
+                  </TrackingResult>
+               </a:Value>
+            </a:KeyValueOfstringArrayOfTrackingResultmFAkxlpY>
+         </TrackingResults>
+         <NonExistingWaybills xmlns:a="http://schemas.microsoft.com/2003/10/Serialization/Arrays" xmlns:i="http://www.w3.org/2001/XMLSchema-instance">
+            <a:string>1Z12345E6205277936</a:string>
+         </NonExistingWaybills>
+      </ShipmentTrackingResponse>
+   </s:Body>
+</s:Envelope>
+"""
@@ -4,6 +4,8 @@ import typing
 import urllib.parse
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.asendia_us.utils as provider_utils
+import karrio.providers.asendia_us.fanout as provider_fanout
 import karrio.mappers.asendia_us.settings as provider_settings
 
 
@@ -56,16 +58,40 @@ class Proxy(proxy.Proxy):
         return lib.Deserializable(response, lib.to_dict)
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        trackingNumberVendor = ",".join(request.serialize())
-        response = lib.request(
-            url=f"{self.settings.server_url}/api/A1/v2.0/Tracking/Milestone?trackingNumberVendor={trackingNumberVendor}",
-            trace=self.trace_as("json"),
-            method="DELETE",
-            headers={
-                "Accept": "application/json",
-                "X-AsendiaOne-ApiKey": f"{self.settings.api_key}",
-                "Authorization": f"Basic {self.settings.authorization}",
-            },
+        url = lambda numbers: (
+            f"{self.settings.server_url}/api/A1/v2.0/Tracking/Milestone"
+            f"?trackingNumberVendor={','.join(numbers)}"
         )
 
-        return lib.Deserializable(response, lib.to_dict)
+        def track(numbers: typing.List[str]):
+            # a network failure only fails its own chunk
+            try:
+                return numbers, provider_fanout.request(
+                    self.settings,
+                    url=url(numbers),
+                    trace=self.trace_as("json"),
+                    method="DELETE",
+                    headers={
+                        "Accept": "application/json",
+                        "X-AsendiaOne-ApiKey": f"{self.settings.api_key}",
+                        "Authorization": f"Basic {self.settings.authorization}",
+                    },
+                )
+            except OSError:
+                return numbers, None
+
+        responses: typing.List[typing.Tuple[typing.List[str], str]] = (
+            provider_fanout.run(
+                self.settings,
+                track,
+                provider_fanout.chunk(self.settings, request.serialize(), url),
+            )
+        )
+
+        return lib.Deserializable(
+            responses,
+            lambda responses: [
+                provider_utils.decode_tracking(numbers, res)
+                for numbers, res in responses
+            ],
+        )
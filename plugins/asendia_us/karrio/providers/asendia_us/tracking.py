@@ -9,14 +9,17 @@ import karrio.providers.asendia_us.units as provider_units
 
 
 def parse_tracking_response(
-    _response: lib.Deserializable[dict],
+    _response: lib.Deserializable[typing.Union[dict, typing.List[dict]]],
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     response = _response.deserialize()
 
-    messages = error.parse_error_response(response, settings)
+    responses = response if isinstance(response, list) else [response]
+    messages = error.parse_error_response(responses, settings)
     tracking_details = [
-        _extract_details(detail, settings) for detail in response.get("data") or []
+        _extract_details(detail, settings)
+        for res in responses
+        for detail in res.get("data") or []
     ]
 
     return tracking_details, messages
@@ -27,12 +30,8 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
     tracking = lib.to_object(asendia.DatumType, data)
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if tracking.trackingMilestoneEvents[0].eventCode in status.value
-        ),
+    status = provider_units.find_tracking_status(
+        tracking.trackingMilestoneEvents[0].eventCode,
         provider_units.TrackingStatus.in_transit.name,
     )
 
@@ -69,22 +68,8 @@ def _extract_details(
                         else "%Y-%m-%dT%H:%M:%S%z"
                     ),
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.eventCode in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.eventCode in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.eventCode),
+                reason=provider_units.find_incident_reason(event.eventCode),
             )
             for event in tracking.trackingMilestoneEvents
         ],
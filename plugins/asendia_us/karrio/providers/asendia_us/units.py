@@ -1,3 +1,5 @@
+import typing
+import functools
 import karrio.lib as lib
 import karrio.core.units as units
 
@@ -67,3 +69,20 @@ class TrackingIncidentReason(lib.Enum):
     consignee_refused = []
     consignee_not_home = []
     unknown = []
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -1,4 +1,5 @@
 import base64
+import typing
 import karrio.lib as lib
 import karrio.core as core
 
@@ -38,6 +39,29 @@ class Settings(core.Settings):
         return base64.b64encode(pair.encode("utf-8")).decode("ascii")
 
 
+def decode_tracking(numbers: typing.List[str], response: str) -> dict:
+    """Decode a tracking chunk response, standing in an error for a failed chunk."""
+    try:
+        data = None if response is None else lib.to_dict(response)
+    except ValueError:
+        data = None
+
+    if not isinstance(data, dict):
+        return dict(
+            responseStatusCode="tracking_request_failed",
+            responseStatusMessage=f"Tracking request failed for {', '.join(numbers)}",
+        )
+
+    return data
+
+
 class ConnectionConfig(lib.Enum):
     sub_account = lib.OptionEnum("sub_account")
     processing_location = lib.OptionEnum("processing_location")
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+    max_batch_size = lib.OptionEnum("max_batch_size", int)
+    max_url_length = lib.OptionEnum("max_url_length", int)
@@ -1,4 +1,5 @@
 
 from tests.asendia_us.test_rate import *
 from tests.asendia_us.test_tracking import *
-from tests.asendia_us.test_shipment import *
\ No newline at end of file
+from tests.asendia_us.test_shipment import *
+from tests.asendia_us.test_fanout import *
@@ -6,6 +6,7 @@ import karrio.lib as lib
 import karrio.api.proxy as proxy
 import karrio.core.errors as errors
 import karrio.providers.boxknight.error as provider_error
+import karrio.providers.boxknight.fanout as provider_fanout
 import karrio.mappers.boxknight.settings as provider_settings
 
 
@@ -106,7 +107,8 @@ class Proxy(proxy.Proxy):
 
         track = lambda data: (
             data["order_id"],
-            lib.request(
+            provider_fanout.request(
+                self.settings,
                 url=f"{self.settings.server_url}/orders/{data['order_id']}",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -114,8 +116,8 @@ class Proxy(proxy.Proxy):
             ),
         )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_asynchronously(
-            track, requests.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, track, requests.serialize()
         )
 
         return lib.Deserializable(
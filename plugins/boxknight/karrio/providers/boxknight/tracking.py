@@ -14,14 +14,12 @@ def parse_tracking_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _responses.deserialize()
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(res, settings, tracking_number=number)
-            for number, res in responses
-            if res.get("error") is not None
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for number, res in responses
+        if res.get("error") is not None
+        for message in error.parse_error_response(res, settings, tracking_number=number)
+    ]
     tracking_details = [
         _extract_details(res, settings)
         for _, res in responses
@@ -52,22 +50,8 @@ def _extract_details(
                     datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
                     current_format="%Y-%m-%dT%H:%M:%S.%fZ",
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if order.orderStatus in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if order.orderStatus in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(order.orderStatus),
+                reason=provider_units.find_incident_reason(order.orderStatus),
             )
         ],
         delivered=delivered,
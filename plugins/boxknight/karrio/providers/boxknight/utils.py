@@ -1,5 +1,6 @@
 """BoxKnight connection settings."""
 
+import karrio.lib as lib
 import karrio.core as core
 
 
@@ -20,3 +21,19 @@ class Settings(core.Settings):
     @property
     def tracking_url(self):
         return "https://www.tracking.boxknight.com/tracking?trackingNo={}"
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """BoxKnight connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
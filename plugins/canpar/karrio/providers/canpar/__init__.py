@@ -1,24 +1,45 @@
+"""Karrio Canpar provider.
+
+The generateDS bindings behind each Canpar web service are large, so the
+operation modules below are only imported when one of their functions is
+first accessed (e.g. tracking never loads CanshipBusinessService).
+"""
+
+import importlib
 from karrio.providers.canpar.utils import Settings
-from karrio.providers.canpar.rate import parse_rate_response, rate_request
-from karrio.providers.canpar.address import (
-    parse_address_validation_response,
-    address_validation_request
-)
-from karrio.providers.canpar.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.canpar.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.canpar.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
+
+OPERATIONS = {
+    # CanparRatingService
+    "rate_request": "karrio.providers.canpar.rate",
+    "parse_rate_response": "karrio.providers.canpar.rate",
+    "address_validation_request": "karrio.providers.canpar.address",
+    "parse_address_validation_response": "karrio.providers.canpar.address",
+    # CanshipBusinessService
+    "shipment_request": "karrio.providers.canpar.shipment.create",
+    "parse_shipment_response": "karrio.providers.canpar.shipment.create",
+    "shipment_cancel_request": "karrio.providers.canpar.shipment.cancel",
+    "parse_shipment_cancel_response": "karrio.providers.canpar.shipment.cancel",
+    # CanparAddonsService
+    "pickup_request": "karrio.providers.canpar.pickup.create",
+    "parse_pickup_response": "karrio.providers.canpar.pickup.create",
+    "pickup_update_request": "karrio.providers.canpar.pickup.update",
+    "parse_pickup_update_response": "karrio.providers.canpar.pickup.update",
+    "pickup_cancel_request": "karrio.providers.canpar.pickup.cancel",
+    "parse_pickup_cancel_response": "karrio.providers.canpar.pickup.cancel",
+    "tracking_request": "karrio.providers.canpar.tracking",
+    "parse_tracking_response": "karrio.providers.canpar.tracking",
+}
+
+
+def __getattr__(name: str):
+    if name not in OPERATIONS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    operation = getattr(importlib.import_module(OPERATIONS[name]), name)
+    globals()[name] = operation
+
+    return operation
+
+
+def __dir__():
+    return sorted([*globals().keys(), *OPERATIONS.keys()])
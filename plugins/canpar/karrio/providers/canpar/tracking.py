@@ -45,14 +45,7 @@ def _extract_tracking_details(
             code=event.code,
             time=lib.flocaltime(event.local_date_time, "%Y%m%d %H%M%S"),
             timestamp=lib.fiso_timestamp(event.local_date_time, current_format="%Y%m%d %H%M%S"),
-            reason=next(
-                (
-                    r.name
-                    for r in list(provider_units.TrackingIncidentReason)
-                    if event.code in r.value
-                ),
-                None,
-            ),
+            reason=provider_units.find_incident_reason(event.code),
         )
         for event in typing.cast(typing.List[canpar.TrackingEvent], result.events)
     ]
@@ -1,4 +1,5 @@
 import typing
+import functools
 import karrio.lib as lib
 from karrio.core.units import Options
 
@@ -123,3 +124,16 @@ def shipping_options_initializer(
         _options.update(package_options.content)
 
     return Options(_options, ShippingOption)
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -0,0 +1 @@
+from tests.canpar.test_import import *
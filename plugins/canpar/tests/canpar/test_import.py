@@ -0,0 +1,73 @@
+import sys
+import json
+import unittest
+import subprocess
+
+# Eagerly loading the generateDS service bindings used to take ~1.5s, so
+# importing the plugin must not load any operation or schema module.
+PLUGIN_MODULES = [
+    "karrio.mappers.canpar",
+    "karrio.mappers.canpar.mapper",
+    "karrio.mappers.canpar.proxy",
+    "karrio.mappers.canpar.settings",
+    "karrio.plugins.canpar",
+    "karrio.providers.canpar",
+    "karrio.providers.canpar.units",
+    "karrio.providers.canpar.utils",
+]
+
+
+class TestCanparImport(unittest.TestCase):
+    def test_plugin_import_loads_no_operation(self):
+        result = run_isolated(
+            "import karrio.plugins.canpar",
+        )
+
+        self.assertListEqual(result["schemas"], [])
+        self.assertListEqual(result["modules"], PLUGIN_MODULES)
+
+    def test_tracking_loads_only_addons_schema(self):
+        result = run_isolated(
+            "import karrio.plugins.canpar",
+            "import karrio.providers.canpar as provider",
+            "provider.parse_tracking_response",
+        )
+
+        self.assertListEqual(
+            result["schemas"], ["karrio.schemas.canpar.CanparAddonsService"]
+        )
+
+    def test_rating_loads_only_rating_schema(self):
+        result = run_isolated(
+            "import karrio.plugins.canpar",
+            "import karrio.providers.canpar as provider",
+            "provider.parse_rate_response",
+        )
+
+        self.assertListEqual(
+            result["schemas"], ["karrio.schemas.canpar.CanparRatingService"]
+        )
+
+
+def run_isolated(*statements: str) -> dict:
+    script = "\n".join(
+        [
+            "import sys, json",
+            *statements,
+            "schemas = sorted(_ for _ in sys.modules if _.startswith('karrio.schemas.canpar.'))",
+            "modules = sorted(_ for _ in sys.modules if 'canpar' in _.split('.') and _ not in schemas)",
+            "print(json.dumps(dict(schemas=schemas, modules=modules)))",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
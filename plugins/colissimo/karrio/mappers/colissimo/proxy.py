@@ -1,7 +1,11 @@
 """Karrio Colissimo client proxy."""
 
+import typing
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.core.models as models
+import karrio.providers.colissimo.rate_index as provider_rate_index
+import karrio.providers.colissimo.fanout as provider_fanout
 import karrio.providers.colissimo.utils as provider_utils
 import karrio.mappers.colissimo.settings as provider_settings
 import karrio.universal.mappers.rating_proxy as rating_proxy
@@ -11,7 +15,15 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
     settings: provider_settings.Settings
 
     def get_rates(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        return super().get_rates(request)
+        return provider_rate_index.get_rates(self.settings, request)
+
+    def get_rates_batch(
+        self, payloads: typing.Iterable[typing.Union[models.RateRequest, dict]]
+    ) -> typing.Iterator[
+        typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]
+    ]:
+        """Lazily rate a stream of rate requests against one rate index."""
+        return provider_rate_index.get_rates_batch(self.settings, payloads)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
         response = lib.request(
@@ -25,15 +37,43 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
         return lib.Deserializable(response, provider_utils.parse_response, request.ctx)
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        idships = ",".join(request.serialize())
-        response = lib.request(
-            url=f"{self.settings.laposte_server_url}/idships/{idships}?lang={self.settings.connection_config.lang.state or 'fr_FR'}",
-            trace=self.trace_as("json"),
-            method="GET",
-            headers={
-                "accept": "application/json",
-                "X-Okapi-Key": self.settings.laposte_api_key,
-            },
+        lang = dict(FR="fr_FR", EN="en_GB").get(
+            self.settings.connection_config.lang.state, "fr_FR"
+        )
+        url = lambda idships: (
+            f"{self.settings.laposte_server_url}/idships/{','.join(idships)}?lang={lang}"
+        )
+
+        def track(idships: typing.List[str]):
+            # a network failure only fails its own chunk
+            try:
+                return idships, provider_fanout.request(
+                    self.settings,
+                    url=url(idships),
+                    trace=self.trace_as("json"),
+                    method="GET",
+                    headers={
+                        "accept": "application/json",
+                        "X-Okapi-Key": self.settings.laposte_api_key,
+                    },
+                )
+            except OSError:
+                return idships, None
+
+        responses: typing.List[typing.Tuple[typing.List[str], str]] = (
+            provider_fanout.run(
+                self.settings,
+                track,
+                provider_fanout.chunk(self.settings, request.serialize(), url),
+            )
+        )
+
+        return lib.Deserializable(
+            responses,
+            lambda responses: [
+                _
+                for idships, res in responses
+                for _ in provider_utils.decode_tracking(idships, res)
+            ],
         )
 
-        return lib.Deserializable(response, lib.to_dict)
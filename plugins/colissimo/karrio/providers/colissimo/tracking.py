@@ -30,13 +30,8 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
     shipment = lib.to_object(colissimo.Shipment, data)
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if shipment.event[0].code in status.value
-        ),
-        provider_units.TrackingStatus.in_transit.name,
+    status = provider_units.find_tracking_status(
+        shipment.event[0].code, provider_units.TrackingStatus.in_transit.name
     )
 
     return models.TrackingDetails(
@@ -51,22 +46,8 @@ def _extract_details(
                 code=event.code,
                 time=lib.flocaltime(event.date, "%Y-%m-%dT%H:%M:%S%z"),
                 timestamp=lib.fiso_timestamp(event.date, current_format="%Y-%m-%dT%H:%M:%S%z"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.code in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.code in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.code),
+                reason=provider_units.find_incident_reason(event.code),
             )
             for event in shipment.event
         ],
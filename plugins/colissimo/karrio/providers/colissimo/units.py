@@ -1,3 +1,5 @@
+import typing
+import functools
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
@@ -46,6 +48,13 @@ class LabelType(lib.Enum):
 class ConnectionConfig(lib.Enum):
     lang = lib.OptionEnum("lang", lib.units.create_enum("Lang", ["FR", "EN"]))
 
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+    max_batch_size = lib.OptionEnum("max_batch_size", int)
+    max_url_length = lib.OptionEnum("max_url_length", int)
+
 
 class ServiceName(lib.Enum):
     """Carrier specific services"""
@@ -175,3 +184,20 @@ DEFAULT_SERVICES = [
         zones=[models.ServiceZone(label="Zone 1", rate=0.0)],
     ),
 ]
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -1,3 +1,4 @@
+import typing
 import karrio.lib as lib
 import karrio.core as core
 
@@ -39,6 +40,15 @@ class Settings(core.Settings):
     def tracking_url(self):
         return "https://www.laposte.fr/outils/suivre-vos-envois?code={}"
 
+    @property
+    def connection_config(self) -> lib.units.Options:
+        from karrio.providers.colissimo.units import ConnectionConfig
+
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
 
 def parse_response(response: str) -> dict:
     """Parse colissimo multipart response."""
@@ -69,3 +79,21 @@ def parse_response(response: str) -> dict:
         label=label,
         json_info=lib.to_dict("{" + (json_info or "") + "}"),
     )
+
+
+def decode_tracking(idships: typing.List[str], response: str) -> typing.List[dict]:
+    """Decode a tracking chunk response, standing in an error for a failed chunk."""
+    try:
+        data = None if response is None else lib.to_dict(response)
+    except ValueError:
+        data = None
+
+    if data is None:
+        return [
+            dict(
+                code="tracking_request_failed",
+                message=f"Tracking request failed for {', '.join(idships)}",
+            )
+        ]
+
+    return data if isinstance(data, list) else [data]
@@ -1,2 +1,4 @@
 from tests.colissimo.test_tracking import *
-from tests.colissimo.test_shipment import *
\ No newline at end of file
+from tests.colissimo.test_shipment import *
+from tests.colissimo.test_rate import *
+from tests.colissimo.test_fanout import *
@@ -3,11 +3,11 @@ from karrio.core.utils import (
     Serializable,
     Deserializable,
     request as http,
-    exec_async,
     DP,
 )
 from karrio.api.proxy import Proxy as BaseProxy
 from karrio.mappers.dicom.settings import Settings
+import karrio.providers.dicom.fanout as provider_fanout
 
 
 class Proxy(BaseProxy):
@@ -15,7 +15,9 @@ class Proxy(BaseProxy):
 
     def get_tracking(self, request: Serializable) -> Deserializable:
         def _get_tracking(tracking_number: str):
-            return http(
+            return provider_fanout.request(
+                self.settings,
+                send=http,
                 url=f"{self.settings.server_url}/v1/tracking/{tracking_number}",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -25,7 +27,9 @@ class Proxy(BaseProxy):
                 },
             )
 
-        responses: List[dict] = exec_async(_get_tracking, request.serialize())
+        responses: List[dict] = provider_fanout.run(
+            self.settings, _get_tracking, request.serialize()
+        )
         return Deserializable(
             responses, lambda res: [DP.to_dict(r) for r in res if any(r.strip())]
         )
@@ -1,5 +1,5 @@
 from typing import List
-from karrio.providers.sendle import Settings
+from karrio.providers.dicom.utils import Settings
 from karrio.core.models import Message
 
 
@@ -37,14 +37,7 @@ def _extract_detail(detail: Tracking, settings: Settings) -> TrackingDetails:
                 code=event.status,
                 time=DF.ftime(event.activityDate, "%Y-%m-%dT%H:%M:%SZ"),
                 timestamp=lib.fiso_timestamp(event.activityDate, current_format="%Y-%m-%dT%H:%M:%SZ"),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.status in r.value
-                    ),
-                    None,
-                ),
+                reason=provider_units.find_incident_reason(event.status),
             )
             for event in detail.activities
         ],
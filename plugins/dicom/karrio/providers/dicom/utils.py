@@ -1,5 +1,6 @@
 """Karrio Dicom client settings."""
 
+import karrio.lib as lib
 from base64 import b64encode
 from karrio.core.settings import Settings as BaseSettings
 
@@ -32,3 +33,19 @@ class Settings(BaseSettings):
     def authorization(self):
         pair = "%s:%s" % (self.username, self.password)
         return b64encode(pair.encode("utf-8")).decode("ascii")
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """Dicom connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
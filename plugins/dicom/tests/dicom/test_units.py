@@ -0,0 +1,29 @@
+import unittest
+import karrio.providers.dicom.units as units
+
+
+class TestDicomTrackingCodes(unittest.TestCase):
+    def test_find_incident_reason_matches_a_member_scan(self):
+        codes = [
+            *(code for member in units.TrackingIncidentReason for code in member.value),
+            None,
+            "UNKNOWN",
+        ]
+
+        for code in codes:
+            with self.subTest(code=code):
+                self.assertEqual(
+                    units.find_incident_reason(code, "unknown"),
+                    next(
+                        (
+                            member.name
+                            for member in units.TrackingIncidentReason
+                            if code in member.value
+                        ),
+                        "unknown",
+                    ),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
 import typing
+import functools
 import karrio.lib as lib
 import karrio.api.proxy as base
+import karrio.providers.easypost.pool as provider_pool
+import karrio.providers.easypost.utils as provider_utils
+import karrio.providers.easypost.fanout as provider_fanout
 import karrio.mappers.easypost.settings as provider_settings
 
 
@@ -53,7 +57,9 @@ class Proxy(base.Proxy):
             )
 
         response = create(payload["data"])
-        return lib.Deserializable(response, lib.to_dict)
+        [ctx] = self._retrieve_labels(lib.to_dict(response))
+
+        return lib.Deserializable(response, lib.to_dict, ctx)
 
     def cancel_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request(path=f"/shipments/{request.serialize()}/refund")
@@ -70,23 +76,61 @@ class Proxy(base.Proxy):
                     )
                     if request.get("tracker_id") is None
                     else dict(path=f"/trackers/{request['tracker_id']}", method="GET")
-                )
+                ),
+                retry=True,
             ),
         )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_asynchronously(
-            track, requests.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, track, requests.serialize()
         )
         return lib.Deserializable(
             responses,
             lambda res: [(key, lib.to_dict(response)) for key, response in res],
         )
 
+    def _retrieve_labels(self, *shipments: dict) -> typing.List[dict]:
+        """Download the labels of bought shipments concurrently.
+
+        Returns a `dict(label=...)` parsing context per shipment. The label is
+        left to None when the shipment has none or `skip_label_download` is set,
+        in which case only its `label_url` is returned. A failed download also
+        sets `label_url` in the context so that the parser can report it.
+
+        Downloads are not traced: the trace would hold the whole label.
+        """
+        label_urls = [
+            (shipment.get("postage_label") or {}).get("label_url")
+            for shipment in shipments
+        ]
+
+        if self.settings.connection_config.skip_label_download.state:
+            return [dict(label=None) for _ in label_urls]
+
+        downloads = iter(
+            provider_utils.download_labels(
+                self.settings, [url for url in label_urls if url]
+            )
+        )
+        labels = [next(downloads) if url else None for url in label_urls]
+
+        return [
+            dict(label=label)
+            if label is not None or not url
+            else dict(label=None, label_url=url)
+            for url, label in zip(label_urls, labels)
+        ]
+
     def _send_request(
-        self, path: str, request: lib.Serializable = None, method: str = "POST"
+        self,
+        path: str,
+        request: lib.Serializable = None,
+        method: str = "POST",
+        retry: bool = False,
     ) -> str:
         data: dict = dict(data=request.serialize()) if request is not None else dict()
-        return lib.request(
+        return self._request(
+            retry=retry,
             **{
                 "url": f"{self.settings.server_url}{path}",
                 "trace": self.trace_as("json"),
@@ -98,3 +142,23 @@ class Proxy(base.Proxy):
                 **data,
             }
         )
+
+    def _request(self, retry: bool = False, **kwargs) -> str:
+        config = self.settings.connection_config
+        send = lib.request
+
+        if config.keep_alive.state:
+            send = functools.partial(
+                provider_pool.request,
+                max_connections=(
+                    config.max_connections.state or provider_pool.DEFAULT_MAX_CONNECTIONS
+                ),
+                idle_timeout=(
+                    config.keep_alive_timeout.state or provider_pool.DEFAULT_IDLE_TIMEOUT
+                ),
+            )
+
+        if retry:
+            return provider_fanout.request(self.settings, send=send, **kwargs)
+
+        return send(**kwargs)
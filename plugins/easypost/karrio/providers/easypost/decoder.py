@@ -0,0 +1,168 @@
+"""Compiled decoders for the generated EasyPost schema types.
+
+`lib.to_object` instantiates the jstruct/attrs schema types reflectively:
+every nested object is filtered against its class annotations, its unknown
+keys are formatted into a log record and its values run through the attrs
+converters. `to_object` below compiles a `from_dict` function per type on
+first use instead, with the field names and nested types baked in, and
+returns the very same attrs instances.
+"""
+
+import attr
+import typing
+import keyword
+import threading
+import jstruct.utils
+
+T = typing.TypeVar("T")
+DECODERS: typing.Dict[type, typing.Callable[[dict], typing.Any]] = {}
+DECODERS_LOCK = threading.Lock()
+
+
+def to_object(object_type: typing.Type[T], data: dict = None) -> typing.Optional[T]:
+    """Create an instance of `object_type` from `data` like `lib.to_object`."""
+    if data is None or object_type is None:
+        return None
+
+    decode = DECODERS.get(object_type)
+
+    if decode is None:
+        decode = compile_decoder(object_type)
+
+    return decode(data)
+
+
+def compile_decoder(object_type: type) -> typing.Callable[[dict], typing.Any]:
+    """Compile the decoders of `object_type` and of the types it nests."""
+    with DECODERS_LOCK:
+        compiled: typing.Dict[type, typing.Callable[[dict], typing.Any]] = {}
+        pending = [object_type]
+
+        while pending:
+            type_ = pending.pop()
+
+            if type_ in DECODERS or type_ in compiled:
+                continue
+
+            compiled[type_], nested = _compile(type_)
+            pending.extend(nested)
+
+        # published at once so that a decoder never looks up a missing one
+        DECODERS.update(compiled)
+
+    return DECODERS[object_type]
+
+
+def _compile(
+    object_type: type,
+) -> typing.Tuple[typing.Callable[[dict], typing.Any], typing.List[type]]:
+    if not _is_compilable(object_type):
+        return (lambda data: jstruct.utils.instantiate(object_type, data)), []
+
+    namespace: typing.Dict[str, typing.Any] = dict(
+        cls=object_type,
+        new=object.__new__,
+        decoders=DECODERS,
+        missing=_missing_argument,
+    )
+    nested: typing.List[type] = []
+    lines = ["def decode(data):", "    get = data.get", "    self = new(cls)"]
+
+    for index, field in enumerate(attr.fields(object_type)):
+        key = repr(field.name)
+        kind, types = _converter_kind(field.converter)
+        namespace.update(
+            {f"type_{index}_{position}": _ for position, _ in enumerate(types)}
+        )
+        nested.extend(types[-1:])
+
+        if field.default is attr.NOTHING:
+            lines.append(
+                f"    value = data[{key}] if {key} in data else missing(cls, {key})"
+            )
+        elif isinstance(field.default, attr.Factory):
+            namespace[f"factory_{index}"] = field.default.factory
+            lines.append(
+                f"    value = data[{key}] if {key} in data else factory_{index}()"
+            )
+        else:
+            namespace[f"default_{index}"] = field.default
+            lines.append(f"    value = get({key}, default_{index})")
+
+        if kind == "struct":
+            lines.append(
+                f"    self.{field.name} = decoders[type_{index}_0](value) "
+                "if isinstance(value, dict) else value"
+            )
+        elif kind == "list":
+            lines += [
+                f"    self.{field.name} = [",
+                f"        decoders[type_{index}_0](item)",
+                "        if isinstance(item, dict) else item",
+                "        for item in (value if isinstance(value, list) else [value])",
+                "    ]",
+            ]
+        elif kind == "dict":
+            lines += [
+                f"    self.{field.name} = {{",
+                f"        type_{index}_0(key): decoders[type_{index}_1](item)",
+                "        if isinstance(item, dict) else item",
+                "        for key, item in value.items()",
+                "    }",
+            ]
+        elif field.converter is not None:
+            namespace[f"converter_{index}"] = field.converter
+            lines.append(f"    self.{field.name} = converter_{index}(value)")
+        else:
+            lines.append(f"    self.{field.name} = value")
+
+    lines.append("    return self")
+    source = "\n".join(lines)
+    exec(compile(source, f"<decoder {object_type.__qualname__}>", "exec"), namespace)
+
+    return namespace["decode"], nested
+
+
+def _is_compilable(object_type: type) -> bool:
+    """Whether instances can be built without calling the attrs `__init__`."""
+    if not attr.has(object_type) or hasattr(object_type, "__attrs_post_init__"):
+        return False
+
+    return all(
+        field.init
+        and field.validator is None
+        and not getattr(field.default, "takes_self", False)
+        and getattr(field, "alias", field.name) == field.name
+        and field.name.isidentifier()
+        and not keyword.iskeyword(field.name)
+        for field in attr.fields(object_type)
+    ) and (object_type.__setattr__ is object.__setattr__)
+
+
+def _converter_kind(
+    converter: typing.Optional[typing.Callable],
+) -> typing.Tuple[typing.Optional[str], typing.List[type]]:
+    """Recognize the jstruct converters and the types they instantiate."""
+    qualname = getattr(converter, "__qualname__", "")
+    code = getattr(converter, "__code__", None)
+    closure = dict(
+        zip(
+            getattr(code, "co_freevars", ()),
+            (_.cell_contents for _ in getattr(converter, "__closure__", None) or ()),
+        )
+    )
+
+    if qualname.startswith("_JStruct.") and "class_" in closure:
+        return "struct", [closure["class_"]]
+    if qualname.startswith("_JList.") and "class_" in closure:
+        return "list", [closure["class_"]]
+    if qualname.startswith("_JDict.") and "value_type" in closure:
+        return "dict", [closure["key_type"], closure["value_type"]]
+
+    return None, []
+
+
+def _missing_argument(object_type: type, key: str):
+    raise TypeError(
+        f"{object_type.__qualname__}.__init__() missing 1 required argument: '{key}'"
+    )
@@ -0,0 +1,240 @@
+"""Keep-alive HTTP connection pooling for the EasyPost proxy.
+
+`lib.request` opens a new connection (and TLS handshake) for every call.
+When `keep_alive` is enabled in the connection config, the proxy sends its
+requests through `request` below instead, which reuses connections from a
+process wide pool keyed by the target host.
+"""
+
+import io
+import ssl
+import time
+import uuid
+import typing
+import threading
+import http.client
+import urllib.error
+import urllib.parse
+import karrio.lib as lib
+import karrio.core.utils.helpers as helpers
+
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_POOL_TIMEOUT = 60.0
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE")
+
+
+class ConnectionPool:
+    """A bounded set of keep-alive connections to a single host."""
+
+    def __init__(
+        self,
+        scheme: str,
+        netloc: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.idle_timeout = idle_timeout
+        self.created_connections = 0
+        self._idle: typing.List[typing.Tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def urlopen(
+        self,
+        method: str,
+        path: str,
+        body: typing.Optional[bytes] = None,
+        headers: typing.Optional[dict] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Tuple[http.client.HTTPResponse, bytes]:
+        """Send a request and return the response along with its body.
+
+        Waits up to `timeout` (or `DEFAULT_POOL_TIMEOUT` when unset) for a free
+        connection slot and raises `TimeoutError` when the pool stays exhausted.
+        """
+        wait = DEFAULT_POOL_TIMEOUT if timeout is None else timeout
+
+        if not self._slots.acquire(timeout=wait):
+            raise TimeoutError(
+                f"no free connection to {self.netloc} after {wait} seconds"
+            )
+
+        try:
+            connection, reused = self._checkout(timeout)
+
+            while True:
+                sent = False
+
+                try:
+                    connection.request(method, path, body=body, headers=headers or {})
+                    sent = True
+                    response = connection.getresponse()
+                    content = response.read()
+                    break
+                except STALE_CONNECTION_ERRORS:
+                    connection.close()
+
+                    # Once the request is written the server may have acted on
+                    # it, so only idempotent requests are sent a second time.
+                    idempotent = method.upper() in IDEMPOTENT_METHODS
+
+                    if not reused or (sent and not idempotent):
+                        raise
+
+                    # The server dropped an idle keep-alive connection.
+                    connection, reused = self._connect(timeout), False
+                except (http.client.HTTPException, OSError):
+                    connection.close()
+                    raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(connection)
+        finally:
+            self._slots.release()
+
+        return response, content
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for connection, _ in idle:
+            connection.close()
+
+    def _checkout(self, timeout: typing.Optional[float]):
+        now = time.monotonic()
+
+        with self._lock:
+            while self._idle:
+                connection, released_at = self._idle.pop()
+
+                if now - released_at < self.idle_timeout:
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, True
+
+                connection.close()
+
+        return self._connect(timeout), False
+
+    def _checkin(self, connection: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.append((connection, time.monotonic()))
+
+    def _connect(self, timeout: typing.Optional[float]) -> http.client.HTTPConnection:
+        with self._lock:
+            self.created_connections += 1
+
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.netloc, timeout=timeout, context=ssl.create_default_context()
+            )
+
+        return http.client.HTTPConnection(self.netloc, timeout=timeout)
+
+
+POOLS: typing.Dict[tuple, ConnectionPool] = {}
+POOLS_LOCK = threading.Lock()
+
+
+def get_pool(
+    url: str,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+) -> ConnectionPool:
+    """Return the shared pool for the url host (created on first use)."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc, max_connections, idle_timeout)
+
+    with POOLS_LOCK:
+        if key not in POOLS:
+            POOLS[key] = ConnectionPool(
+                parts.scheme,
+                parts.netloc,
+                max_connections=max_connections,
+                idle_timeout=idle_timeout,
+            )
+
+        return POOLS[key]
+
+
+def request(
+    url: str,
+    decoder: typing.Callable = helpers.decode_bytes,
+    on_error: typing.Callable[[urllib.error.HTTPError], str] = None,
+    trace: typing.Callable[[typing.Any, str], typing.Any] = None,
+    timeout: typing.Optional[float] = None,
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
+    retry_on_status: typing.List[int] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    **kwargs,
+) -> str:
+    """A `lib.request` counterpart sending requests over pooled connections.
+
+    Requests are traced, retried and errors decoded like `lib.request`.
+    Redirects and `proxy` settings are not supported on this path.
+    """
+    request_id = _request_id(trace)
+    _request = helpers.process_request(request_id, trace, url=url, **kwargs)
+    parts = urllib.parse.urlsplit(_request.full_url)
+    path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+    pool = get_pool(url, max_connections=max_connections, idle_timeout=idle_timeout)
+    retry_statuses = set(retry_on_status or helpers.RETRYABLE_STATUS_CODES)
+
+    for attempt in range(max_retries + 1):
+        if attempt > 0:
+            time.sleep(retry_delay * (2 ** (attempt - 1)))
+
+        response, content = pool.urlopen(
+            _request.get_method(),
+            path,
+            body=_request.data,
+            headers=dict(_request.header_items()),
+            timeout=timeout,
+        )
+
+        if response.status not in retry_statuses:
+            break
+
+    if response.status >= 400:
+        error = urllib.error.HTTPError(
+            _request.full_url,
+            response.status,
+            response.reason,
+            response.headers,
+            io.BytesIO(content),
+        )
+        return helpers.process_error(request_id, error, on_error=on_error, trace=trace)
+
+    return helpers.process_response(
+        request_id, _Response(response, content), decoder, trace=trace
+    )
+
+
+class _Response:
+    def __init__(self, response: http.client.HTTPResponse, content: bytes):
+        self.status = response.status
+        self.headers = response.headers
+        self._content = content
+
+    def read(self) -> bytes:
+        return self._content
+
+
+def _request_id(trace) -> str:
+    context = getattr(getattr(trace, "_tracer", None), "context", None) or {}
+
+    return lib.failsafe(lambda: context.get("request_id")) or str(uuid.uuid4())
@@ -5,6 +5,7 @@ import typing
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
+import karrio.providers.easypost.decoder as provider_decoder
 import karrio.providers.easypost.error as provider_error
 import karrio.providers.easypost.units as provider_units
 import karrio.providers.easypost.utils as provider_utils
@@ -25,7 +26,7 @@ def _extract_details(
     response: dict,
     settings: provider_utils.Settings,
 ) -> typing.List[models.RateDetails]:
-    rates = lib.to_object(Shipment, response).rates
+    rates = provider_decoder.to_object(Shipment, response).rates
 
     return [
         (
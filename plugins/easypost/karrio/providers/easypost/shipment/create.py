@@ -5,6 +5,7 @@ import typing
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
+import karrio.providers.easypost.decoder as provider_decoder
 import karrio.providers.easypost.error as provider_error
 import karrio.providers.easypost.units as provider_units
 import karrio.providers.easypost.utils as provider_utils
@@ -15,18 +16,38 @@ def parse_shipment_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[models.ShipmentDetails, typing.List[models.Message]]:
     response = _response.deserialize()
+    ctx = _response.ctx or {}
     errors = provider_error.parse_error_response(response, settings)
-    shipment = _extract_details(response, settings) if "error" not in response else None
+    shipment = lib.identity(
+        _extract_details(response, settings, ctx=ctx)
+        if "error" not in response
+        else None
+    )
+    messages = lib.identity(
+        [
+            models.Message(
+                carrier_id=settings.carrier_id,
+                carrier_name=settings.carrier_name,
+                code="label_download_failed",
+                message="The label could not be downloaded",
+                details=dict(label_url=ctx["label_url"]),
+            )
+        ]
+        if shipment is not None and ctx.get("label_url")
+        else []
+    )
 
-    return shipment, errors
+    return shipment, [*errors, *messages]
 
 
 def _extract_details(
-    response: dict, settings: provider_utils.Settings
+    response: dict,
+    settings: provider_utils.Settings,
+    ctx: dict = None,
 ) -> models.ShipmentDetails:
-    shipment = lib.to_object(shipping.Shipment, response)
+    shipment = provider_decoder.to_object(shipping.Shipment, response)
     label_type = shipment.postage_label.label_file_type.split("/")[-1]
-    label = provider_utils.download_label(shipment.postage_label.label_url)
+    label = (ctx or {}).get("label")
 
     return models.ShipmentDetails(
         carrier_id=settings.carrier_id,
@@ -2,6 +2,7 @@ import karrio.schemas.easypost.trackers_response as easypost
 import typing
 import karrio.lib as lib
 import karrio.core.models as models
+import karrio.providers.easypost.decoder as provider_decoder
 import karrio.providers.easypost.error as error
 import karrio.providers.easypost.utils as provider_utils
 import karrio.providers.easypost.units as provider_units
@@ -12,14 +13,14 @@ def parse_tracking_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _responses.deserialize()
-    errors: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=code)
-            for code, response in responses
-            if "error" in response
-        ],
-        start=[],
-    )
+    errors: typing.List[models.Message] = [
+        message
+        for code, response in responses
+        if "error" in response
+        for message in error.parse_error_response(
+            response, settings, tracking_number=code
+        )
+    ]
     trackers = [
         _extract_details(response, settings)
         for _, response in responses
@@ -33,7 +34,7 @@ def _extract_details(
     data: dict,
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
-    tracker = lib.to_object(easypost.Tracker, data)
+    tracker = provider_decoder.to_object(easypost.Tracker, data)
     expected_delivery = lib.fdate(tracker.est_delivery_date, "%Y-%m-%dT%H:%M:%SZ")
     events: typing.List[dict] = data.get("tracking_details", [])
 
@@ -56,22 +57,8 @@ def _extract_details(
                     separator=", ",
                 ),
                 timestamp=lib.fiso_timestamp(event.get("datetime"), current_format="%Y-%m-%dT%H:%M:%SZ"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.get("status") in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.get("status") in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.get("status")),
+                reason=provider_units.find_incident_reason(event.get("status")),
             )
             for event in events
             if event.get("datetime") is not None
@@ -1,5 +1,6 @@
 import re
 import typing
+import functools
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
@@ -1089,3 +1090,20 @@ def shipping_options_initializer(
         return key in ShippingOption  # type:ignore
 
     return units.ShippingOptions(options, ShippingOption, items_filter=items_filter)
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -1,7 +1,12 @@
 from base64 import b64encode
 import base64
+import typing
+import karrio.lib as lib
 from karrio.core import Settings as BaseSettings
-from karrio.core.utils.helpers import request
+import karrio.providers.easypost.fanout as provider_fanout
+
+# A multiple of 3 bytes so that chunks encode to unpadded base64.
+LABEL_CHUNK_SIZE = 3 * 64 * 1024
 
 
 class Settings(BaseSettings):
@@ -25,9 +30,74 @@ class Settings(BaseSettings):
         pair = "%s:%s" % (self.api_key, "")
         return b64encode(pair.encode("utf-8")).decode("ascii")
 
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """EasyPost connection configuration options."""
+
+    keep_alive = lib.OptionEnum("keep_alive", bool)
+    max_connections = lib.OptionEnum("max_connections", int)
+    keep_alive_timeout = lib.OptionEnum("keep_alive_timeout", float)
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+
+    # Label retrieval
+    skip_label_download = lib.OptionEnum("skip_label_download", bool)
+
+
+def download_label(
+    file_url: str, send: typing.Callable[..., str] = None, **kwargs
+) -> str:
+    """Download a label and return it base64 encoded without line breaks.
 
-def download_label(file_url: str) -> str:
-    return request(
-        decoder=lambda b: base64.encodebytes(b).decode("utf-8"),
-        url=file_url,
+    The body is read and encoded in chunks rather than buffered whole.
+    """
+    return (send or lib.request)(url=file_url, on_ok=_encode_stream, **kwargs)
+
+
+def download_labels(
+    settings: Settings, file_urls: typing.List[str], **kwargs
+) -> typing.List[str]:
+    """Download labels concurrently (bounded by `max_in_flight`), in order.
+
+    Throttled and 5xx responses are retried. A failed download returns None
+    and is reported as a message by the shipment parser.
+    """
+    return provider_fanout.run(
+        settings,
+        lambda file_url: download_label(
+            file_url,
+            send=lambda **_: provider_fanout.request(settings, **_),
+            on_error=lambda _: None,
+            **kwargs,
+        ),
+        file_urls,
     )
+
+
+def encode_label(content: bytes) -> str:
+    return base64.b64encode(content).decode("ascii")
+
+
+def _encode_stream(response) -> str:
+    chunks: typing.List[str] = []
+    remainder = b""
+
+    for chunk in iter(lambda: response.read(LABEL_CHUNK_SIZE), b""):
+        # only whole 3 byte groups are encoded so that no padding is emitted
+        # before the end of the label, whatever the size of the reads.
+        data = remainder + chunk
+        size = len(data) - len(data) % 3
+        chunks.append(encode_label(data[:size]))
+        remainder = data[size:]
+
+    return "".join(chunks) + encode_label(remainder)
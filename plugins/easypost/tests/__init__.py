@@ -1,3 +1,6 @@
 from tests.easypost.test_shipment import *
 from tests.easypost.test_rate import *
 from tests.easypost.test_tracking import *
+from tests.easypost.test_pool import *
+from tests.easypost.test_fanout import *
+from tests.easypost.test_decoder import *
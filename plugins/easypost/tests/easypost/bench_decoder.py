@@ -0,0 +1,48 @@
+"""Benchmark the compiled EasyPost decoders against `lib.to_object`.
+
+Run from the plugin directory with `python -m tests.easypost.bench_decoder`.
+"""
+
+import timeit
+import karrio.lib as lib
+import karrio.providers.easypost.decoder as provider_decoder
+import karrio.schemas.easypost.shipments_response as shipping
+import karrio.schemas.easypost.trackers_response as tracking
+from tests.easypost.test_rate import RateResponseJSON
+from tests.easypost.test_shipment import BuyShipmentResponseJSON
+from tests.easypost.test_tracking import TrackingResponseJSON
+
+NUMBER = 200
+
+
+def main():
+    shipment = lib.to_dict(RateResponseJSON)
+    rates = shipment["rates"]
+    rated_shipment = {
+        **shipment,
+        "rates": [
+            {**rates[index % len(rates)], "id": f"rate_{index}"} for index in range(100)
+        ],
+    }
+
+    for name, object_type, data in [
+        ("rate response", shipping.Shipment, shipment),
+        ("bought shipment", shipping.Shipment, lib.to_dict(BuyShipmentResponseJSON)),
+        ("shipment, 100 rates", shipping.Shipment, rated_shipment),
+        ("tracker", tracking.Tracker, lib.to_dict(TrackingResponseJSON)),
+    ]:
+        assert provider_decoder.to_object(object_type, data) == lib.to_object(
+            object_type, data
+        )
+        before = _best(lambda: lib.to_object(object_type, data))
+        after = _best(lambda: provider_decoder.to_object(object_type, data))
+
+        print(f"{name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+
+
+def _best(func, number: int = NUMBER) -> float:
+    return min(timeit.repeat(func, number=number, repeat=7)) / number
+
+
+if __name__ == "__main__":
+    main()
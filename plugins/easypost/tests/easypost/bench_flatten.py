@@ -0,0 +1,63 @@
+"""Benchmark the EasyPost tracking error collection as trackers grow.
+
+Run from the plugin directory with `python -m tests.easypost.bench_flatten`.
+"""
+
+import timeit
+import karrio.lib as lib
+import karrio.providers.easypost.error as provider_error
+import karrio.providers.easypost.tracking as provider_tracking
+from tests.easypost.fixture import gateway
+
+COUNTS = [10, 100, 1_000, 10_000, 100_000]
+SUM_LIMIT = 10_000  # the quadratic sum takes tens of seconds at 100k
+
+
+def main():
+    settings = gateway.settings
+
+    for count in COUNTS:
+        responses = [
+            (
+                f"EZ{_:010d}",
+                {"error": {"code": "TRACKER.CREATE.ERROR", "message": "invalid"}},
+            )
+            for _ in range(count)
+        ]
+
+        def parse():
+            return provider_tracking.parse_tracking_response(
+                lib.Deserializable(responses), settings
+            )
+
+        def concatenate():
+            return sum(
+                [
+                    provider_error.parse_error_response(
+                        response, settings, tracking_number=code
+                    )
+                    for code, response in responses
+                    if "error" in response
+                ],
+                start=[],
+            )
+
+        number = max(1, 1_000 // count)
+        elapsed = _best(parse, number)
+        line = (
+            f"{count:>7,} trackers: parse_tracking_response {elapsed * 1000:9.2f} ms "
+            f"({elapsed / count * 1e6:.2f} µs per tracker)"
+        )
+
+        if count <= SUM_LIMIT:
+            line += f", sum(..., start=[]) {_best(concatenate, number) * 1000:9.2f} ms"
+
+        print(line)
+
+
+def _best(func, number: int = 1) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark EasyPost label downloads against a local file server.
+
+Run from the plugin directory with `python -m tests.easypost.bench_labels`.
+"""
+
+import time
+import base64
+import threading
+import tracemalloc
+import http.server
+import karrio.lib as lib
+import karrio.providers.easypost.utils as provider_utils
+from tests.easypost.fixture import gateway
+
+COUNT = 100
+LABEL_SIZE = 1024 * 1024
+LATENCY = 0.05
+
+
+def main():
+    server = LabelServer()
+    urls = [
+        f"http://127.0.0.1:{server.server_port}/labels/{_}.pdf" for _ in range(COUNT)
+    ]
+
+    try:
+        for name, download in [
+            (
+                "sequential, encodebytes",
+                lambda urls: [
+                    lib.request(
+                        url=url,
+                        decoder=lambda b: base64.encodebytes(b).decode("utf-8"),
+                    )
+                    for url in urls
+                ],
+            ),
+            (
+                "download_labels",
+                lambda urls: provider_utils.download_labels(gateway.settings, urls),
+            ),
+        ]:
+            start = time.perf_counter()
+            download(urls)
+            elapsed = time.perf_counter() - start
+            peak = _peak_allocation(lambda: download(urls[:1]))
+
+            print(
+                f"{COUNT} labels of {LABEL_SIZE // 2 ** 20} MiB ({name}): "
+                f"{elapsed:.2f} s, {peak / 2 ** 20:.2f} MiB peak allocation per label"
+            )
+    finally:
+        server.stop()
+
+
+class LabelServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LabelHandler)
+        self.label = bytes(range(256)) * (LABEL_SIZE // 256)
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs=dict(poll_interval=0.05), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class LabelHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(self.server.label)))
+        self.end_headers()
+        self.wfile.write(self.server.label)
+
+    def log_message(self, *args):
+        pass
+
+
+def _peak_allocation(func) -> int:
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import attr
+import typing
+import jstruct
+import unittest
+import concurrent.futures
+import karrio.lib as lib
+import karrio.providers.easypost.decoder as decoder
+import karrio.schemas.easypost.shipments_response as shipping
+import karrio.schemas.easypost.trackers_response as tracking
+from .test_rate import RateResponseJSON, ServiceCollisionResponseJSON
+from .test_shipment import BuyShipmentResponseJSON, ShipmentResponseWithFeeJSON
+from .test_tracking import TrackingResponseJSON
+
+
+class TestEasyPostDecoder(unittest.TestCase):
+    def test_decodes_like_to_object(self):
+        for object_type, response in [
+            (shipping.Shipment, RateResponseJSON),
+            (shipping.Shipment, ServiceCollisionResponseJSON),
+            (shipping.Shipment, BuyShipmentResponseJSON),
+            (shipping.Shipment, ShipmentResponseWithFeeJSON),
+            (tracking.Tracker, TrackingResponseJSON),
+        ]:
+            data = lib.to_dict(response)
+            expected = lib.to_object(object_type, data)
+            decoded = decoder.to_object(object_type, data)
+
+            self.assertEqual(decoded, expected)
+            self.assertListEqual(list(vars(decoded)), list(vars(expected)))
+            self.assertDictEqual(lib.to_dict(decoded), lib.to_dict(expected))
+
+    def test_keeps_jstruct_conversions(self):
+        for data in [
+            {},
+            dict(name="a", child=None, children=None, mapping={}),
+            dict(child=dict(value=1, extra=2), children=dict(value=2)),
+            dict(children=[dict(value=1), "raw"], mapping={"1": dict(value=3)}),
+        ]:
+            self.assertEqual(
+                decoder.to_object(Parent, data), lib.to_object(Parent, data)
+            )
+
+        self.assertRaises(TypeError, decoder.to_object, Required, {})
+        self.assertIsNone(decoder.to_object(Parent, None))
+
+    def test_recognizes_the_jstruct_converters(self):
+        # the decoders rely on the private `__qualname__` and closure names of
+        # the jstruct converters: a jstruct release renaming them fails here
+        # rather than silently decoding every nested type through jstruct.
+        fields = attr.fields_dict(Parent)
+
+        self.assertEqual(
+            decoder._converter_kind(fields["child"].converter), ("struct", [Child])
+        )
+        self.assertEqual(
+            decoder._converter_kind(fields["children"].converter), ("list", [Child])
+        )
+        self.assertEqual(
+            decoder._converter_kind(fields["mapping"].converter),
+            ("dict", [int, Child]),
+        )
+        self.assertEqual(decoder._converter_kind(fields["name"].converter), (None, []))
+
+    def test_compiles_each_type_once_across_threads(self):
+        decoder.DECODERS.clear()
+        data = lib.to_dict(TrackingResponseJSON)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            trackers = list(
+                executor.map(
+                    lambda _: decoder.to_object(tracking.Tracker, data), range(64)
+                )
+            )
+
+        self.assertTrue(all(_ == trackers[0] for _ in trackers))
+        self.assertIn(tracking.CarrierDetail, decoder.DECODERS)
+
+
+@attr.s(auto_attribs=True)
+class Child:
+    value: typing.Optional[int] = None
+
+
+@attr.s(auto_attribs=True)
+class Parent:
+    name: typing.Optional[str] = None
+    child: typing.Optional[Child] = jstruct.JStruct[Child]
+    children: typing.Optional[typing.List[Child]] = jstruct.JList[Child]
+    mapping: typing.Optional[typing.Dict[int, Child]] = jstruct.JDict[int, Child, False]
+
+
+@attr.s(auto_attribs=True)
+class Required:
+    value: int
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import time
+import threading
+import unittest
+import contextvars
+from unittest.mock import ANY, Mock
+import karrio.sdk as karrio
+import karrio.providers.easypost.fanout as fanout
+
+
+class TestEasyPostTrackingFanout(unittest.TestCase):
+    def setUp(self):
+        fanout.BUCKETS.clear()
+
+    def test_run_preserves_input_order(self):
+        settings = create_settings(max_in_flight=4)
+
+        results = fanout.run(
+            settings,
+            lambda number: time.sleep(0.001 * (number % 3)) or number,
+            range(50),
+        )
+
+        self.assertListEqual(results, list(range(50)))
+
+    def test_run_bounds_requests_in_flight(self):
+        settings = create_settings(max_in_flight=3)
+        counter = InFlightCounter()
+
+        fanout.run(settings, counter, range(30))
+
+        self.assertEqual(counter.peak, 3)
+
+    def test_run_rate_limits_requests(self):
+        settings = create_settings(max_in_flight=8, rate_limit=50)
+        start = time.monotonic()
+
+        fanout.run(settings, lambda _: None, range(75))
+
+        # 50 tokens are available upfront, the remaining 25 refill in ~0.5s
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+
+    def test_run_propagates_the_caller_context(self):
+        settings = create_settings(max_in_flight=4)
+        token = REQUEST_ID.set("request-1")
+
+        try:
+            results = fanout.run(settings, lambda _: REQUEST_ID.get(), range(10))
+        finally:
+            REQUEST_ID.reset(token)
+
+        self.assertListEqual(results, ["request-1"] * 10)
+
+    def test_request_retries_throttled_responses(self):
+        settings = create_settings()
+        send = Mock(return_value='{"ok": true}')
+
+        response = fanout.request(settings, send=send, url="https://api/trackers")
+
+        self.assertEqual(response, '{"ok": true}')
+        send.assert_called_once_with(
+            url="https://api/trackers",
+            max_retries=fanout.DEFAULT_MAX_RETRIES,
+            retry_delay=ANY,
+            retry_on_status=fanout.RETRY_ON_STATUS,
+        )
+        self.assertIn(429, fanout.RETRY_ON_STATUS)
+
+    def test_request_jitters_the_retry_delay(self):
+        settings = create_settings()
+        send = Mock(return_value='{"ok": true}')
+
+        for _ in range(20):
+            fanout.request(settings, send=send, url="https://api/trackers")
+
+        delays = [call.kwargs["retry_delay"] for call in send.call_args_list]
+        low = fanout.DEFAULT_RETRY_DELAY * (1 - fanout.RETRY_JITTER)
+        high = fanout.DEFAULT_RETRY_DELAY * (1 + fanout.RETRY_JITTER)
+
+        self.assertTrue(all(low <= delay <= high for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_request_uses_configured_max_retries(self):
+        settings = create_settings(max_retries=0)
+        send = Mock(return_value='{"ok": true}')
+
+        fanout.request(settings, send=send, url="https://api/trackers")
+
+        self.assertEqual(send.call_args.kwargs["max_retries"], 0)
+
+
+REQUEST_ID = contextvars.ContextVar("REQUEST_ID", default=None)
+
+
+def create_settings(**config):
+    return karrio.gateway["easypost"].create(dict(api_key="XXXXXX", config=config)).settings
+
+
+class InFlightCounter:
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+        time.sleep(0.01)
+
+        with self._lock:
+            self.current -= 1
+
+
+if __name__ == "__main__":
+    unittest.main()
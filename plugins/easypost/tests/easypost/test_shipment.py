@@ -1,9 +1,13 @@
+import io
+import base64
 import unittest
 from unittest.mock import patch
 from karrio.core.utils import DP
 from karrio.core.models import ShipmentRequest, ShipmentCancelRequest
 from karrio.sdk import Shipment
+import karrio.sdk as karrio
 from .fixture import gateway
+import karrio.providers.easypost.utils as provider_utils
 
 
 class TestEasyPostShipment(unittest.TestCase):
@@ -25,10 +29,10 @@ class TestEasyPostShipment(unittest.TestCase):
 
     def test_create_shipment(self):
         with patch("karrio.mappers.easypost.proxy.lib.request") as mocks:
-            mocks.side_effect = [ShipmentResponseJSON, BuyShipmentResponseJSON]
+            mocks.side_effect = [ShipmentResponseJSON, BuyShipmentResponseJSON, ""]
             Shipment.create(self.ShipmentRequest).from_(gateway)
 
-            create_call, buy_call = mocks.call_args_list
+            create_call, buy_call, label_call = mocks.call_args_list
 
             self.assertEqual(
                 create_call[1]["url"],
@@ -38,6 +42,58 @@ class TestEasyPostShipment(unittest.TestCase):
                 buy_call[1]["url"],
                 f"{gateway.settings.server_url}/shipments/shp_.../buy",
             )
+            self.assertEqual(
+                label_call[1]["url"], "https://amazonaws.com/.../a1b2c3.png"
+            )
+
+    def test_create_shipment_without_label_download(self):
+        no_label_gateway = karrio.gateway["easypost"].create(
+            dict(api_key="XXXXXX", config=dict(skip_label_download=True))
+        )
+
+        with patch("karrio.mappers.easypost.proxy.lib.request") as mocks:
+            mocks.side_effect = [ShipmentResponseJSON, BuyShipmentResponseJSON]
+            parsed_response = (
+                Shipment.create(self.ShipmentRequest).from_(no_label_gateway).parse()
+            )
+
+            self.assertEqual(len(mocks.call_args_list), 2)
+            self.assertListEqual(DP.to_dict(parsed_response), ParsedShipmentResponse)
+
+    def test_download_label_encodes_without_line_breaks(self):
+        content = bytes(range(256)) * 4096
+
+        with patch("karrio.providers.easypost.utils.lib.request") as mock:
+            mock.side_effect = lambda on_ok, **_: on_ok(io.BytesIO(content))
+            label = provider_utils.download_label("https://amazonaws.com/label.png")
+
+        self.assertNotIn("\n", label)
+        self.assertEqual(label, base64.b64encode(content).decode("utf-8"))
+
+    def test_download_label_encodes_short_reads(self):
+        content = bytes(range(256)) * 64
+        stream = io.BytesIO(content)
+
+        with patch("karrio.providers.easypost.utils.lib.request") as mock:
+            mock.side_effect = lambda on_ok, **_: on_ok(
+                type("Response", (), dict(read=lambda _, size: stream.read(1000)))()
+            )
+            label = provider_utils.download_label("https://amazonaws.com/label.png")
+
+        self.assertEqual(label, base64.b64encode(content).decode("utf-8"))
+
+    def test_parse_shipment_with_failed_label_download(self):
+        with patch("karrio.mappers.easypost.proxy.lib.request") as mocks:
+            responses = iter([ShipmentResponseJSON, BuyShipmentResponseJSON])
+            mocks.side_effect = lambda on_ok=None, on_error=None, **_: (
+                on_error(None) if on_ok is not None else next(responses)
+            )
+            shipment, messages = (
+                Shipment.create(self.ShipmentRequest).from_(gateway).parse()
+            )
+
+            self.assertIsNone(shipment.docs.label)
+            self.assertListEqual(DP.to_dict(messages), FailedLabelDownloadMessages)
 
     def test_create_cancel_shipment(self):
         with patch("karrio.mappers.easypost.proxy.lib.request") as mock:
@@ -51,16 +107,10 @@ class TestEasyPostShipment(unittest.TestCase):
 
     def test_parse_shipment_response(self):
         with patch("karrio.mappers.easypost.proxy.lib.request") as mocks:
-            mocks.side_effect = [ShipmentResponseJSON, BuyShipmentResponseJSON]
-            response = Shipment.create(self.ShipmentRequest).from_(gateway)
+            mocks.side_effect = [ShipmentResponseJSON, BuyShipmentResponseJSON, ""]
+            parsed_response = Shipment.create(self.ShipmentRequest).from_(gateway).parse()
 
-            with patch("karrio.providers.easypost.utils.request") as mock:
-                mock.return_value = ""
-                parsed_response = response.parse()
-
-                self.assertListEqual(
-                    DP.to_dict(parsed_response), ParsedShipmentResponse
-                )
+            self.assertListEqual(DP.to_dict(parsed_response), ParsedShipmentResponse)
 
     def test_parse_cancel_shipment_response(self):
         with patch("karrio.mappers.easypost.proxy.lib.request") as mock:
@@ -75,16 +125,16 @@ class TestEasyPostShipment(unittest.TestCase):
 
     def test_parse_shipment_with_fee_response(self):
         with patch("karrio.mappers.easypost.proxy.lib.request") as mocks:
-            mocks.side_effect = [ShipmentResponseJSON, ShipmentResponseWithFeeJSON]
-            response = Shipment.create(self.ShipmentRequest).from_(gateway)
-
-            with patch("karrio.providers.easypost.utils.request") as mock:
-                mock.return_value = ""
-                parsed_response = response.parse()
+            mocks.side_effect = [
+                ShipmentResponseJSON,
+                ShipmentResponseWithFeeJSON,
+                "",
+            ]
+            parsed_response = Shipment.create(self.ShipmentRequest).from_(gateway).parse()
 
-                self.assertListEqual(
-                    DP.to_dict(parsed_response), ParsedShipmentWithFeeResponse
-                )
+            self.assertListEqual(
+                DP.to_dict(parsed_response), ParsedShipmentWithFeeResponse
+            )
 
 
 if __name__ == "__main__":
@@ -138,6 +188,16 @@ ParsedShipmentResponse = [
     [],
 ]
 
+FailedLabelDownloadMessages = [
+    {
+        "carrier_id": "easypost",
+        "carrier_name": "easypost",
+        "code": "label_download_failed",
+        "details": {"label_url": "https://amazonaws.com/.../a1b2c3.png"},
+        "message": "The label could not be downloaded",
+    }
+]
+
 ParsedCancelShipmentResponse = [
     {
         "carrier_id": "easypost",
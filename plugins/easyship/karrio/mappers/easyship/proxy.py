@@ -2,6 +2,7 @@
 
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.easyship.fanout as provider_fanout
 import karrio.mappers.easyship.settings as provider_settings
 
 
@@ -68,10 +69,12 @@ class Proxy(proxy.Proxy):
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
         access_token = self.authenticate().deserialize()
-        responses = lib.run_asynchronously(
+        responses = provider_fanout.run(
+            self.settings,
             lambda data: (
                 data["shipment_id"],
-                lib.request(
+                provider_fanout.request(
+                    self.settings,
                     url=f"{self.settings.server_url}/2023-01/shipments/{data['shipment_id']}",
                     trace=self.trace_as("json"),
                     method="GET",
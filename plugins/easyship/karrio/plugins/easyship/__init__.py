@@ -15,6 +15,6 @@ METADATA = metadata.PluginMetadata(
     # Data Units
     is_hub=True,
     options=units.ShippingOption,
-    services=units.ShippingService,
+    services=units.LazyCatalogEnum("ShippingService"),
     connection_configs=utils.ConnectionConfig,
 )
@@ -0,0 +1,90 @@
+"""Streaming bundler of Easyship multi-label documents.
+
+`bundle_base64` is a drop-in for `lib.bundle_base64` that decodes the labels
+one at a time: PDF pages are copied into a single writer, ZPL blocks and image
+strips are written to a spooled temporary buffer, and the merged document is
+base64 encoded in chunks.
+"""
+
+import io
+import base64
+import typing
+import tempfile
+import PyPDF2
+import PIL.Image
+
+# Spill the merged document to disk past this size.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+# A multiple of 3 bytes so that chunks encode to unpadded base64.
+ENCODE_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def bundle_base64(
+    base64_strings: typing.Iterable[str],
+    format: str = "PDF",
+) -> str:
+    """Return a single base64 document merging the given base64 labels."""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        if format == "PDF":
+            _write_pdfs(base64_strings, buffer)
+
+        elif "ZPL" in format:
+            _write_zpls(base64_strings, buffer)
+
+        else:
+            _write_imgs(list(base64_strings), buffer, format)
+
+        buffer.seek(0)
+        return encode_chunks(buffer)
+
+
+def encode_chunks(buffer: typing.IO[bytes]) -> str:
+    """Base64 encode a binary buffer in chunks."""
+    output = io.StringIO()
+
+    for chunk in iter(lambda: buffer.read(ENCODE_CHUNK_SIZE), b""):
+        output.write(base64.b64encode(chunk).decode("ascii"))
+
+    return output.getvalue()
+
+
+def _write_pdfs(base64_strings: typing.Iterable[str], buffer: typing.IO[bytes]):
+    writer = PyPDF2.PdfWriter()
+
+    # `add_page` copies the page objects into the writer (unlike `append`,
+    # which keeps the reader), so each decoded label is released before the
+    # next one is decoded.
+    for b64_str in base64_strings:
+        reader = PyPDF2.PdfReader(io.BytesIO(base64.b64decode(b64_str)))
+
+        for page in reader.pages:
+            writer.add_page(page)
+
+    writer.write(buffer)
+
+
+def _write_zpls(base64_strings: typing.Iterable[str], buffer: typing.IO[bytes]):
+    for b64_str in base64_strings:
+        buffer.write(base64.b64decode(b64_str))
+        buffer.write(b"\n")
+
+
+def _write_imgs(
+    base64_strings: typing.List[str], buffer: typing.IO[bytes], format: str
+):
+    # Image headers are enough to size the canvas; pixels are decoded later.
+    sizes = [_open_image(b64_str).size for b64_str in base64_strings]
+    image = PIL.Image.new("RGB", (max(w for w, _ in sizes), sum(h for _, h in sizes)))
+
+    offset = 0
+    for b64_str, (_, height) in zip(base64_strings, sizes):
+        with _open_image(b64_str) as strip:
+            image.paste(strip, (0, offset))
+
+        offset += height
+
+    image.save(buffer, format)
+
+
+def _open_image(b64_str: str) -> PIL.Image.Image:
+    return PIL.Image.open(io.BytesIO(base64.b64decode(b64_str)))
@@ -0,0 +1,378 @@
+"""Easyship service codes of the courier catalog, in metadata.json order.
+
+Generated by `units.dump_metadata_codes()` from the plugin generate script.
+"""
+
+SERVICE_CODES = [
+    "easyship_aramex_parcel",
+    "easyship_sfexpress_domestic",
+    "easyship_hkpost_speedpost",
+    "easyship_hkpost_air_mail_tracking",
+    "easyship_hkpost_eexpress",
+    "easyship_hkpost_air_parcel",
+    "easyship_sfexpress_mail",
+    "easyship_aramex_parcel",
+    "easyship_hkpost_local_parcel",
+    "easyship_ups_saver_net_battery",
+    "easyship_ups_worldwide_saver",
+    "easyship_hkpost_air_parcel_xp",
+    "easyship_singpost_airmail",
+    "easyship_simplypost_express",
+    "easyship_singpost_e_pack",
+    "easyship_usps_priority_mail_express",
+    "easyship_usps_first_class_international",
+    "easyship_usps_priority_mail_international_express",
+    "easyship_usps_priority_mail_international",
+    "easyship_fedex_international_priority",
+    "easyship_usps_ground_advantage",
+    "easyship_usps_priority_mail",
+    "easyship_fedex_international_priority",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_saver",
+    "easyship_easyship_domestic",
+    "easyship_ups_ground",
+    "easyship_ups_worldwide_expedited",
+    "easyship_fedex_international_economy",
+    "easyship_fedex_ground",
+    "easyship_fedex_priority_overnight",
+    "easyship_fedex_standard_overnight",
+    "easyship_fedex_2_day_a_m",
+    "easyship_fedex_2_day",
+    "easyship_fedex_express_saver",
+    "easyship_ups_next_day_air",
+    "easyship_ups_2nd_day_air",
+    "easyship_ups_3_day_select",
+    "easyship_ups_standard",
+    "easyship_usps_media",
+    "easyship_sfexpress_standard_express",
+    "easyship_sfexpress_economy_express",
+    "easyship_global_post_global_post_economy",
+    "easyship_global_post_global_post_priority",
+    "easyship_singpost_speed_post_priority",
+    "easyship_ups_worldwide_express",
+    "easyship_sfexpress_economy_express",
+    "easyship_ups_standard",
+    "easyship_skypostal_standard_private_delivery",
+    "easyship_postnl_domestic",
+    "easyship_aramex_parcel",
+    "easyship_tnt_1000_express",
+    "easyship_toll_express_parcel",
+    "easyship_sendle_premium_international",
+    "easyship_sendle_premium_domestic",
+    "easyship_sendle_pro_domestic",
+    "easyship_quantium_e_pac",
+    "easyship_sfexpress_standard_express",
+    "easyship_sfexpress_economy_express",
+    "easyship_ups_worldwide_saver",
+    "easyship_singpost_airmail",
+    "easyship_singpost_e_pack",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_quantium_mail",
+    "easyship_ups_worldwide_expedited",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_worldwide_saver",
+    "easyship_quantium_e_pac",
+    "easyship_quantium_international_mail",
+    "easyship_apc_parcel_connect_expedited",
+    "easyship_aramex_domestic",
+    "easyship_aramex_epx",
+    "easyship_tnt_road_express",
+    "easyship_tnt_overnight",
+    "easyship_usps_pme_flat_rate",
+    "easyship_usps_pme_flat_rate",
+    "easyship_usps_pme_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pm_flat_rate",
+    "easyship_usps_pmei_flat_rate",
+    "easyship_usps_pmei_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_easyship_cdek_russia",
+    "easyship_usps_pmei_flat_rate_padded_envelope",
+    "easyship_aramex_parcel",
+    "easyship_qxpress_domestic",
+    "easyship_easyship_mate_bike_shipping_services",
+    "easyship_dhl_express_express",
+    "easyship_dhl_express_documents",
+    "easyship_usps_pme_flat_rate",
+    "easyship_usps_pme_flat_rate",
+    "easyship_usps_pmei_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_usps_pmi_flat_rate",
+    "easyship_evri_uk_home_delivery",
+    "easyship_evri_home_delivery",
+    "easyship_dpd_express",
+    "easyship_dhl_express_express",
+    "easyship_dpd_next_day",
+    "easyship_dpd_classic_parcel",
+    "easyship_dpd_classic_expresspak",
+    "easyship_dpd_air_classic",
+    "easyship_singpost_speed_post_express",
+    "easyship_ups_expedited",
+    "easyship_ups_worldwide_saver",
+    "easyship_tnt_0900_express",
+    "easyship_tnt_1200_express",
+    "easyship_dhl_express_express",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_expedited",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_expedited",
+    "easyship_ups_worldwide_saver",
+    "easyship_dhl_express_express",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_expedited",
+    "easyship_canadapost_domestic_regular_parcel",
+    "easyship_canadapost_domestic_expedited_parcel",
+    "easyship_canadapost_domestic_xpresspost_domestic",
+    "easyship_canadapost_domestic_priority",
+    "easyship_canadapost_usa_small_packet_air",
+    "easyship_canadapost_usa_expedited_parcel",
+    "easyship_canadapost_usa_tracked_parcel",
+    "easyship_canadapost_usa_xpresspost",
+    "easyship_canadapost_international_xpresspost",
+    "easyship_canadapost_international_small_packet_air",
+    "easyship_canadapost_international_tracked_packet",
+    "easyship_canadapost_international_small_packet_surface",
+    "easyship_canadapost_international_parcel_surface",
+    "easyship_canadapost_international_parcel_air",
+    "easyship_fedex_international_priority",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_atl",
+    "easyship_couriersplease_signature",
+    "easyship_couriersplease_signature",
+    "easyship_couriersplease_signature",
+    "easyship_couriersplease_signature",
+    "easyship_couriersplease_signature",
+    "easyship_canpar_international",
+    "easyship_canpar_usa",
+    "easyship_canpar_select_usa",
+    "easyship_canpar_usa_pak",
+    "easyship_canpar_ground",
+    "easyship_canpar_overnight_pak",
+    "easyship_canpar_overnight",
+    "easyship_canpar_select_pak",
+    "easyship_canpar_select",
+    "easyship_dhl_express_express",
+    "easyship_ups_express_saver",
+    "easyship_ups_worldwide_expedited",
+    "easyship_ebay_send_sf_express_economy_express",
+    "easyship_sfexpress_domestic",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_worldwide_express",
+    "easyship_quantium_intl_priority",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_express",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express",
+    "easyship_dhl_express_express",
+    "easyship_ups_next_day_air_early",
+    "easyship_ups_next_day_air_saver",
+    "easyship_ups_worldwide_expedited",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_standard",
+    "easyship_ups_2nd_day_air_a_m",
+    "easyship_ups_standard",
+    "easyship_ups_worldwide_express",
+    "easyship_fedex_home_delivery",
+    "easyship_dhl_express_express",
+    "easyship_asendia_country_tracked",
+    "easyship_asendia_country_tracked",
+    "easyship_asendia_country_tracked",
+    "easyship_asendia_country_tracked",
+    "easyship_asendia_country_tracked",
+    "easyship_asendia_fully_tracked",
+    "easyship_asendia_fully_tracked",
+    "easyship_asendia_fully_tracked",
+    "easyship_asendia_fully_tracked",
+    "easyship_asendia_fully_tracked",
+    "easyship_ups_standard",
+    "easyship_ups_standard",
+    "easyship_dhl_express_express_dg",
+    "easyship_fedex_international_priority_dg",
+    "easyship_colissimo_expert",
+    "easyship_colissimo_international",
+    "easyship_colissimo_access",
+    "easyship_mondialrelay_international_home_delivery",
+    "easyship_ups_standard",
+    "easyship_ups_worldwide_saver",
+    "easyship_ups_worldwide_express",
+    "easyship_ups_worldwide_express_plus",
+    "easyship_ups_expedited",
+    "easyship_fedex_international_priority",
+    "easyship_fedex_economy",
+    "easyship_dhl_express_express1200",
+    "easyship_dhl_express_express0900",
+    "easyship_dhl_express_express1800",
+    "easyship_dhl_express_express_worldwide",
+    "easyship_dhl_express_economy_select",
+    "easyship_dhl_express_express1030_international",
+    "easyship_purolator_ground",
+    "easyship_purolator_express",
+    "easyship_dhl_express_domestic_express0900",
+    "easyship_dhl_express_domestic_express1200",
+    "easyship_dhl_express_express1200",
+    "easyship_evri_lightand_large",
+    "easyship_ninjavan_standard_deliveries",
+    "easyship_couriersplease_parcel_tier2",
+    "easyship_couriersplease_parcel",
+    "easyship_skypostal_postal_packet_standard",
+    "easyship_ebay_send_priority_mail_international",
+    "easyship_easyshipdemo_basic",
+    "easyship_easyshipdemo_tracked",
+    "easyship_easyshipdemo_battery",
+    "easyship_dhl_express_express_worldwide",
+    "easyship_dhl_express_domestic_express",
+    "easyship_dhl_express_domestic_express0900",
+    "easyship_dhl_express_domestic_express1200",
+    "easyship_fedex_smart_post",
+    "easyship_fedex_international_connect_plus",
+    "easyship_ups_expedited",
+    "easyship_ups_saver_net",
+    "easyship_janio_express",
+    "easyship_janio_express",
+    "easyship_chronopost_chrono_classic",
+    "easyship_chronopost_chrono_express",
+    "easyship_chronopost_chrono10",
+    "easyship_chronopost_chrono13",
+    "easyship_chronopost_chrono18",
+    "easyship_singpost_next_day",
+    "easyship_omniparcel_parcel_expedited",
+    "easyship_omniparcel_parcel_expedited_plus",
+    "easyship_evri_home_delivery_domestic",
+    "easyship_evri_home_domestic_postable",
+    "easyship_skypostal_packet_express",
+    "easyship_parcelforce_express48_large",
+    "easyship_parcelforce_express24",
+    "easyship_parcelforce_express0900",
+    "easyship_parcelforce_express1000",
+    "easyship_parcelforce_express_am",
+    "easyship_parcelforce_express48",
+    "easyship_parcelforce_express24",
+    "easyship_parcelforce_express0900",
+    "easyship_parcelforce_express1000",
+    "easyship_parcelforce_express_am",
+    "easyship_parcelforce_express48",
+    "easyship_parcelforce_euro_economy",
+    "easyship_parcelforce_global_priority",
+    "easyship_parcelforce_euro_economy",
+    "easyship_parcelforce_global_priority",
+    "easyship_evri_home_domestic_postable",
+    "easyship_dhl_express_express_worldwide",
+    "easyship_usps_ground_advantage",
+    "easyship_usps_priority_mail",
+    "easyship_qxpress_international",
+    "easyship_fedex_cross_border_trakpak_worldwide_hermes",
+    "easyship_parcelforce_express48",
+    "easyship_evri_home_domestic_postable",
+    "easyship_fedex_cross_border_trakpak_worldwide",
+    "easyship_evri_home_domestic_postable_next_day",
+    "easyship_ups_standard",
+    "easyship_dpd_classic_parcel",
+    "easyship_dpd_express_pak_next_day",
+    "easyship_dpd_next_day",
+    "easyship_dpd_classic_express_pak",
+    "easyship_ups_express_saver",
+    "easyship_parcelforce_express1000",
+    "easyship_evri_light_and_large",
+    "easyship_parcelforce_express24",
+    "easyship_parcelforce_express_am",
+    "easyship_evri_home_delivery_domestic_next_day",
+    "easyship_evri_home_delivery_domestic",
+    "easyship_parcelforce_express0900",
+    "easyship_evri_home_delivery_eu",
+    "easyship_asendia_epaq_plus",
+    "easyship_asendia_epaq_select",
+    "easyship_usps_lightweight_standard",
+    "easyship_usps_lightweight_standard",
+    "easyship_usps_lightweight_economy",
+    "easyship_usps_lightweight_economy",
+    "easyship_ups_domestic_express_saver",
+    "easyship_asendia_epaq_plus",
+    "easyship_asendia_epaq_select",
+    "easyship_asendia_epaq_select",
+    "easyship_asendia_epaq_plus",
+    "easyship_hubbed_standard",
+    "easyship_aramex_parcel",
+    "easyship_apg_e_packet",
+    "easyship_apg_e_packet",
+    "easyship_apg_e_packet_plus",
+    "easyship_apg_e_packet_plus",
+    "easyship_asendia_epaq_select",
+    "easyship_asendia_epaq_select",
+    "easyship_asendia_epaq_select",
+    "easyship_asendia_epaq_select",
+    "easyship_qxpress_international",
+    "easyship_aramex_parcel",
+    "easyship_couriersplease_ecom_base_kilo",
+    "easyship_couriersplease_stdatlbase_kilo",
+    "easyship_nz_post_international_courier",
+    "easyship_nz_post_air_small_parcel",
+    "easyship_nz_post_tracked_air_satchel",
+    "easyship_nz_post_economy_parcel",
+    "easyship_nz_post_parcel_local",
+    "easyship_dhl_express_domestic_express",
+    "easyship_dhl_express_express_domestic",
+    "easyship_fedex_cross_border_trakpak_worldwide",
+    "easyship_fedex_cross_border_trakpak_worldwide",
+    "easyship_dpd_classic_parcel",
+    "easyship_dpd_classic_parcel",
+    "easyship_alliedexpress_roadexpress",
+    "easyship_flatexportrate_asendiae_paqselect",
+    "easyship_flatexportrate_asendiae_paqselect",
+    "easyship_flatexportrate_asendia_country_tracked",
+    "easyship_flatexportrate_asendia_country_tracked",
+    "easyship_singpost_nsaver",
+    "easyship_colisprive_home",
+    "easyship_osm_domestic_parcel",
+    "easyship_usps_priority_mail",
+    "easyship_malca_amit_door_to_door",
+    "easyship_ninjavan_next_day_deliveries",
+    "easyship_evri_uk_home_delivery",
+    "easyship_dpd_next_day",
+    "easyship_sendle_premium_domestic",
+    "easyship_asendia_e_paqselect",
+    "easyship_dpd_classic",
+    "easyship_usps_ground_advantage",
+    "easyship_usps_priority_mail_signature",
+    "easyship_bringer_packet_standard",
+    "easyship_bringer_prime",
+    "easyship_orangeds_expedited_ddp",
+    "easyship_orangeds_expedited_ddp",
+    "easyship_orangeds_expedited_ddu",
+    "easyship_sendle_preferred",
+    "easyship_ups_ground_saver",
+    "easyship_ups_upsground_saver_us",
+    "easyship_passport_priority_delcon_dduewr",
+    "easyship_passport_priority_delcon_ddpewr",
+    "easyship_bringer_packet_standard",
+    "easyship_bringer_tracked_parcel",
+    "easyship_bringer_prime",
+    "easyship_usps_ground_advantage",
+    "easyship_usps_priority_mail",
+    "easyship_fedex_ground",
+    "easyship_ups_expedited",
+    "easyship_ups_express_early",
+    "easyship_ups_3_day_select",
+    "easyship_ups_wolrdwide_express",
+    "easyship_ups_ground_saver"
+]
@@ -9,6 +9,7 @@ import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
 import karrio.providers.easyship.error as error
+import karrio.providers.easyship.bundle as provider_bundle
 import karrio.providers.easyship.utils as provider_utils
 import karrio.providers.easyship.units as provider_units
 import karrio.providers.easyship.rate as rate
@@ -43,7 +44,9 @@ def _extract_details(
         (_ for _ in details.shipping_documents if _.category == "label"), None
     )
     label_type = (label_document.format or ctx.get("label_type") or "PDF").upper()
-    label = lib.bundle_base64(label_document.base64_encoded_strings, label_type)
+    label = provider_bundle.bundle_base64(
+        label_document.base64_encoded_strings, label_type
+    )
     tracking_numbers = [tracking.tracking_number for tracking in details.trackings]
     tracking_number, *__ = tracking_numbers
 
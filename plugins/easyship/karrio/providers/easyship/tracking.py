@@ -19,13 +19,11 @@ def parse_tracking_response(
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _response.deserialize()
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, shipment_id=_)
-            for _, response in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for _, response in responses
+        for message in error.parse_error_response(response, settings, shipment_id=_)
+    ]
     tracking_details = [
         _extract_details(details, settings)
         for _, details in responses
@@ -41,12 +39,8 @@ def _extract_details(
 ) -> models.TrackingDetails:
     details = lib.to_object(shipping.ShipmentType, data["shipment"])
     master = details.trackings[0]
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if getattr(master, "tracking_state", None) in status.value
-        ),
+    status = provider_units.find_tracking_status(
+        getattr(master, "tracking_state", None),
         provider_units.TrackingStatus.in_transit.name,
     )
 
@@ -63,22 +57,10 @@ def _extract_details(
                 time=lib.ftime(details.updated_at, "%Y-%m-%dT%H:%M:%SZ"),
                 description="",
                 timestamp=lib.fiso_timestamp(details.updated_at, current_format="%Y-%m-%dT%H:%M:%SZ"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if getattr(master, "tracking_state", None) in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if str(master.leg_number) in r.value
-                    ),
-                    None,
+                status=provider_units.find_tracking_status(
+                    getattr(master, "tracking_state", None)
                 ),
+                reason=provider_units.find_incident_reason(str(master.leg_number)),
             )
         ],
     )
@@ -1,10 +1,13 @@
+import json
 import typing
 import pathlib
+import functools
+import threading
 import karrio.lib as lib
 import karrio.core.units as units
 
-METADATA_JSON = lib.load_json(pathlib.Path(__file__).resolve().parent / "metadata.json")
-EASYSHIP_CARRIER_METADATA = [_ for sublist in METADATA_JSON for _ in sublist]
+METADATA_PATH = pathlib.Path(__file__).resolve().parent / "metadata.json"
+METADATA_CODES_PATH = METADATA_PATH.with_name("metadata_codes.py")
 KARRIO_CARRIER_MAPPING = {
     "canada_post": "canadapost",
     "dhl": "dhl_express",
@@ -115,56 +118,200 @@ class TrackingIncidentReason(lib.Enum):
 
 
 def to_service_code(service: typing.Dict[str, str]) -> str:
+    return _service_code(service["umbrella_name"], service["service_name"])
+
+
+def to_carrier_code(service: typing.Dict[str, str]) -> str:
+    return _carrier_code(service["umbrella_name"])
+
+
+@functools.lru_cache(maxsize=None)
+def _service_code(umbrella_name: str, service_name: str) -> str:
     return lib.to_slug(
-        f'easyship_{to_carrier_code(service)}_{lib.to_snake_case(service["service_name"])}'
+        f"easyship_{_carrier_code(umbrella_name)}_{lib.to_snake_case(service_name)}"
     )
 
 
-def to_carrier_code(service: typing.Dict[str, str]) -> str:
-    code = lib.to_slug(service["umbrella_name"])
+@functools.lru_cache(maxsize=None)
+def _carrier_code(umbrella_name: str) -> str:
+    code = lib.to_slug(umbrella_name)
     return KARRIO_CARRIER_MAPPING.get(code, code)
 
 
 def find_courier(search: str):
-    courier: dict = next(
-        (
-            item
-            for item in EASYSHIP_CARRIER_METADATA
-            if item["name"] == search
-            or item["id"] == search
-            or item["umbrella_name"] == search
-            or to_service_code(item) == search
-            or to_carrier_code(item) == search
-        ),
-        {},
+    catalog = load_catalog()
+    position = min(
+        (index[search] for index in catalog["indexes"].values() if search in index),
+        default=None,
     )
-    if courier:
-        return ShippingCourierID.map(to_carrier_code(courier))
 
-    return ShippingCourierID.map(search)
+    if position is not None:
+        courier = catalog["EASYSHIP_CARRIER_METADATA"][position]
+        return catalog["ShippingCourierID"].map(to_carrier_code(courier))
 
+    return catalog["ShippingCourierID"].map(search)
 
-ShippingService = lib.StrEnum(
-    "ShippingService",
-    {
-        to_service_code(service): service["service_name"]
-        for service in EASYSHIP_CARRIER_METADATA
-    },
-)
 
-ShippingServiceID = lib.StrEnum(
-    "ShippingServiceID",
-    {service["id"]: to_service_code(service) for service in EASYSHIP_CARRIER_METADATA},
-)
+def load_catalog() -> dict:
+    """Load the Easyship courier catalog and its lookup indexes.
+
+    The catalog is only materialized on first use (lookup or access to one
+    of the catalog enums), once, even when first used from several threads.
+    """
+    if not CATALOG:
+        with CATALOG_LOCK:
+            if not CATALOG:
+                CATALOG.update(_build_catalog())
+
+    return CATALOG
+
+
+def _build_catalog() -> dict:
+    metadata = _parse_metadata()
+    couriers = _flatten(metadata)
+    service_codes = load_metadata_codes()
+    indexes: typing.Dict[str, dict] = dict(
+        name={}, id={}, umbrella_name={}, service_code={}, carrier_code={}
+    )
+
+    for position, (courier, service_code) in enumerate(zip(couriers, service_codes)):
+        indexes["name"].setdefault(courier["name"], position)
+        indexes["id"].setdefault(courier["id"], position)
+        indexes["umbrella_name"].setdefault(courier["umbrella_name"], position)
+        indexes["service_code"].setdefault(service_code, position)
+        indexes["carrier_code"].setdefault(to_carrier_code(courier), position)
+
+    ShippingService = lib.StrEnum(
+        "ShippingService",
+        {
+            code: courier["service_name"]
+            for code, courier in zip(service_codes, couriers)
+        },
+    )
+    ShippingServiceID = lib.StrEnum(
+        "ShippingServiceID",
+        {courier["id"]: code for code, courier in zip(service_codes, couriers)},
+    )
+    ShippingCourierID = lib.StrEnum(
+        "ShippingCourierID",
+        {
+            to_carrier_code(courier): courier["name"]
+            for courier in {_["umbrella_name"]: _ for _ in couriers}.values()
+        },
+    )
+    setattr(ShippingCourierID, "find", find_courier)
+
+    return dict(
+        METADATA_JSON=metadata,
+        EASYSHIP_CARRIER_METADATA=couriers,
+        ShippingService=ShippingService,
+        ShippingServiceID=ShippingServiceID,
+        ShippingCourierID=ShippingCourierID,
+        indexes=indexes,
+    )
+
+
+def load_metadata_codes() -> typing.List[str]:
+    """Return the service codes of the flattened courier catalog.
+
+    They come from the `metadata_codes` module emitted by `dump_metadata_codes`,
+    or are derived from the couriers when that module is missing.
+    """
+    try:
+        import karrio.providers.easyship.metadata_codes as metadata_codes
+    except ImportError:
+        return [to_service_code(_) for _ in _flatten(_parse_metadata())]
+
+    return metadata_codes.SERVICE_CODES
+
+
+def dump_metadata_codes() -> pathlib.Path:
+    """Write the `metadata_codes` module next to metadata.json."""
+    codes = [to_service_code(_) for _ in _flatten(_parse_metadata())]
+    METADATA_CODES_PATH.write_text(
+        '"""Easyship service codes of the courier catalog, in metadata.json order.\n'
+        "\n"
+        "Generated by `units.dump_metadata_codes()` from the plugin generate script.\n"
+        '"""\n'
+        "\n"
+        f"SERVICE_CODES = {json.dumps(codes, indent=4)}\n"
+    )
+
+    return METADATA_CODES_PATH
+
+
+def _parse_metadata() -> list:
+    return lib.load_json(METADATA_PATH)
+
 
-ShippingCourierID = lib.StrEnum(
+def _flatten(metadata: list) -> list:
+    return [_ for sublist in metadata for _ in sublist]
+
+
+def __getattr__(name: str):
+    # the catalog attributes are only resolved here, never bound on the module
+    if name in CATALOG_ATTRIBUTES:
+        return load_catalog()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyCatalogEnum:
+    """Stand-in for a catalog enum that only loads the catalog when used.
+
+    The plugin metadata holds it so that importing the plugin does not build
+    the catalog; every enum operation is forwarded to the real enum.
+    """
+
+    def __init__(self, name: str):
+        self.enum_name = name
+
+    @property
+    def enum(self) -> typing.Type[lib.StrEnum]:
+        return load_catalog()[self.enum_name]
+
+    def __getattr__(self, name: str):
+        return getattr(self.enum, name)
+
+    def __getitem__(self, name: str):
+        return self.enum[name]
+
+    def __iter__(self):
+        return iter(self.enum)
+
+    def __len__(self) -> int:
+        return len(self.enum)
+
+    def __contains__(self, item) -> bool:
+        return item in self.enum
+
+    def __call__(self, *args, **kwargs):
+        return self.enum(*args, **kwargs)
+
+
+CATALOG: dict = {}
+CATALOG_LOCK = threading.Lock()
+CATALOG_ATTRIBUTES = [
+    "METADATA_JSON",
+    "EASYSHIP_CARRIER_METADATA",
+    "ShippingService",
+    "ShippingServiceID",
     "ShippingCourierID",
-    {
-        to_carrier_code(courier): courier["name"]
-        for courier in {
-            _["umbrella_name"]: _ for _ in EASYSHIP_CARRIER_METADATA
-        }.values()
-    },
-)
-
-setattr(ShippingCourierID, "find", find_courier)
+]
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
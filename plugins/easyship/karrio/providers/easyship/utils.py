@@ -31,3 +31,8 @@ class ConnectionConfig(lib.Enum):
     allow_courier_fallback = lib.OptionEnum("allow_courier_fallback", bool)
     shipping_options = lib.OptionEnum("shipping_options", list)
     shipping_services = lib.OptionEnum("shipping_services", list)
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
@@ -4,3 +4,5 @@ from tests.easyship.test_pickup import *
 from tests.easyship.test_tracking import *
 from tests.easyship.test_shipment import *
 from tests.easyship.test_manifest import *
+from tests.easyship.test_units import *
+from tests.easyship.test_bundle import *
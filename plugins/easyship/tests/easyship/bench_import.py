@@ -0,0 +1,49 @@
+"""Benchmark the Easyship units module load with and without the generated codes.
+
+Run from the plugin directory with `python -m tests.easyship.bench_import`.
+"""
+
+import sys
+import time
+import importlib
+import karrio.providers.easyship.units as units
+import karrio.providers.easyship.metadata_codes as metadata_codes
+
+RUNS = 20
+
+
+def main():
+    for name, load in [("metadata_codes", load_codes), ("json fallback", load_json)]:
+        runs = [load() for _ in range(RUNS)]
+        print(
+            f"{name}: module load {min(_[0] for _ in runs) * 1000:.1f} ms, "
+            f"first lookup {min(_[1] for _ in runs) * 1000:.1f} ms"
+        )
+
+
+def load_codes():
+    sys.modules[metadata_codes.__name__] = metadata_codes
+    return _load(lambda: importlib.reload(metadata_codes))
+
+
+def load_json():
+    # a None entry makes the import of the generated module fail
+    sys.modules[metadata_codes.__name__] = None
+    try:
+        return _load(lambda: None)
+    finally:
+        sys.modules[metadata_codes.__name__] = metadata_codes
+
+
+def _load(load_codes_module):
+    started_at = time.perf_counter()
+    load_codes_module()
+    importlib.reload(units)
+    loaded_at = time.perf_counter()
+    units.find_courier("Aramex")
+
+    return loaded_at - started_at, time.perf_counter() - loaded_at
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import gc
+import io
+import base64
+import weakref
+import unittest
+from unittest.mock import patch
+import PyPDF2
+import PIL.Image
+import karrio.lib as lib
+import karrio.providers.easyship.bundle as bundle
+
+
+class TestEasyshipLabelBundle(unittest.TestCase):
+    def test_bundle_pdfs(self):
+        labels = [create_pdf((288, 432)), create_pdf((288, 432), pages=2)]
+
+        document = read_pdf(bundle.bundle_base64(iter(labels), "PDF"))
+
+        self.assertEqual(len(document.pages), 3)
+        self.assertListEqual(
+            [[float(_) for _ in page.mediabox] for page in document.pages],
+            [[0, 0, 288, 432]] * 3,
+        )
+
+    def test_bundle_pdfs_releases_each_label(self):
+        readers = []
+        reader_type = PyPDF2.PdfReader
+
+        def read(*args, **kwargs):
+            reader = reader_type(*args, **kwargs)
+            readers.append(weakref.ref(reader))
+            return reader
+
+        with patch.object(bundle.PyPDF2, "PdfReader", side_effect=read):
+            output = bundle.bundle_base64([create_pdf((288, 432))] * 3, "PDF")
+
+        gc.collect()
+
+        self.assertEqual(len(read_pdf(output).pages), 3)
+        self.assertListEqual([_() for _ in readers], [None, None, None])
+
+    def test_bundle_zpls(self):
+        labels = [
+            base64.b64encode(f"^XA^FD{index}^FS^XZ".encode("utf-8")).decode("utf-8")
+            for index in range(3)
+        ]
+
+        self.assertEqual(
+            bundle.bundle_base64(labels, "ZPL"),
+            lib.bundle_base64(labels, "ZPL"),
+        )
+
+    def test_bundle_images(self):
+        labels = [create_png("red", (40, 20)), create_png("blue", (30, 50))]
+
+        self.assertEqual(
+            bundle.bundle_base64(labels, "PNG"),
+            lib.bundle_base64(labels, "PNG"),
+        )
+
+
+def create_pdf(size: tuple, pages: int = 1) -> str:
+    writer = PyPDF2.PdfWriter()
+    buffer = io.BytesIO()
+
+    for _ in range(pages):
+        writer.add_blank_page(*size)
+
+    writer.write(buffer)
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def read_pdf(b64_str: str) -> PyPDF2.PdfReader:
+    return PyPDF2.PdfReader(io.BytesIO(base64.b64decode(b64_str)), strict=True)
+
+
+def create_png(color: str, size: tuple) -> str:
+    buffer = io.BytesIO()
+    PIL.Image.new("RGB", size, color).save(buffer, "PNG")
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import sys
+import unittest
+import threading
+import subprocess
+from unittest.mock import patch
+import karrio.providers.easyship.units as units
+
+
+class TestEasyshipCatalog(unittest.TestCase):
+    def test_plugin_import_does_not_load_catalog(self):
+        script = (
+            "import karrio.plugins.easyship as plugin\n"
+            "import karrio.providers.easyship.units as units\n"
+            "assert not units.CATALOG\n"
+            "assert len(plugin.METADATA.services) > 0\n"
+            "assert units.CATALOG\n"
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+
+    def test_catalog_is_built_once_across_threads(self):
+        catalog = dict(units.load_catalog())
+        barrier = threading.Barrier(8)
+        calls = []
+
+        def build():
+            calls.append(1)
+            return catalog
+
+        def load():
+            barrier.wait()
+            return units.load_catalog()
+
+        units.CATALOG.clear()
+
+        try:
+            with patch.object(units, "_build_catalog", side_effect=build):
+                threads = [threading.Thread(target=load) for _ in range(8)]
+                [_.start() for _ in threads]
+                [_.join() for _ in threads]
+        finally:
+            units.CATALOG.update(catalog)
+
+        self.assertEqual(len(calls), 1)
+
+    def test_lazy_enum_forwards_to_the_catalog(self):
+        services = units.LazyCatalogEnum("ShippingService")
+
+        self.assertListEqual(list(services), list(units.ShippingService))
+        self.assertIs(services.enum, units.ShippingService)
+        self.assertIn(next(iter(units.ShippingService)).name, services)
+
+    def test_metadata_codes_match_metadata_json(self):
+        # regenerate with `units.dump_metadata_codes()` when this fails
+        self.assertListEqual(
+            units.load_metadata_codes(),
+            [units.to_service_code(_) for _ in units.EASYSHIP_CARRIER_METADATA],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,29 +12,22 @@ def parse_error_response(
     responses = response if isinstance(response, list) else [response]
     errors = [
         *[{**_, "level": _get_level(_)} for _ in responses if _.get("code")],
-        *sum(
-            [
-                [dict(code="warning", message=__, level="warning") for __ in _.get("warnings")]
-                for _ in responses
-                if _.get("warnings")
-            ],
-            [],
-        ),
-        *sum(
-            [
-                [
-                    dict(
-                        code="error",
-                        message=order["message"],
-                        level="error",
-                    )
-                    for order in _.get("order", [])
-                    if "message" in order and order["message"].startswith("Error")
-                ]
-                for _ in responses
-            ],
-            [],
-        )
+        *[
+            dict(code="warning", message=__, level="warning")
+            for _ in responses
+            if _.get("warnings")
+            for __ in _.get("warnings")
+        ],
+        *[
+            dict(
+                code="error",
+                message=order["message"],
+                level="error",
+            )
+            for _ in responses
+            for order in _.get("order", [])
+            if "message" in order and order["message"].startswith("Error")
+        ],
     ]
 
     return [
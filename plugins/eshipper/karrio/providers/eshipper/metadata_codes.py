@@ -0,0 +1,426 @@
+"""eShipper service codes and rate providers derived from metadata.json.
+
+Generated by `units.dump_metadata_codes()` from the plugin generate script.
+"""
+
+SERVICE_CODES = {
+    "PROD_SERVICES": [
+        "eshipper_fedex_2day_freight",
+        "eshipper_fedex_3day_freight",
+        "eshipper_sameday_9_am_guaranteed",
+        "eshipper_project44_a_duie_pyle",
+        "eshipper_project44_a_duie_pyle",
+        "eshipper_project44_aaa_cooper_transportation",
+        "eshipper_project44_aaa_cooper_transportation",
+        "eshipper_project44_aberdeen_express",
+        "eshipper_project44_abf_freight",
+        "eshipper_project44_abfs",
+        "eshipper_sameday_am_service",
+        "eshipper_apex_trucking",
+        "eshipper_project44_averitt_express",
+        "eshipper_project44_brown_transfer_company",
+        "eshipper_canada_worldwide_next_flight_out",
+        "eshipper_project44_central_freight_lines",
+        "eshipper_project44_central_transport",
+        "eshipper_project44_central_transport",
+        "eshipper_project44_chicago_suburban_express",
+        "eshipper_project44_clear_lane_freight",
+        "eshipper_project44_con_way_freight",
+        "eshipper_project44_conway_freight",
+        "eshipper_project44_crosscountry_courier",
+        "eshipper_project44_day_ross",
+        "eshipper_day_and_ross",
+        "eshipper_day_ross_r_and_l",
+        "eshipper_project44_daylight_transport",
+        "eshipper_project44_dayton_freight_lines",
+        "eshipper_project44_dependable_highway_express",
+        "eshipper_project44_dependable_highway_express",
+        "eshipper_dhl_ground",
+        "eshipper_smarte_post_int_l_dhl_packet_international",
+        "eshipper_smarte_post_int_l_dhl_parcel_international_direct",
+        "eshipper_smarte_post_int_l_dhl_parcel_international_standard",
+        "eshipper_project44_dohrn_transfer_company",
+        "eshipper_project44_dugan_truck_line",
+        "eshipper_aramex_economy_document_express",
+        "eshipper_aramex_economy_parcel_express",
+        "eshipper_envoi_same_day_delivery",
+        "eshipper_dhl_esi_export",
+        "eshipper_project44_estes_express_lines",
+        "eshipper_project44_estes_express_lines",
+        "eshipper_ups_expedited",
+        "eshipper_smarte_post_dom_expedited",
+        "eshipper_project44_expedited_freight_systems",
+        "eshipper_ups_express",
+        "eshipper_dhl_express_1030am",
+        "eshipper_dhl_express_12pm",
+        "eshipper_dhl_express_9am",
+        "eshipper_dhl_express_envelope",
+        "eshipper_canpar_express_letter",
+        "eshipper_canpar_express_pak",
+        "eshipper_canpar_express_parcel",
+        "eshipper_dhl_express_worldwide",
+        "eshipper_fastfrate_rail",
+        "eshipper_fedex_2nd_day",
+        "eshipper_fedex_economy",
+        "eshipper_fedex_first_overnight",
+        "eshipper_project44_fedex_freight_canada",
+        "eshipper_project44_fedex_freight_canada",
+        "eshipper_project44_fedex_freight_east",
+        "eshipper_fedex_freight_economy",
+        "eshipper_project44_fedex_freight_national_canada",
+        "eshipper_project44_fedex_freight_national_usa",
+        "eshipper_fedex_freight_priority",
+        "eshipper_project44_fedex_freight_usa",
+        "eshipper_fedex_ground",
+        "eshipper_fedex_international_connect_plus",
+        "eshipper_fedex_intl_economy",
+        "eshipper_fedex_intl_economy_freight",
+        "eshipper_fedex_intl_priority",
+        "eshipper_fedex_intl_priority_express",
+        "eshipper_fedex_intl_priority_freight",
+        "eshipper_project44_fedex_national",
+        "eshipper_fedex_priority",
+        "eshipper_fedex_standard_overnight",
+        "eshipper_project44_forward_air",
+        "eshipper_project44_forwardair",
+        "eshipper_project44_frontline_freight",
+        "eshipper_ups_ground",
+        "eshipper_canpar_ground",
+        "eshipper_sameday_ground_service",
+        "eshipper_sameday_h1_deliver_to_curbside",
+        "eshipper_sameday_h3_delivery_packaging_removal",
+        "eshipper_sameday_h4_delivery_to_curbside",
+        "eshipper_sameday_h5_delivery_to_room_of_choice_2_man",
+        "eshipper_sameday_h6_delivery_packaging_removal_2_man",
+        "eshipper_project44_holland_motor_express",
+        "eshipper_dhl_import_express",
+        "eshipper_dhl_import_express_12pm",
+        "eshipper_dhl_import_express_9am",
+        "eshipper_project44_jp_express",
+        "eshipper_kindersley_expedited",
+        "eshipper_kindersley_rail",
+        "eshipper_kindersley_rail",
+        "eshipper_kindersley_regular",
+        "eshipper_kindersley_road",
+        "eshipper_project44_lakeville_motor_express",
+        "eshipper_day_ross_ltl",
+        "eshipper_sameday_ltl_service",
+        "eshipper_mainliner_road",
+        "eshipper_project44_manitoulin_tlx_inc",
+        "eshipper_project44_midwest_motor_express",
+        "eshipper_mo_rail",
+        "eshipper_mo_rail",
+        "eshipper_project44_monroe_transportation_services",
+        "eshipper_project44_mountain_valley_express",
+        "eshipper_project44_n_m_transfer",
+        "eshipper_project44_new_england_motor_freight",
+        "eshipper_project44_new_england_motor_freight",
+        "eshipper_project44_new_penn_motor_express",
+        "eshipper_project44_oak_harbor_freight",
+        "eshipper_project44_old_dominion_freight",
+        "eshipper_project44_pitt_ohio",
+        "eshipper_project44_pitt_ohio",
+        "eshipper_sameday_pm_service",
+        "eshipper_project44_polaris",
+        "eshipper_aramex_priority_letter_express",
+        "eshipper_aramex_priority_parcel_express",
+        "eshipper_purolator_express",
+        "eshipper_purolator_express_1030",
+        "eshipper_purolator_express_9am",
+        "eshipper_purolator_expresscheque",
+        "eshipper_purolator_ground",
+        "eshipper_purolator_ground_1030",
+        "eshipper_purolator_ground_9am",
+        "eshipper_purolator_puroletter",
+        "eshipper_purolator_puroletter_10_30",
+        "eshipper_purolator_puroletter_9am",
+        "eshipper_purolator_puropak",
+        "eshipper_purolator_puropak_10_30",
+        "eshipper_purolator_puropak_9am",
+        "eshipper_project44_rl_carriers",
+        "eshipper_fastfrate_rail",
+        "eshipper_project44_roadrunner_transportation_services",
+        "eshipper_project44_roadrunner_transportation_services",
+        "eshipper_project44_roadrunner_transportation_services",
+        "eshipper_project44_saia_ltl_freight",
+        "eshipper_project44_saia_motor_freight",
+        "eshipper_ups_second_day_air_a_m",
+        "eshipper_canpar_select_letter",
+        "eshipper_canpar_select_pak",
+        "eshipper_canpar_select_parcel",
+        "eshipper_project44_southeastern_freight_lines",
+        "eshipper_project44_southeastern_freight_lines",
+        "eshipper_project44_southwestern_motor_transport",
+        "eshipper_speedy",
+        "eshipper_ups_standard",
+        "eshipper_project44_standard_forwarding",
+        "eshipper_tforce_freight_ltl",
+        "eshipper_tforce_freight_ltl_guaranteed",
+        "eshipper_tforce_freight_ltl_guaranteed_a_m",
+        "eshipper_tforce_standard_ltl",
+        "eshipper_ups_three_day_select",
+        "eshipper_project44_total_transportation_distribution",
+        "eshipper_project44_tst_overland_express",
+        "eshipper_ups",
+        "eshipper_project44_ups",
+        "eshipper_ups_freight",
+        "eshipper_ups_freight",
+        "eshipper_ups_freight",
+        "eshipper_ups_freight_canada",
+        "eshipper_ups_saver",
+        "eshipper_ups_saver",
+        "eshipper_project44_ups",
+        "eshipper_project44_ups",
+        "eshipper_ups_freight",
+        "eshipper_sameday_urgent_letter",
+        "eshipper_sameday_urgent_pac",
+        "eshipper_canpar_usa",
+        "eshipper_project44_usf_reddaway",
+        "eshipper_ods_usps_light_weight_parcel_budget",
+        "eshipper_ods_usps_light_weight_parcel_expedited",
+        "eshipper_ods_usps_parcel_select_budget",
+        "eshipper_ods_usps_parcel_select_expedited",
+        "eshipper_project44_valley_cartage",
+        "eshipper_project44_vision_express_ltl",
+        "eshipper_project44_ward_trucking",
+        "eshipper_project44_ward_trucking",
+        "eshipper_western_canada_rail",
+        "eshipper_ups_worldwide_expedited",
+        "eshipper_ups_worldwide_express",
+        "eshipper_project44_xpo_logistics",
+        "eshipper_project44_xpress_global_systems",
+        "eshipper_smarte_post_dom_xpresspost",
+        "eshipper_project44_yrc"
+    ],
+    "DEV_SERVICES": [
+        "eshipper_aramex_economy_document_express",
+        "eshipper_aramex_economy_parcel_express",
+        "eshipper_aramex_priority_letter_express",
+        "eshipper_aramex_priority_parcel_express",
+        "eshipper_canadapost_air_parcel_intl",
+        "eshipper_canadapost_expedited",
+        "eshipper_canadapost_expedited_parcel_usa",
+        "eshipper_canadapost_priority_courier",
+        "eshipper_canadapost_regular",
+        "eshipper_canadapost_small_packet",
+        "eshipper_canadapost_small_packet_international_air",
+        "eshipper_canadapost_small_packet_international_surface",
+        "eshipper_canadapost_surface_parcel_intl",
+        "eshipper_canadapost_xpress_post",
+        "eshipper_canadapost_xpress_post_intl",
+        "eshipper_canadapost_xpress_post_usa",
+        "eshipper_canadapost_xpress_post",
+        "eshipper_canpar_express_letter",
+        "eshipper_canpar_express_pak",
+        "eshipper_canpar_express_parcel",
+        "eshipper_canpar_ground",
+        "eshipper_canpar_international",
+        "eshipper_canpar_select_letter",
+        "eshipper_canpar_select_pak",
+        "eshipper_canpar_select_parcel",
+        "eshipper_canpar_usa",
+        "eshipper_canpar_usa_select_letter",
+        "eshipper_canpar_usa_select_pak",
+        "eshipper_canpar_usa_select_parcel",
+        "eshipper_cpx_canada_post",
+        "eshipper_day_ross_ltl",
+        "eshipper_dhl_ground",
+        "eshipper_dhl_economy_select",
+        "eshipper_dhl_esi_export",
+        "eshipper_dhl_express_1030am",
+        "eshipper_dhl_express_12pm",
+        "eshipper_dhl_express_9am",
+        "eshipper_dhl_express_9am",
+        "eshipper_dhl_express_envelope",
+        "eshipper_dhl_express_worldwide",
+        "eshipper_dhl_import_express",
+        "eshipper_dhl_import_express_12pm",
+        "eshipper_dhl_import_express_9am",
+        "eshipper_apex_v",
+        "eshipper_apex_trucking",
+        "eshipper_apex_trucking_v",
+        "eshipper_fastfrate_rail",
+        "eshipper_kindersley_expedited",
+        "eshipper_kindersley_rail",
+        "eshipper_kindersley_rail",
+        "eshipper_kindersley_regular",
+        "eshipper_kindersley_road",
+        "eshipper_kingsway_road",
+        "eshipper_m_o_eastbound",
+        "eshipper_mo_rail",
+        "eshipper_national_fastfreight_rail",
+        "eshipper_national_fastfreight_road",
+        "eshipper_vitran_rail",
+        "eshipper_vitran_road",
+        "eshipper_western_canada_rail",
+        "eshipper_fedex_2day_freight",
+        "eshipper_fedex_3day_freight",
+        "eshipper_fedex_2nd_day",
+        "eshipper_fedex_economy",
+        "eshipper_fedex_first_overnight",
+        "eshipper_fedex_ground",
+        "eshipper_fedex_ground_us",
+        "eshipper_fedex_international_priority",
+        "eshipper_fedex_international_priority_express",
+        "eshipper_fedex_intl_economy",
+        "eshipper_fedex_intl_economy_freight",
+        "eshipper_fedex_intl_priority",
+        "eshipper_fedex_intl_priority_express",
+        "eshipper_fedex_intl_priority_freight",
+        "eshipper_fedex_priority",
+        "eshipper_fedex_standard_overnight",
+        "eshipper_flash_bird_ground",
+        "eshipper_fleet_optics_ground",
+        "eshipper_project44_a_duie_pyle",
+        "eshipper_project44_aaa_cooper_transportation",
+        "eshipper_project44_aberdeen_express",
+        "eshipper_project44_abfs",
+        "eshipper_project44_averitt_express",
+        "eshipper_project44_brown_transfer_company",
+        "eshipper_project44_central_freight_lines",
+        "eshipper_project44_central_transport",
+        "eshipper_project44_chicago_suburban_express",
+        "eshipper_project44_clear_lane_freight",
+        "eshipper_project44_con_way_freight",
+        "eshipper_project44_crosscountry_courier",
+        "eshipper_project44_day_ross",
+        "eshipper_project44_day_ross_v",
+        "eshipper_project44_dayton_freight_lines",
+        "eshipper_project44_dependable_highway_express",
+        "eshipper_project44_dohrn_transfer_company",
+        "eshipper_project44_dugan_truck_line",
+        "eshipper_project44_estes_express_lines",
+        "eshipper_project44_expedited_freight_systems",
+        "eshipper_project44_fedex_freight_canada",
+        "eshipper_project44_fedex_freight_canada",
+        "eshipper_project44_fedex_freight_east",
+        "eshipper_project44_fedex_freight_national_canada",
+        "eshipper_project44_fedex_freight_national_usa",
+        "eshipper_project44_fedex_freight_usa",
+        "eshipper_project44_fedex_national",
+        "eshipper_project44_forwardair",
+        "eshipper_project44_frontline_freight",
+        "eshipper_project44_holland_motor_express",
+        "eshipper_project44_holland_motor_express",
+        "eshipper_project44_lakeville_motor_express",
+        "eshipper_project44_manitoulin_tlx_inc",
+        "eshipper_project44_midwest_motor_express",
+        "eshipper_project44_monroe_transportation_services",
+        "eshipper_project44_n_m_transfer",
+        "eshipper_project44_new_england_motor_freight",
+        "eshipper_project44_new_england_motor_freight",
+        "eshipper_project44_new_penn_motor_express",
+        "eshipper_project44_pitt_ohio",
+        "eshipper_project44_polaris",
+        "eshipper_project44_purolator_freight",
+        "eshipper_project44_r_l_carriers",
+        "eshipper_project44_roadrunner_transportation_services",
+        "eshipper_project44_roadrunner_transportation_services",
+        "eshipper_project44_saia_motor_freight",
+        "eshipper_project44_southeastern_freight_lines",
+        "eshipper_project44_southwestern_motor_transport",
+        "eshipper_project44_standard_forwarding",
+        "eshipper_project44_total_transportation_distribution",
+        "eshipper_project44_tst_overland_express",
+        "eshipper_project44_ups",
+        "eshipper_project44_ups",
+        "eshipper_project44_usf_reddaway",
+        "eshipper_project44_valley_cartage",
+        "eshipper_project44_vision_express_ltl",
+        "eshipper_project44_ward_trucking",
+        "eshipper_project44_xpo_logistics",
+        "eshipper_project44_xpress_global_systems",
+        "eshipper_project44_xpress_global_systems",
+        "eshipper_project44_yrc",
+        "eshipper_project44_yrc",
+        "eshipper_purolator_express",
+        "eshipper_purolator_express_1030",
+        "eshipper_purolator_express_9am",
+        "eshipper_purolator_expresscheque",
+        "eshipper_purolator_ground",
+        "eshipper_purolator_ground_1030",
+        "eshipper_purolator_ground_9am",
+        "eshipper_purolator",
+        "eshipper_purolator_10_30",
+        "eshipper_purolator_9am",
+        "eshipper_purolator_puropak",
+        "eshipper_purolator_puropak_10_30",
+        "eshipper_purolator_puropak_9am",
+        "eshipper_pyk_ground_advantage",
+        "eshipper_pyk_priority_mail",
+        "eshipper_sameday_9_am_guaranteed",
+        "eshipper_sameday_am_service",
+        "eshipper_sameday_ground_service",
+        "eshipper_sameday_h1_deliver_to_curbside",
+        "eshipper_sameday_h4_delivery_to_curbside",
+        "eshipper_sameday_h5_delivery_to_room_of_choice_2_man",
+        "eshipper_sameday_h6_delivery_packaging_removal_2_man",
+        "eshipper_sameday_ltl_service",
+        "eshipper_sameday_pm_service",
+        "eshipper_sameday_urgent_letter",
+        "eshipper_sameday_urgent_pac",
+        "eshipper_skip",
+        "eshipper_skip",
+        "eshipper_smarte_post_intl_dhl_parcel_international_direct_ngr",
+        "eshipper_smarte_post_intl_global_mail_business_priority",
+        "eshipper_smarte_post_intl_global_mail_business_standard",
+        "eshipper_smarte_post_intl_global_mail_packet_plus_priority",
+        "eshipper_smarte_post_intl_global_mail_packet_priority",
+        "eshipper_smarte_post_intl_global_mail_packet_standard",
+        "eshipper_smarte_post_intl_global_mail_parcel_direct_priority_yyz",
+        "eshipper_smarte_post_intl_global_mail_parcel_direct_standard_yyz",
+        "eshipper_smarte_post_intl_global_mail_parcel_priority",
+        "eshipper_smarte_post_intl_global_mail_parcel_standard",
+        "eshipper_ups_expedited",
+        "eshipper_ups_express",
+        "eshipper_ups_express_early_am",
+        "eshipper_ups_ground",
+        "eshipper_ups_second_day_air_a_m",
+        "eshipper_ups_standard",
+        "eshipper_ups_three_day_select",
+        "eshipper_ups_saver",
+        "eshipper_ups_worldwide_expedited",
+        "eshipper_ups_worldwide_express",
+        "eshipper_ups_worldwide_express_plus",
+        "eshipper_usps_first_class_package_return_service",
+        "eshipper_usps_library_mail",
+        "eshipper_usps_media_mail",
+        "eshipper_usps_parcel_select",
+        "eshipper_usps_pbx",
+        "eshipper_usps_pbx_lightweight",
+        "eshipper_usps_priority_mail",
+        "eshipper_usps_priority_mail_express",
+        "eshipper_usps_priority_mail_open_and_distribute",
+        "eshipper_usps_priority_mail_return_service",
+        "eshipper_usps_retail_ground_formerly_standard_post"
+    ]
+}
+
+RATE_PROVIDERS = {
+    "fedex": "fedex_freight_ltl",
+    "sameday": "sameday",
+    "project44": "project44",
+    "eshipper": "e_shipper_trucking",
+    "dhl": "dhl",
+    "smarte_post_int_l": "smarte_post_int_l",
+    "aramex": "aramex",
+    "envoi": "envoi",
+    "ups": "ups",
+    "smarte_post_dom": "smarte_post_dom",
+    "canpar": "canpar",
+    "day_ross": "day_ross",
+    "mainliner": "mainliner",
+    "purolator": "purolator",
+    "fastfrate": "fastfrate",
+    "speedy": "speedy",
+    "tforce": "tforce_freight",
+    "ods": "ods",
+    "canadapost": "canada_post",
+    "cpx": "cpx",
+    "flash_bird": "flash_bird",
+    "fleet_optics": "fleet_optics",
+    "pyk": "pyk",
+    "skip": "skip",
+    "smarte_post_intl": "smarte_post_intl",
+    "usps": "usps"
+}
@@ -6,6 +6,7 @@ import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
 import karrio.providers.eshipper.error as error
+import karrio.providers.eshipper.bundle as provider_bundle
 import karrio.providers.eshipper.utils as provider_utils
 import karrio.providers.eshipper.units as provider_units
 
@@ -28,7 +29,9 @@ def _extract_details(
 ) -> models.ShipmentDetails:
     shipment = lib.to_object(shipping.ShippingResponseType, data)
     label_type = next((_.type for _ in shipment.labelData.label), "PDF").upper()
-    label = lib.bundle_base64([_.data for _ in shipment.labelData.label], label_type)
+    label = provider_bundle.bundle_base64(
+        (_.data for _ in shipment.labelData.label), label_type
+    )
     invoice = lib.failsafe(lambda: shipment.customsInvoice.data)
     trackingNumbers = [_.trackingNumber for _ in shipment.packages]
     service = provider_units.ShippingService.find(
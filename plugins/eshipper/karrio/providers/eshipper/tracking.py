@@ -16,15 +16,13 @@ def parse_tracking_response(
     response = _response.deserialize()
     responses = response if isinstance(response, list) else [response]
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(
-                _, settings, tracking_number=_.get("trackingNumber")
-            )
-            for _ in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for _ in responses
+        for message in error.parse_error_response(
+            _, settings, tracking_number=_.get("trackingNumber")
+        )
+    ]
     tracking_details = [
         _extract_details(_, settings)
         for _ in responses
@@ -52,22 +50,8 @@ def _extract_details(
                 date=lib.fdate(event.originalEvent.eventDate, "%Y-%m-%d %H:%M:%S"),
                 time=lib.flocaltime(event.originalEvent.eventDate, "%Y-%m-%d %H:%M:%S"),
                 timestamp=lib.fiso_timestamp(event.originalEvent.eventDate, current_format="%Y-%m-%d %H:%M:%S"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.originalEvent.name in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.originalEvent.name in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.originalEvent.name),
+                reason=provider_units.find_incident_reason(event.originalEvent.name),
             )
             for event in details.event
         ],
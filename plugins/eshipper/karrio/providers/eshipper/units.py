@@ -1,13 +1,13 @@
+import json
 import typing
 import pathlib
+import functools
+import threading
 import karrio.lib as lib
 import karrio.core.units as units
 
-METADATA_JSON = lib.to_dict(
-    lib.load_file_content(
-        pathlib.Path(__file__).resolve().parent / "metadata.json"
-    ).replace('"NULL"', "null")
-)
+METADATA_PATH = pathlib.Path(__file__).resolve().parent / "metadata.json"
+METADATA_CODES_PATH = METADATA_PATH.with_name("metadata_codes.py")
 KARRIO_CARRIER_MAPPING = {
     "fed_ex": "fedex",
     "e_shipper": "eshipper",
@@ -146,29 +146,31 @@ def get_service(
     service_id: str = None,
     carrier_name: str = None,
 ):
-    prod_metadata = METADATA_JSON["PROD_SERVICES"]
-    test_metadata = METADATA_JSON["DEV_SERVICES"]
-    metadata = lib.identity(
-        test_metadata + prod_metadata if test_mode else prod_metadata + test_metadata
+    metadata_keys = lib.identity(
+        ["DEV_SERVICES", "PROD_SERVICES"]
+        if test_mode
+        else ["PROD_SERVICES", "DEV_SERVICES"]
     )
 
-    return next(
-        (
-            service
-            for service in metadata
-            if to_service_code(service) == search
-            or str(service.get("id")) == search
-            or (service_id and service_id == str(service.get("id")))
-            or (
-                service.get("name") == search
-                and (
-                    not carrier_name
-                    or service.get("carrierDTO", {}).get("name") == carrier_name
-                )
-            )
-        ),
-        {},
-    )
+    metadata = load_metadata()
+
+    for metadata_key in metadata_keys:
+        index = metadata["ESHIPPER_SERVICE_INDEX"][metadata_key]
+        position = _first_position(
+            index["code"].get(search),
+            index["id"].get(search),
+            index["id"].get(service_id) if service_id else None,
+            lib.identity(
+                index["name_carrier"].get((search, carrier_name))
+                if carrier_name
+                else index["name"].get(search)
+            ),
+        )
+
+        if position is not None:
+            return metadata["METADATA_JSON"][metadata_key][position]
+
+    return {}
 
 
 def get_service_id(
@@ -227,23 +229,24 @@ def get_carrier(
         carrier_name=carrier_name or search,
     )
 
-    return service.get("carrierDTO") or next(
-        (
-            carrier
-            for carrier in ESHIPPER_CARRIER_METADATA.values()
-            if search == carrier.get(id_key) or search == carrier.get("name")
-        ),
-        next(
-            (
-                carrier
-                for carrier in ESHIPPER_CARRIER_METADATA.values()
-                if search == carrier.get(alternate_key) or search == carrier.get("name")
-            ),
-            {},
-        ),
+    return service.get("carrierDTO") or _find_carrier(search, id_key) or (
+        _find_carrier(search, alternate_key) or {}
     )
 
 
+def _find_carrier(search: str, id_key: str) -> typing.Optional[dict]:
+    metadata = load_metadata()
+    index = metadata["ESHIPPER_CARRIER_INDEX"]
+    position = _first_position(index[id_key].get(search), index["name"].get(search))
+
+    return metadata["ESHIPPER_CARRIERS"][position] if position is not None else None
+
+
+def _first_position(*positions: typing.Optional[int]) -> typing.Optional[int]:
+    """Return the earliest metadata position matched by any lookup key."""
+    return min((_ for _ in positions if _ is not None), default=None)
+
+
 def get_carrier_id(
     search: str,
     test_mode: bool = False,
@@ -285,98 +288,243 @@ def find_rate_provider(
     return RateProvider.map(lib.to_snake_case(search))
 
 
-ESHIPPER_CARRIER_METADATA = {
-    lib.to_snake_case(carrier["carrierDTO"]["name"]): {
-        **carrier["carrierDTO"],
-        "ids": list(
-            set(
-                [
-                    s["carrierDTO"]["id"]
-                    for s in METADATA_JSON["PROD_SERVICES"]
-                    + METADATA_JSON["DEV_SERVICES"]
-                    if s["carrierDTO"]["name"] == carrier["carrierDTO"]["name"]
-                ]
-            )
-        ),
-        "prod_id": next(
-            (
-                s["carrierDTO"]["id"]
-                for s in METADATA_JSON["PROD_SERVICES"]
-                if s["carrierDTO"]["name"] == carrier["carrierDTO"]["name"]
-            ),
-            None,
-        ),
-        "test_id": next(
-            (
-                s["carrierDTO"]["id"]
-                for s in METADATA_JSON["DEV_SERVICES"]
-                if s["carrierDTO"]["name"] == carrier["carrierDTO"]["name"]
-            ),
-            None,
-        ),
+def load_metadata() -> dict:
+    """Load the eShipper metadata and its lookup indexes.
+
+    metadata.json is only parsed on the first lookup, once, even when first
+    used from several threads.
+    """
+    if not METADATA:
+        with METADATA_LOCK:
+            if not METADATA:
+                METADATA.update(_build_metadata())
+
+    return METADATA
+
+
+def load_metadata_codes() -> dict:
+    """Return the service codes and rate providers derived from metadata.json.
+
+    They come from the `metadata_codes` module emitted by `dump_metadata_codes`,
+    or are derived from metadata.json when that module is missing.
+    """
+    try:
+        import karrio.providers.eshipper.metadata_codes as metadata_codes
+    except ImportError:
+        return _derive_metadata_codes(_parse_metadata())
+
+    return dict(
+        SERVICE_CODES=metadata_codes.SERVICE_CODES,
+        RATE_PROVIDERS=metadata_codes.RATE_PROVIDERS,
+    )
+
+
+def dump_metadata_codes() -> pathlib.Path:
+    """Write the `metadata_codes` module next to metadata.json."""
+    codes = _derive_metadata_codes(_parse_metadata())
+    METADATA_CODES_PATH.write_text(
+        '"""eShipper service codes and rate providers derived from metadata.json.\n'
+        "\n"
+        "Generated by `units.dump_metadata_codes()` from the plugin generate script.\n"
+        '"""\n'
+        "\n"
+        f"SERVICE_CODES = {json.dumps(codes['SERVICE_CODES'], indent=4)}\n"
+        "\n"
+        f"RATE_PROVIDERS = {json.dumps(codes['RATE_PROVIDERS'], indent=4)}\n"
+    )
+
+    return METADATA_CODES_PATH
+
+
+def _parse_metadata() -> dict:
+    return lib.to_dict(
+        lib.load_file_content(METADATA_PATH).replace('"NULL"', "null")
+    )
+
+
+def _derive_metadata_codes(metadata: dict) -> dict:
+    services = metadata["PROD_SERVICES"] + metadata["DEV_SERVICES"]
+    carriers = {_["carrierDTO"]["name"]: _["carrierDTO"] for _ in services}
+
+    return dict(
+        SERVICE_CODES={
+            key: [to_service_code(service) for service in metadata[key]]
+            for key in ["PROD_SERVICES", "DEV_SERVICES"]
+        },
+        RATE_PROVIDERS={
+            to_carrier_code(carrier): lib.to_snake_case(name)
+            for name, carrier in carriers.items()
+        },
+    )
+
+
+def _build_metadata() -> dict:
+    metadata = _parse_metadata()
+    service_index = {
+        key: _index_services(metadata[key], METADATA_CODES["SERVICE_CODES"][key])
+        for key in ["PROD_SERVICES", "DEV_SERVICES"]
     }
-    for carrier in {
-        s["carrierDTO"]["name"]: s
-        for s in METADATA_JSON["PROD_SERVICES"] + METADATA_JSON["DEV_SERVICES"]
-    }.values()
-}
+    carrier_metadata = _load_carrier_metadata(metadata)
+    carriers = list(carrier_metadata.values())
+
+    return dict(
+        METADATA_JSON=metadata,
+        ESHIPPER_SERVICE_INDEX=service_index,
+        ESHIPPER_CARRIER_METADATA=carrier_metadata,
+        ESHIPPER_SERVICE_METADATA=_load_service_metadata(metadata, service_index),
+        ESHIPPER_CARRIERS=carriers,
+        ESHIPPER_CARRIER_INDEX=_index_carriers(carriers),
+    )
+
+
+def _index_services(
+    services: typing.List[dict],
+    service_codes: typing.List[str],
+) -> dict:
+    """Index a service list by every key `get_service` matches on.
+
+    Each index maps a lookup key to the position of the first service
+    holding it so that precedence matches a sequential scan of the list.
+    """
+    index: dict = dict(code={}, id={}, name={}, name_carrier={}, codes=service_codes)
+
+    for position, (service, code) in enumerate(zip(services, service_codes)):
+        name = service.get("name")
+        index["code"].setdefault(code, position)
+        index["id"].setdefault(str(service.get("id")), position)
+        index["name"].setdefault(name, position)
+        index["name_carrier"].setdefault(
+            (name, service.get("carrierDTO", {}).get("name")), position
+        )
 
-ESHIPPER_SERVICE_METADATA = {
-    to_service_code(service): {
-        **service,
-        "ids": list(
-            set(
-                [
-                    s["id"]
-                    for s in METADATA_JSON["PROD_SERVICES"]
-                    + METADATA_JSON["DEV_SERVICES"]
-                    if to_service_code(s) == to_service_code(service)
-                ]
-            )
-        ),
-        "prod_id": next(
-            (
-                s["id"]
-                for s in METADATA_JSON["PROD_SERVICES"]
-                if to_service_code(s) == to_service_code(service)
+    return index
+
+
+def _load_carrier_metadata(metadata: dict) -> dict:
+    prod_services = metadata["PROD_SERVICES"]
+    dev_services = metadata["DEV_SERVICES"]
+    carriers: dict = {}
+    carrier_ids: dict = {}
+    prod_ids: dict = {}
+    test_ids: dict = {}
+
+    for service in prod_services + dev_services:
+        name = service["carrierDTO"]["name"]
+        carriers[name] = service["carrierDTO"]
+        carrier_ids.setdefault(name, []).append(service["carrierDTO"]["id"])
+    for service in prod_services:
+        prod_ids.setdefault(service["carrierDTO"]["name"], service["carrierDTO"]["id"])
+    for service in dev_services:
+        test_ids.setdefault(service["carrierDTO"]["name"], service["carrierDTO"]["id"])
+
+    return {
+        lib.to_snake_case(name): {
+            **carrier,
+            "ids": list(set(carrier_ids[name])),
+            "prod_id": prod_ids.get(name),
+            "test_id": test_ids.get(name),
+        }
+        for name, carrier in carriers.items()
+    }
+
+
+def _load_service_metadata(metadata: dict, service_index: dict) -> dict:
+    prod_services = metadata["PROD_SERVICES"]
+    dev_services = metadata["DEV_SERVICES"]
+    prod_index = service_index["PROD_SERVICES"]
+    dev_index = service_index["DEV_SERVICES"]
+    prod_codes, dev_codes = prod_index["codes"], dev_index["codes"]
+    services: dict = {}
+    service_ids: dict = {}
+
+    for code, service in zip(dev_codes + prod_codes, dev_services + prod_services):
+        services[code] = service
+    for code, service in zip(prod_codes + dev_codes, prod_services + dev_services):
+        service_ids.setdefault(code, []).append(service["id"])
+
+    return {
+        code: {
+            **service,
+            "ids": list(set(service_ids[code])),
+            "prod_id": lib.identity(
+                prod_services[prod_index["code"][code]]["id"]
+                if code in prod_index["code"]
+                else None
             ),
-            None,
-        ),
-        "test_id": next(
-            (
-                s["id"]
-                for s in METADATA_JSON["DEV_SERVICES"]
-                if to_service_code(s) == to_service_code(service)
+            "test_id": lib.identity(
+                dev_services[dev_index["code"][code]]["id"]
+                if code in dev_index["code"]
+                else None
             ),
-            None,
-        ),
-        "carrier": lib.to_snake_case(service["carrierDTO"]["name"]),
+            "carrier": lib.to_snake_case(service["carrierDTO"]["name"]),
+        }
+        for code, service in services.items()
     }
-    for service in {
-        to_service_code(s): s
-        for s in METADATA_JSON["DEV_SERVICES"] + METADATA_JSON["PROD_SERVICES"]
-    }.values()
-}
 
 
+def _index_carriers(carriers: typing.List[dict]) -> dict:
+    """Index carriers by every key `get_carrier` matches on (first one wins)."""
+    index: dict = dict(prod_id={}, test_id={}, name={})
+
+    for position, carrier in enumerate(carriers):
+        for key, values in index.items():
+            values.setdefault(carrier.get(key), position)
+
+    return index
+
+
+def __getattr__(name: str):
+    # the metadata attributes are only resolved here, never bound on the module
+    if name in METADATA_ATTRIBUTES:
+        return load_metadata()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+METADATA: dict = {}
+METADATA_LOCK = threading.Lock()
+METADATA_ATTRIBUTES = [
+    "METADATA_JSON",
+    "ESHIPPER_SERVICE_INDEX",
+    "ESHIPPER_CARRIER_METADATA",
+    "ESHIPPER_SERVICE_METADATA",
+    "ESHIPPER_CARRIERS",
+    "ESHIPPER_CARRIER_INDEX",
+]
+METADATA_CODES = load_metadata_codes()
+
 ShippingService = lib.StrEnum(
     "ShippingService",
     {
-        to_service_code(service): to_service_code(service)
-        for service in ESHIPPER_SERVICE_METADATA.values()
+        code: code
+        for code in dict.fromkeys(
+            METADATA_CODES["SERVICE_CODES"]["DEV_SERVICES"]
+            + METADATA_CODES["SERVICE_CODES"]["PROD_SERVICES"]
+        )
     },
 )
 
-RateProvider = lib.StrEnum(
-    "RateProvider",
-    {
-        to_carrier_code(carrier): slug
-        for slug, carrier in ESHIPPER_CARRIER_METADATA.items()
-    },
-)
+RateProvider = lib.StrEnum("RateProvider", METADATA_CODES["RATE_PROVIDERS"])
 
 
 setattr(ShippingService, "service_id", get_service_id)
 setattr(ShippingService, "carrier_id", get_carrier_id)
 setattr(ShippingService, "find", find_service)
 setattr(RateProvider, "find", find_rate_provider)
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
@@ -1,4 +1,6 @@
 
 from tests.eshipper.test_rate import *
 from tests.eshipper.test_tracking import *
-from tests.eshipper.test_shipment import *
\ No newline at end of file
+from tests.eshipper.test_shipment import *
+from tests.eshipper.test_units import *
+from tests.eshipper.test_bundle import *
@@ -0,0 +1,43 @@
+"""Benchmark the eShipper metadata indexes.
+
+Run from the plugin directory with `python -m tests.eshipper.bench_metadata`.
+"""
+
+import time
+import timeit
+import importlib
+import karrio.lib as lib
+import karrio.providers.eshipper.units as units
+from .fixture import gateway
+from .test_rate import RateResponse
+
+QUOTES = 200
+
+
+def main():
+    started_at = time.perf_counter()
+    importlib.reload(units)
+    print(f"units module load: {(time.perf_counter() - started_at) * 1000:.1f} ms")
+
+    response = lib.to_dict(RateResponse)
+    quotes = (response["quotes"] * QUOTES)[:QUOTES]
+    payload = lib.to_json({**response, "quotes": quotes})
+    parse = lambda: gateway.mapper.parse_rate_response(
+        lib.Deserializable(payload, lib.to_dict)
+    )
+    print(f"parse {QUOTES} quotes: {_best(parse, 5) * 1000:.1f} ms")
+
+    for name, lookup in [
+        ("get_service", lambda: units.get_service("Purolator Ground")),
+        ("get_carrier", lambda: units.get_carrier("Purolator")),
+        ("find_rate_provider", lambda: units.find_rate_provider("Purolator")),
+    ]:
+        print(f"{name}: {_best(lookup, 10_000) * 1e6:.2f} us")
+
+
+def _best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import sys
+import unittest
+import subprocess
+import karrio.providers.eshipper.units as units
+
+
+class TestEShipperMetadata(unittest.TestCase):
+    def test_import_does_not_parse_metadata(self):
+        script = (
+            "import karrio.plugins.eshipper as plugin\n"
+            "import karrio.providers.eshipper.units as units\n"
+            "assert len(plugin.METADATA.services) > 0\n"
+            "assert not units.METADATA\n"
+            "assert units.get_service('Purolator Ground')\n"
+            "assert units.METADATA\n"
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True
+        )
+
+        self.assertEqual(process.returncode, 0, process.stderr)
+
+    def test_metadata_codes_match_metadata_json(self):
+        # regenerate with `units.dump_metadata_codes()` when this fails
+        self.assertDictEqual(
+            units.load_metadata_codes(),
+            units._derive_metadata_codes(units.METADATA_JSON),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
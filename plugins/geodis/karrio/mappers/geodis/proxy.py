@@ -4,6 +4,9 @@ import json
 import typing
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.core.models as models
+import karrio.providers.geodis.rate_index as provider_rate_index
+import karrio.providers.geodis.fanout as provider_fanout
 import karrio.mappers.geodis.settings as provider_settings
 import karrio.universal.mappers.rating_proxy as rating_proxy
 
@@ -12,7 +15,15 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
     settings: provider_settings.Settings
 
     def get_rates(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        return super().get_rates(request)
+        return provider_rate_index.get_rates(self.settings, request)
+
+    def get_rates_batch(
+        self, payloads: typing.Iterable[typing.Union[models.RateRequest, dict]]
+    ) -> typing.Iterator[
+        typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]
+    ]:
+        """Lazily rate a stream of rate requests against one rate index."""
+        return provider_rate_index.get_rates_batch(self.settings, payloads)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
         service = "api/wsclient/enregistrement-envois"
@@ -54,7 +65,8 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
         service = "api/zoomclient/recherche-envoi"
         track = lambda data: (
             data["noSuivi"],
-            lib.request(
+            provider_fanout.request(
+                self.settings,
                 url=f"{self.settings.server_url}/{service}",
                 trace=self.trace_as("json"),
                 method="POST",
@@ -66,8 +78,8 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
             ),
         )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_asynchronously(
-            track, requests.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, track, requests.serialize()
         )
 
         return lib.Deserializable(
@@ -0,0 +1,384 @@
+"""Compiled rate sheet index for the GEODIS rating proxy.
+
+`RatingMixinProxy` scans every zone of every service level for each package.
+The index groups each service's zones by destination country and resolves
+their (possibly overlapping) weight ranges into sorted weight breaks with
+the zone the mixin would select between them, so a package's zone is found
+with a bisect. Rates are still computed by the universal
+`get_available_rates`, against services narrowed down to that zone.
+
+`get_rates_batch` rates a stream of requests (e.g. rows of an order file)
+against one index, without the Serializable/Deserializable round trip.
+"""
+
+import attr
+import copy
+import bisect
+import hashlib
+import typing
+import threading
+import collections
+import karrio.lib as lib
+import karrio.core.units as units
+import karrio.core.models as models
+import karrio.universal.mappers.rating_proxy as rating_proxy
+
+INDEX_CACHE_SIZE = 32
+LINEAR_SCAN_ZONES = 8
+INFINITY = float("inf")
+RankedZone = typing.Tuple[tuple, models.ServiceZone]
+
+
+class WeightBreaks:
+    """The best ranked zone of a zone group for every weight interval."""
+
+    def __init__(self, zones: typing.List[RankedZone], weight_unit: str):
+        bounds = [
+            (
+                _weight(zone.min_weight, weight_unit, -INFINITY),
+                _weight(zone.max_weight, weight_unit, INFINITY),
+                (rank, zone),
+            )
+            for rank, zone in zones
+        ]
+        self.breaks = sorted(
+            {_ for low, high, __ in bounds for _ in (low, high)} - {-INFINITY, INFINITY}
+        )
+        # the zone selected below the first break, then from each break on
+        self.zones: typing.List[typing.Optional[RankedZone]] = [
+            min(
+                (item for low, high, item in bounds if low <= weight < high),
+                default=None,
+            )
+            for weight in [-INFINITY, *self.breaks]
+        ]
+
+    def lookup(
+        self, package: units.Package, weight_unit: str
+    ) -> typing.Optional[RankedZone]:
+        if not self.breaks:
+            return self.zones[0]
+
+        weight = package.weight[weight_unit]
+        return self.zones[bisect.bisect_right(self.breaks, weight)]
+
+
+class ServiceIndex:
+    """The zones of a service level, indexed by destination country."""
+
+    def __init__(self, service: models.ServiceLevel):
+        self.service = service
+        self.narrowed: typing.Dict[typing.Any, models.ServiceLevel] = {}
+        self.weight_unit = service.weight_unit or "KG"
+        ranked = [
+            (_rank(zone, position), zone)
+            for position, zone in enumerate(service.zones or [])
+        ]
+        countries = [_ for _ in ranked if not (_[1].postal_codes or _[1].cities)]
+
+        # postal code and city zones are matched like the mixin does
+        self.located = [_ for _ in ranked if _[1].postal_codes or _[1].cities]
+        self.anywhere = WeightBreaks(
+            [_ for _ in countries if not _[1].country_codes], self.weight_unit
+        )
+        self.countries = {
+            country: WeightBreaks(
+                [
+                    _
+                    for _ in countries
+                    if not _[1].country_codes or country in _[1].country_codes
+                ],
+                self.weight_unit,
+            )
+            for country in {
+                country for _, zone in countries for country in zone.country_codes or []
+            }
+        }
+
+    def zones(
+        self,
+        package: units.Package,
+        recipient: units.ComputedAddress,
+    ) -> typing.List[models.ServiceZone]:
+        """Return the zone the mixin would select for the package, if any."""
+        best = self.lookup(package, recipient)
+
+        return [] if best is None else [best[1]]
+
+    def lookup(
+        self,
+        package: units.Package,
+        recipient: units.ComputedAddress,
+    ) -> typing.Optional[RankedZone]:
+        breaks = self.countries.get(recipient.country_code, self.anywhere)
+        best = breaks.lookup(package, self.weight_unit)
+
+        if not self.located:
+            return best
+
+        candidates = [
+            _
+            for _ in self.located
+            if rating_proxy.check_location_match(_[1], recipient)
+            and rating_proxy.check_weight_match(_[1], package, self.service)
+        ] + ([best] if best is not None else [])
+
+        return min(candidates) if any(candidates) else None
+
+    def shipping_service(
+        self,
+        package: units.Package,
+        recipient: units.ComputedAddress,
+    ) -> models.ServiceLevel:
+        """Return the service level narrowed down to the package zone."""
+        best = self.lookup(package, recipient)
+        key = None if best is None else best[0]
+
+        if key not in self.narrowed:
+            self.narrowed[key] = attr.evolve(
+                self.service, zones=[] if best is None else [best[1]]
+            )
+
+        return self.narrowed[key]
+
+
+class RateIndex:
+    """A compiled rate sheet: the index of every service level."""
+
+    def __init__(self, services: typing.List[models.ServiceLevel]):
+        # a few zones are found faster by the mixin's own scan
+        self.services = [
+            (
+                service,
+                (
+                    ServiceIndex(service)
+                    if len(service.zones or []) > LINEAR_SCAN_ZONES
+                    else None
+                ),
+            )
+            for service in services
+        ]
+        self.indexed = any(index for _, index in self.services)
+
+    def shipping_services(
+        self,
+        package: units.Package,
+        recipient: units.ComputedAddress,
+        selected_services: typing.List[str] = [],
+    ) -> typing.List[models.ServiceLevel]:
+        """Return the service levels with the zones matching the package.
+
+        An indexed service without a matching zone can neither be rated nor
+        report an error unless it was requested, so it is left out.
+        """
+        services = [
+            (
+                index,
+                (
+                    service
+                    if index is None
+                    else index.shipping_service(package, recipient)
+                ),
+            )
+            for service, index in self.services
+            if service.active
+        ]
+
+        return [
+            _
+            for index, _ in services
+            if index is None or any(_.zones) or _.service_code in selected_services
+        ]
+
+
+def rate_index(services: typing.List[models.ServiceLevel]) -> RateIndex:
+    """Return the index of a services setting, compiled on first use.
+
+    Indexes are cached by the content of the services, so that gateways
+    created with the same rate sheet share one, and a services list changed
+    in place gets a new index.
+    """
+    digest = _digest(services)
+
+    with _lock:
+        index = _indexes.get(digest)
+
+        if index is not None:
+            _indexes.move_to_end(digest)
+            return index
+
+    index = RateIndex(services)
+
+    with _lock:
+        _indexes[digest] = index
+
+        while len(_indexes) > INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+
+    return index
+
+
+def get_rates(settings, request: lib.Serializable) -> lib.Deserializable:
+    """`RatingMixinProxy.get_rates` resolving zones through the rate index."""
+    index = rate_index(settings.shipping_services)
+
+    return lib.Deserializable(get_request_rates(index, settings, request.serialize()))
+
+
+def get_rates_batch(
+    settings,
+    payloads: typing.Iterable[typing.Union[models.RateRequest, dict]],
+) -> typing.Iterator[
+    typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]
+]:
+    """Rate a stream of requests offline against one rate index.
+
+    The (rates, messages) of each request are yielded as they are computed,
+    like the mapper's `parse_rate_response` would return them.
+    """
+    index = rate_index(settings.shipping_services)
+
+    for payload in payloads:
+        response = get_request_rates(
+            index,
+            settings,
+            (
+                payload
+                if isinstance(payload, models.RateRequest)
+                else lib.to_object(models.RateRequest, payload)
+            ),
+        )
+
+        yield (
+            lib.to_multi_piece_rates([(ref, rates) for ref, (rates, _) in response]),
+            [message for _, (__, messages) in response for message in messages],
+        )
+
+
+def get_request_rates(
+    index: RateIndex,
+    settings,
+    payload: models.RateRequest,
+) -> typing.List[typing.Tuple[str, typing.Any]]:
+    """Return the rates and messages of every package of a rate request."""
+    options = getattr(payload, "options", {}) or {}
+    required_features = options.get("features", [])
+
+    shipper = lib.to_address(payload.shipper)
+    recipient = lib.to_address(payload.recipient)
+    packages = lib.to_packages(payload.parcels)
+    has_origin = any(
+        [
+            payload.shipper.country_code,
+            settings.account_country_code,
+        ]
+    )
+    is_domicile = has_origin and (
+        payload.shipper.country_code == payload.recipient.country_code
+        or settings.account_country_code == payload.recipient.country_code
+    )
+    selected_services = [
+        s.service_code
+        for s in settings.shipping_services
+        if s.service_code in payload.services
+    ]
+
+    return [
+        (
+            f'{getattr(pkg, "id", idx)}',
+            get_package_rates(
+                index,
+                settings,
+                pkg,
+                shipper,
+                recipient,
+                is_domicile=is_domicile,
+                is_international=not is_domicile,
+                selected_services=selected_services,
+                required_features=required_features,
+            ),
+        )
+        for idx, pkg in enumerate(packages, 1)
+    ]
+
+
+def get_package_rates(
+    index: RateIndex,
+    settings,
+    package: units.Package,
+    shipper: units.ComputedAddress,
+    recipient: units.ComputedAddress,
+    **kwargs,
+):
+    """Rate a package with `get_available_rates` against the indexed zones."""
+    if not index.indexed:
+        return rating_proxy.get_available_rates(
+            package, shipper, recipient, settings, **kwargs
+        )
+
+    return rating_proxy.get_available_rates(
+        package,
+        shipper,
+        recipient,
+        _Settings(
+            settings,
+            index.shipping_services(
+                package, recipient, kwargs.get("selected_services") or []
+            ),
+        ),
+        **kwargs,
+    )
+
+
+class _Settings:
+    """Connection settings exposing narrowed down service levels."""
+
+    def __init__(self, settings, services: typing.List[models.ServiceLevel]):
+        self._settings = settings
+        self.shipping_services = services
+
+    def __getattr__(self, name: str):
+        return getattr(self._settings, name)
+
+
+def _rank(zone: models.ServiceZone, position: int) -> tuple:
+    # the `find_best_matching_zone` ordering, first zone first on ties
+    return (
+        -rating_proxy.calculate_zone_specificity(zone),
+        (zone.max_weight or INFINITY) - (zone.min_weight or 0),
+        zone.rate or 0.0,
+        position,
+    )
+
+
+def _digest(services: typing.List[models.ServiceLevel]) -> str:
+    # serializing a large rate sheet costs more than rating a package, so the
+    # digest is reused while the list still equals a copy taken when hashed
+    with _lock:
+        cached = _digests.get(id(services))
+
+    if cached is not None and cached[0] is services and cached[1] == services:
+        with _lock:
+            if id(services) in _digests:
+                _digests.move_to_end(id(services))
+
+        return cached[2]
+
+    digest = hashlib.sha256(repr(services).encode("utf-8")).hexdigest()
+
+    with _lock:
+        _digests[id(services)] = (services, copy.deepcopy(services), digest)
+
+        while len(_digests) > INDEX_CACHE_SIZE:
+            _digests.popitem(last=False)
+
+    return digest
+
+
+def _weight(value: typing.Optional[float], unit: str, default: float) -> float:
+    return default if value is None else units.Weight(value, unit).value
+
+
+_lock = threading.Lock()
+_indexes: typing.Dict[str, RateIndex] = collections.OrderedDict()
+_digests: typing.Dict[int, typing.Tuple[list, list, str]] = collections.OrderedDict()
@@ -15,13 +15,11 @@ def parse_tracking_response(
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _responses.deserialize()
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=_)
-            for _, response in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for _, response in responses
+        for message in error.parse_error_response(response, settings, tracking_number=_)
+    ]
     tracking_details = [
         _extract_details(details, settings)
         for _, details in responses
@@ -57,13 +55,8 @@ def _extract_details(
                 timestamp=lib.fiso_timestamp(
                     lib.text(event.dateSuivi, event.heureSuivi, separator=" ")
                 ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.codeSituationJustification in r.value
-                    ),
-                    None,
+                reason=provider_units.find_incident_reason(
+                    event.codeSituationJustification
                 ),
             )
             for event in contenu.listSuivis
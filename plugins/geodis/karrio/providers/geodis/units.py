@@ -1,3 +1,5 @@
+import typing
+import functools
 from itertools import count
 import karrio.lib as lib
 import karrio.core.units as units
@@ -57,6 +59,11 @@ class PackagingType(lib.StrEnum):
 class ConnectionConfig(lib.Enum):
     agency_code = lib.OptionEnum("agency_code")
 
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+
 
 class ShippingService(lib.StrEnum):
     """Carrier specific services"""
@@ -254,3 +261,16 @@ DEFAULT_SERVICES = [
         transit_days=6,
     ),
 ]
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
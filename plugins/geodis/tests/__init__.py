@@ -1,2 +1,3 @@
 from tests.geodis.test_tracking import *
 from tests.geodis.test_shipment import *
+from tests.geodis.test_rate import *
@@ -0,0 +1,119 @@
+"""Benchmark the GEODIS streaming rating of an order file.
+
+Run from the plugin directory with `python -m tests.geodis.bench_rate_batch`.
+"""
+
+import os
+import csv
+import time
+import random
+import tempfile
+import tracemalloc
+import karrio.lib as lib
+import karrio.core.models as models
+import karrio.universal.mappers.rating_proxy as rating_proxy
+from tests.geodis.fixture import gateway
+
+COUNTS = [2_000, 20_000]
+MIXIN_LIMIT = 2_000  # the mixin takes minutes at 20k
+COUNTRIES = ["FR", "DE", "GB", "US", "BE", "ES", "IT", "NL"]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for count in COUNTS:
+            path = os.path.join(directory, f"orders-{count}.csv")
+            write_orders(path, count)
+
+            for name, rate in [
+                ("get_rates_batch", _batch),
+                ("mapper/proxy round trip", _round_trip),
+                ("RatingMixinProxy", _mixin),
+            ]:
+                if rate is _mixin and count > MIXIN_LIMIT:
+                    continue
+
+                start = time.perf_counter()
+                quotes = rate(path)
+                elapsed = time.perf_counter() - start
+                peak = _peak_allocation(lambda: rate(path))
+
+                print(
+                    f"{count:>6,} orders ({name}): {count / elapsed:,.0f} orders/s, "
+                    f"{quotes:,} quotes, {peak / 2 ** 20:.2f} MiB peak allocation"
+                )
+
+
+def write_orders(path: str, count: int):
+    generator = random.Random(0)
+
+    with open(path, "w", newline="") as output:
+        writer = csv.writer(output)
+        writer.writerow(["recipient_country", "weight"])
+        writer.writerows(
+            [generator.choice(COUNTRIES), f"{generator.uniform(0.1, 100):.2f}"]
+            for _ in range(count)
+        )
+
+
+def read_orders(path: str):
+    with open(path, newline="") as orders:
+        for row in csv.DictReader(orders):
+            yield dict(
+                shipper=dict(country_code="FR"),
+                recipient=dict(country_code=row["recipient_country"]),
+                parcels=[dict(weight=float(row["weight"]), weight_unit="KG")],
+            )
+
+
+def _batch(path: str) -> int:
+    return sum(
+        len(rates) for rates, _ in gateway.proxy.get_rates_batch(read_orders(path))
+    )
+
+
+def _round_trip(path: str) -> int:
+    return sum(
+        len(
+            gateway.mapper.parse_rate_response(
+                gateway.proxy.get_rates(
+                    gateway.mapper.create_rate_request(
+                        lib.to_object(models.RateRequest, _)
+                    )
+                )
+            )[0]
+        )
+        for _ in read_orders(path)
+    )
+
+
+def _mixin(path: str) -> int:
+    return sum(
+        len(
+            gateway.mapper.parse_rate_response(
+                rating_proxy.RatingMixinProxy.get_rates(
+                    gateway.proxy,
+                    gateway.mapper.create_rate_request(
+                        lib.to_object(models.RateRequest, _)
+                    ),
+                )
+            )[0]
+        )
+        for _ in read_orders(path)
+    )
+
+
+def _peak_allocation(func) -> int:
+    tracemalloc.start()
+
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+if __name__ == "__main__":
+    main()
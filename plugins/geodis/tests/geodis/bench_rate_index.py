@@ -0,0 +1,74 @@
+"""Benchmark the GEODIS rate index against the rating mixin.
+
+Run from the plugin directory with `python -m tests.geodis.bench_rate_index`.
+"""
+
+import time
+import random
+import timeit
+import karrio.lib as lib
+import karrio.sdk as karrio
+import karrio.core.models as models
+import karrio.universal.mappers.rating_proxy as rating_proxy
+import karrio.providers.geodis.rate_index as provider_rate_index
+from tests.geodis.fixture import gateway
+
+COUNT = 2_000
+COUNTRIES = ["FR", "DE", "GB", "US", "BE", "ES", "IT", "NL"]
+
+
+def main():
+    config = lib.to_dict(gateway.settings)
+    generator = random.Random(0)
+    requests = [
+        gateway.mapper.create_rate_request(
+            models.RateRequest(
+                shipper=dict(country_code="FR"),
+                recipient=dict(country_code=generator.choice(COUNTRIES)),
+                parcels=[dict(weight=generator.uniform(0.1, 100), weight_unit="KG")],
+            )
+        )
+        for _ in range(COUNT)
+    ]
+
+    for name, get_rates in [
+        (
+            "mixin",
+            lambda: [
+                rating_proxy.RatingMixinProxy.get_rates(gateway.proxy, _)
+                for _ in requests
+            ],
+        ),
+        ("rate index", lambda: [gateway.proxy.get_rates(_) for _ in requests]),
+    ]:
+        print(f"get_rates x {COUNT:,} ({name}): {_best(get_rates) * 1000:.1f} ms")
+
+    # every new gateway parses its own copy of the same rate sheet
+    services = [
+        karrio.gateway["geodis"].create(config).settings.shipping_services
+        for _ in range(5)
+    ]
+    first_lookups = []
+
+    for _ in services:
+        start = time.perf_counter()
+        provider_rate_index.rate_index(_)
+        first_lookups.append(time.perf_counter() - start)
+
+    print(
+        "rate index build: "
+        f"{_best(lambda: provider_rate_index.RateIndex(services[0])) * 1000:.1f} ms"
+    )
+    print(f"rate index, new gateway: {min(first_lookups) * 1000:.1f} ms")
+    print(
+        "rate index, same gateway: "
+        f"{_best(lambda: provider_rate_index.rate_index(services[0]), 1000) * 1e6:.1f} µs"
+    )
+
+
+def _best(func, number: int = 1) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 """Karrio HayPost client proxy."""
 
+import typing
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.hay_post.fanout as provider_fanout
 import karrio.mappers.hay_post.settings as provider_settings
 
 
@@ -43,19 +45,28 @@ class Proxy(proxy.Proxy):
         return lib.Deserializable(response, lib.to_dict)
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        query = request.serialize()
-        trackingnumber = query[0]
+        authorization = self.settings.authorization
+        track = lambda tracking_number: (
+            tracking_number,
+            provider_fanout.request(
+                self.settings,
+                url=f"{self.settings.server_url}/Api/Order/Tracking/{tracking_number}",
+                trace=self.trace_as("json"),
+                method="GET",
+                proxy=self.settings.proxy,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                    "Authorization": authorization,
+                },
+            ),
+        )
 
-        response = lib.request(
-            url=f"{self.settings.server_url}/Api/Order/Tracking/{trackingnumber}",
-            trace=self.trace_as("json"),
-            method="GET",
-            proxy=self.settings.proxy,
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "Authorization": self.settings.authorization,
-            },
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, track, request.serialize()
         )
 
-        return lib.Deserializable(response, lib.to_dict)
+        return lib.Deserializable(
+            responses,
+            lambda response: [(key, lib.to_dict(res)) for key, res in response],
+        )
@@ -10,14 +10,22 @@ from datetime import datetime
 
 
 def parse_tracking_response(
-    _response: lib.Deserializable[dict],
+    _response: lib.Deserializable[typing.List[typing.Tuple[str, dict]]],
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
-    response = _response.deserialize()
+    responses = _response.deserialize()
 
-    messages = error.parse_error_response(response, settings)
+    messages: typing.List[models.Message] = [
+        message
+        for number, response in responses
+        for message in error.parse_error_response(
+            response, settings, tracking_number=number
+        )
+    ]
     tracking_details = [
-        _extract_details(response, settings) if response.get("key") is None else None
+        _extract_details(response, settings)
+        for _, response in responses
+        if response.get("key") is None and response.get("order") is not None
     ]
 
     return tracking_details, messages
@@ -29,13 +37,8 @@ def _extract_details(
 ) -> models.TrackingDetails:
     detail = lib.to_object(hay_post.OrderTrackingResponseType, data)
 
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if detail.order.stateId in status.value
-        ),
-        provider_units.TrackingStatus.delivered.name,
+    status = provider_units.find_tracking_status(
+        detail.order.stateId, provider_units.TrackingStatus.delivered.name
     )
 
     return models.TrackingDetails(
@@ -67,22 +70,8 @@ def _extract_details(
                 time=lib.fdate(detail.order.createDate, "%Y-%m-%dT%H:%M:%S"),
                 location=detail.orderDestinationAddress.address,
                 timestamp=lib.fiso_timestamp(detail.order.createDate, current_format="%Y-%m-%dT%H:%M:%S"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if detail.order.stateId in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if detail.order.stateId in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(detail.order.stateId),
+                reason=provider_units.find_incident_reason(detail.order.stateId),
             )
         ],
         delivered=status == "delivered",
@@ -36,12 +36,93 @@ class TestHayPostTracking(unittest.TestCase):
 
             self.assertListEqual(lib.to_dict(parsed_response), ParsedTrackingResponse)
 
+    def test_get_tracking_batches(self):
+        for size in [1, 50, 500]:
+            with self.subTest(size=size), patch(
+                "karrio.mappers.hay_post.proxy.lib.request"
+            ) as mock:
+                tracking_numbers = create_tracking_numbers(size)
+                mock.side_effect = mock_tracking_request
+                karrio.Tracking.fetch(
+                    models.TrackingRequest(tracking_numbers=tracking_numbers)
+                ).from_(gateway)
+
+                urls = [call[1]["url"] for call in mock.call_args_list]
+                token_urls = [url for url in urls if "Connect/Token" in url]
+
+                self.assertEqual(len(token_urls), 1)
+                self.assertListEqual(
+                    sorted(url for url in urls if url not in token_urls),
+                    sorted(
+                        f"{gateway.settings.server_url}/Api/Order/Tracking/{number}"
+                        for number in tracking_numbers
+                    ),
+                )
+
+    def test_parse_tracking_batches(self):
+        for size in [1, 50, 500]:
+            with self.subTest(size=size), patch(
+                "karrio.mappers.hay_post.proxy.lib.request"
+            ) as mock:
+                tracking_numbers = create_tracking_numbers(size)
+                mock.side_effect = mock_tracking_request
+                tracking_details, messages = (
+                    karrio.Tracking.fetch(
+                        models.TrackingRequest(tracking_numbers=tracking_numbers)
+                    )
+                    .from_(gateway)
+                    .parse()
+                )
+
+                self.assertListEqual(
+                    [details.tracking_number for details in tracking_details],
+                    tracking_numbers,
+                )
+                self.assertListEqual(messages, [])
+
+    def test_parse_tracking_batch_errors(self):
+        with patch("karrio.mappers.hay_post.proxy.lib.request") as mock:
+            mock.side_effect = mock_tracking_request
+            tracking_details, messages = (
+                karrio.Tracking.fetch(
+                    models.TrackingRequest(
+                        tracking_numbers=[TrackingNumber, UnknownTrackingNumber]
+                    )
+                )
+                .from_(gateway)
+                .parse()
+            )
+
+            self.assertListEqual(
+                [details.tracking_number for details in tracking_details],
+                [TrackingNumber],
+            )
+            self.assertListEqual(lib.to_dict(messages), ParsedTrackingErrors)
+
+
+def create_tracking_numbers(size: int):
+    return [f"PAS{index:09d}AM" for index in range(size)]
+
+
+def mock_tracking_request(url: str, **kwargs):
+    if "Connect/Token" in url:
+        return '{"accessToken": "token"}'
+
+    tracking_number = url.split("/")[-1]
+
+    if tracking_number == UnknownTrackingNumber:
+        return TrackingErrorResponse
+
+    return TrackingResponse.replace(TrackingNumber, tracking_number)
+
 
 if __name__ == "__main__":
     unittest.main()
 
 TrackingNumber = "PAS105759416AM"
 
+UnknownTrackingNumber = "PAS999999999AM"
+
 TrackingPayload = {
     "tracking_numbers": [TrackingNumber],
 }
@@ -228,3 +309,18 @@ ParsedTrackingResponse = [
     ],
     []
 ]
+
+TrackingErrorResponse = """{
+    "key": "order_not_found"
+}
+"""
+
+ParsedTrackingErrors = [
+    {
+        "carrier_id": "hay_post",
+        "carrier_name": "hay_post",
+        "code": "error",
+        "details": {"tracking_number": "PAS999999999AM"},
+        "message": "Order not found",
+    }
+]
@@ -8,7 +8,9 @@ import karrio.lib as lib
 import karrio.api.proxy as proxy
 import karrio.core.errors as errors
 import karrio.core.models as models
+import karrio.providers.locate2u.rate_index as provider_rate_index
 import karrio.providers.locate2u.error as provider_error
+import karrio.providers.locate2u.fanout as provider_fanout
 import karrio.mappers.locate2u.settings as provider_settings
 import karrio.universal.mappers.rating_proxy as rating_proxy
 
@@ -77,7 +79,15 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
         return lib.Deserializable(token.get_state())
 
     def get_rates(self, request: lib.Serializable) -> lib.Deserializable:
-        return super().get_rates(request)
+        return provider_rate_index.get_rates(self.settings, request)
+
+    def get_rates_batch(
+        self, payloads: typing.Iterable[typing.Union[models.RateRequest, dict]]
+    ) -> typing.Iterator[
+        typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]
+    ]:
+        """Lazily rate a stream of rate requests against one rate index."""
+        return provider_rate_index.get_rates_batch(self.settings, payloads)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
         access_token = self.authenticate().deserialize()
@@ -116,7 +126,8 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
         access_token = self.authenticate().deserialize()
 
         def _get_tracking(stop_id: str):
-            return stop_id, lib.request(
+            return stop_id, provider_fanout.request(
+                self.settings,
                 url=f"{self.settings.server_url}/api/v1/stops/{stop_id}?includeItems=false&includeLines=false",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -127,8 +138,8 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
                 on_error=provider_error.parse_http_response,
             )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_concurently(
-            _get_tracking, request.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, _get_tracking, request.serialize()
         )
         return lib.Deserializable(
             responses,
@@ -27,3 +27,19 @@ class Settings(core.Settings):
     @property
     def auth_server_url(self):
         return "https://id.locate2u.com"
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """Locate2u connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
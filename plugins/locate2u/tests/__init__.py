@@ -1,3 +1,4 @@
 from tests.locate2u.test_authentication import *
 from tests.locate2u.test_tracking import *
 from tests.locate2u.test_shipment import *
+from tests.locate2u.test_rate import *
@@ -0,0 +1,104 @@
+import unittest
+from .fixture import gateway
+
+import karrio.lib as lib
+import karrio.sdk as karrio
+import karrio.core.models as models
+import karrio.universal.mappers.rating_proxy as rating_proxy
+import karrio.providers.locate2u.rate_index as provider_rate_index
+
+
+class TestLocate2uRating(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_get_rates_matches_rating_mixin(self):
+        service_code = gateway.settings.shipping_services[0].service_code
+
+        for country_code in ['AU', 'NZ']:
+            for weight, services in [
+                *[(_, []) for _ in [0.1, 0.5, 1, 2.5, 10, 29.9, 30, 100]],
+                (1, [service_code]),
+                (100, [service_code]),
+            ]:
+                request = gateway.mapper.create_rate_request(
+                    models.RateRequest(
+                        shipper=dict(country_code="AU"),
+                        recipient=dict(country_code=country_code),
+                        parcels=[dict(weight=weight, weight_unit="KG")],
+                        services=services,
+                    )
+                )
+
+                self.assertListEqual(
+                    lib.to_dict(gateway.proxy.get_rates(request).deserialize()),
+                    lib.to_dict(
+                        rating_proxy.RatingMixinProxy.get_rates(
+                            gateway.proxy, request
+                        ).deserialize()
+                    ),
+                )
+
+    def test_get_rates_batch(self):
+        payloads = [
+            dict(
+                shipper=dict(country_code="AU"),
+                recipient=dict(country_code=country_code),
+                parcels=[dict(weight=weight, weight_unit="KG")],
+            )
+            for country_code in ["DE", "AU"]
+            for weight in [0.5, 10, 100]
+        ]
+
+        batch = gateway.proxy.get_rates_batch(iter(payloads))
+
+        self.assertFalse(isinstance(batch, list))
+        self.assertListEqual(
+            [lib.to_dict(_) for _ in batch],
+            [
+                lib.to_dict(
+                    gateway.mapper.parse_rate_response(
+                        gateway.proxy.get_rates(
+                            gateway.mapper.create_rate_request(
+                                lib.to_object(models.RateRequest, payload)
+                            )
+                        )
+                    )
+                )
+                for payload in payloads
+            ],
+        )
+
+    def test_rate_index_is_shared_by_gateways_with_the_same_services(self):
+        config = lib.to_dict(gateway.settings)
+        first, second = [karrio.gateway["locate2u"].create(config) for _ in range(2)]
+        index = provider_rate_index.rate_index(first.settings.shipping_services)
+
+        self.assertIsNot(
+            first.settings.shipping_services, second.settings.shipping_services
+        )
+        self.assertIs(
+            provider_rate_index.rate_index(second.settings.shipping_services), index
+        )
+
+    def test_rate_index_is_rebuilt_when_services_change(self):
+        config = lib.to_dict(gateway.settings)
+        index = provider_rate_index.rate_index(gateway.settings.shipping_services)
+        config["services"][0]["service_name"] = "changed"
+        changed = karrio.gateway["locate2u"].create(config)
+
+        self.assertIsNot(
+            provider_rate_index.rate_index(changed.settings.shipping_services), index
+        )
+
+    def test_rate_index_is_rebuilt_when_services_change_in_place(self):
+        config = lib.to_dict(gateway.settings)
+        services = karrio.gateway["locate2u"].create(config).settings.shipping_services
+        index = provider_rate_index.rate_index(services)
+        services[0].service_name = "changed"
+
+        self.assertIsNot(provider_rate_index.rate_index(services), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 """Karrio Nationex client proxy."""
 
 import typing
+import base64
+import urllib.parse
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.nationex.fanout as provider_fanout
 import karrio.mappers.nationex.settings as provider_settings
 
 
@@ -33,10 +36,12 @@ class Proxy(proxy.Proxy):
             headers={"Authorization": f"Basic {self.settings.authorization}"},
         )
 
+        label = self._retrieve_label(lib.to_dict(response), payload["label"])
+
         return lib.Deserializable(
             response,
             lib.to_dict,
-            dict(label=payload["label"]),
+            dict(label=label, label_type=payload["label"]["type"]),
         )
 
     def cancel_shipment(self, request: lib.Serializable) -> lib.Deserializable:
@@ -52,7 +57,8 @@ class Proxy(proxy.Proxy):
     def get_tracking(self, requests: lib.Serializable) -> lib.Deserializable:
         track = lambda shipment_id: (
             shipment_id,
-            lib.request(
+            provider_fanout.request(
+                self.settings,
                 url=f"{self.settings.server_url}/Shipments/{shipment_id}?tracking=true",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -60,11 +66,35 @@ class Proxy(proxy.Proxy):
             ),
         )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_asynchronously(
-            track, requests.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, track, requests.serialize()
         )
 
         return lib.Deserializable(
             responses,
             lambda response: [(key, lib.to_dict(res)) for key, res in response],
         )
+
+    def _retrieve_label(self, shipment: dict, options: dict) -> typing.Optional[str]:
+        """Download the base64 encoded label of a created shipment."""
+        # error responses are lists of messages
+        shipment_id = lib.identity(
+            shipment.get("ShipmentId") if isinstance(shipment, dict) else None
+        )
+
+        if shipment_id is None:
+            return None
+
+        # the label is not traced as the trace would hold the whole body, and
+        # a network error leaves the shipment without a label.
+        try:
+            return provider_fanout.request(
+                self.settings,
+                url=f"{self.settings.server_url}/Shipments/{shipment_id}/labels?{urllib.parse.urlencode(options)}",
+                method="GET",
+                headers={"Authorization": f"Basic {self.settings.authorization}"},
+                decoder=lambda _: lib.decode(base64.b64encode(_)),
+                on_error=lambda _: None,
+            )
+        except OSError:
+            return None
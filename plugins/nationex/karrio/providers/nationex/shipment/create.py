@@ -1,8 +1,6 @@
 import karrio.schemas.nationex.shipment_request as nationex
 import karrio.schemas.nationex.shipment_response as shipping
 import typing
-import base64
-import urllib.parse
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
@@ -32,21 +30,14 @@ def _extract_details(
     ctx: dict,
 ) -> models.ShipmentDetails:
     shipment = lib.to_object(shipping.ShipmentResponseType, data)
-    query = urllib.parse.urlencode(ctx["label"])
-    label = lib.failsafe(
-        lambda: lib.request(
-            url=f"{settings.base_url}/Shipments/{shipment.ShipmentId}/labels?{query}",
-            decoder=lambda _: lib.decode(base64.encodebytes(_)),
-        )
-    )
 
     return models.ShipmentDetails(
         carrier_id=settings.carrier_id,
         carrier_name=settings.carrier_name,
         tracking_number=str(shipment.ShipmentId),
         shipment_identifier=str(shipment.ShipmentId),
-        label_type=ctx["label"]["type"],
-        docs=models.Documents(label=label),
+        label_type=ctx["label_type"],
+        docs=models.Documents(label=ctx.get("label")),
         meta=dict(
             tracking_numbers=shipment.ParcelIds,
         ),
@@ -13,13 +13,11 @@ def parse_tracking_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _responses.deserialize()
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(res, settings, tracking_number=number)
-            for number, res in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for number, res in responses
+        for message in error.parse_error_response(res, settings, tracking_number=number)
+    ]
     tracking_details = [
         _extract_details(res, settings)
         for _, res in responses
@@ -34,13 +32,8 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
     shipment = lib.to_object(nationex.TrackingResponseType, data)
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if shipment.ShipmentStatus in status.value
-        ),
-        provider_units.TrackingStatus.in_transit.name,
+    status = provider_units.find_tracking_status(
+        shipment.ShipmentStatus, provider_units.TrackingStatus.in_transit.name
     )
 
     return models.TrackingDetails(
@@ -63,22 +56,8 @@ def _extract_details(
                 latitude=None,
                 longitude=None,
                 timestamp=lib.fiso_timestamp(event.StatusDate, current_format="%Y-%m-%dT%H:%M:%SZ"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.ShipmentStatus in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.ShipmentStatus in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.ShipmentStatus),
+                reason=provider_units.find_incident_reason(event.ShipmentStatus),
             )
             for event in shipment.StatusHistories
         ],
@@ -33,3 +33,19 @@ class Settings(core.Settings):
     def authorization(self):
         pair = "%s:%s" % (self.customer_id, self.api_key)
         return base64.b64encode(pair.encode("utf-8")).decode("ascii")
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """Nationex connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
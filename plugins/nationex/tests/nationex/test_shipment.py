@@ -38,6 +38,51 @@ class TestNationexShipping(unittest.TestCase):
                 f"{gateway.settings.server_url}/Shipments",
             )
 
+    def test_create_shipment_retrieves_label(self):
+        with patch("karrio.mappers.nationex.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, "JVBERi0xLjQ="]
+            response = karrio.Shipment.create(self.ShipmentRequest).from_(gateway)
+
+            self.assertEqual(
+                mock.call_args[1]["url"],
+                f"{gateway.settings.server_url}/Shipments/501883938/labels?type=PDF&orientation=portrait&format=4x6",
+            )
+            self.assertEqual(
+                lib.to_dict(response.parse())[0]["docs"], {"label": "JVBERi0xLjQ="}
+            )
+            self.assertNotIn("trace", mock.call_args[1])
+
+    def test_create_shipment_without_label_on_network_error(self):
+        request = gateway.mapper.create_shipment_request(self.ShipmentRequest)
+
+        with patch("karrio.mappers.nationex.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, ConnectionResetError()]
+            response = gateway.proxy.create_shipment(request)
+
+            self.assertEqual(mock.call_count, 2)
+            self.assertIsNone(response.ctx["label"])
+
+    def test_create_shipment_raises_unexpected_label_errors(self):
+        request = gateway.mapper.create_shipment_request(self.ShipmentRequest)
+
+        with patch("karrio.mappers.nationex.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, RuntimeError("bug")]
+
+            with self.assertRaises(RuntimeError):
+                gateway.proxy.create_shipment(request)
+
+    def test_create_shipment_skips_label_on_error_list(self):
+        with patch("karrio.mappers.nationex.proxy.lib.request") as mock:
+            mock.return_value = ShipmentErrorResponse
+            parsed_response = (
+                karrio.Shipment.create(self.ShipmentRequest).from_(gateway).parse()
+            )
+
+            self.assertEqual(mock.call_count, 1)
+            self.assertListEqual(
+                lib.to_dict(parsed_response), ParsedShipmentErrorResponse
+            )
+
     def test_cancel_shipment(self):
         with patch("karrio.mappers.nationex.proxy.lib.request") as mock:
             mock.return_value = "{}"
@@ -138,6 +183,19 @@ ParsedShipmentResponse = [
     [],
 ]
 
+ParsedShipmentErrorResponse = [
+    None,
+    [
+        {
+            "carrier_id": "nationex",
+            "carrier_name": "nationex",
+            "code": 400,
+            "details": {},
+            "message": "The Sender PostalCode is invalid",
+        }
+    ],
+]
+
 ParsedCancelShipmentResponse = [
     {
         "carrier_id": "nationex",
@@ -331,5 +389,13 @@ ShipmentResponse = """{
 }
 """
 
+ShipmentErrorResponse = """[
+  {
+    "code": 400,
+    "message": "The Sender PostalCode is invalid"
+  }
+]
+"""
+
 ShipmentCancelResponse = """{}
 """
@@ -1,7 +1,11 @@
 """Karrio Roadie client proxy."""
 
+import typing
+import base64
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.roadie.utils as provider_utils
+import karrio.providers.roadie.fanout as provider_fanout
 import karrio.mappers.roadie.settings as provider_settings
 
 
@@ -33,8 +37,9 @@ class Proxy(proxy.Proxy):
                 "Authorization": f"Bearer {self.settings.api_key}",
             },
         )
+        label = self._retrieve_label(lib.to_dict(response))
 
-        return lib.Deserializable(response, lib.to_dict)
+        return lib.Deserializable(response, lib.to_dict, dict(label=label))
 
     def cancel_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         response = lib.request(
@@ -50,15 +55,60 @@ class Proxy(proxy.Proxy):
         return lib.Deserializable(response, lib.to_dict)
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable:
-        ids = ",".join(request.serialize())
-        response = lib.request(
-            url=f"{self.settings.server_url}/v1/shipments?ids={ids}",
-            trace=self.trace_as("json"),
-            method="GET",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.settings.api_key}",
-            },
+        url = lambda ids: f"{self.settings.server_url}/v1/shipments?ids={','.join(ids)}"
+
+        def track(ids: typing.List[str]):
+            # a network failure only fails its own chunk
+            try:
+                return ids, provider_fanout.request(
+                    self.settings,
+                    url=url(ids),
+                    trace=self.trace_as("json"),
+                    method="GET",
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {self.settings.api_key}",
+                    },
+                )
+            except OSError:
+                return ids, None
+
+        responses: typing.List[typing.Tuple[typing.List[str], str]] = (
+            provider_fanout.run(
+                self.settings,
+                track,
+                provider_fanout.chunk(self.settings, request.serialize(), url),
+            )
         )
 
-        return lib.Deserializable(response, lib.to_dict)
+        return lib.Deserializable(
+            responses,
+            lambda responses: [
+                _
+                for ids, res in responses
+                for _ in provider_utils.decode_tracking(ids, res)
+            ],
+        )
+
+    def _retrieve_label(self, shipment: dict) -> typing.Optional[str]:
+        """Download the base64 encoded PDF label of a created shipment."""
+        shipment_id = lib.identity(
+            shipment.get("id") if isinstance(shipment, dict) else None
+        )
+
+        if shipment_id is None:
+            return None
+
+        # the label is not traced as the trace would hold the whole body, and
+        # a network error leaves the shipment without a label.
+        try:
+            return provider_fanout.request(
+                self.settings,
+                url=f"{self.settings.server_url}/v1/shipments/{shipment_id}/label?format=PDF",
+                method="GET",
+                headers={"Authorization": f"Bearer {self.settings.api_key}"},
+                decoder=lambda _: lib.decode(base64.b64encode(_)),
+                on_error=lambda _: None,
+            )
+        except OSError:
+            return None
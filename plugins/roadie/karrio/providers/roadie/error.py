@@ -10,13 +10,11 @@ def parse_error_response(
     settings: provider_utils.Settings,
     **kwargs,
 ) -> typing.List[models.Message]:
-    responses: typing.List[dict] = sum(
-        [
-            res.get("errors", [])
-            for res in (response if isinstance(response, list) else [response])
-        ],
-        start=[],
-    )
+    responses: typing.List[dict] = [
+        error
+        for res in (response if isinstance(response, list) else [response])
+        for error in res.get("errors", [])
+    ]
     errors = [lib.to_object(roadie.ErrorElement, res) for res in responses]
 
     return [
@@ -2,7 +2,6 @@ import datetime
 import karrio.schemas.roadie.shipment_request as roadie
 import karrio.schemas.roadie.shipment_response as shipping
 import typing
-import base64
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
@@ -17,8 +16,10 @@ def parse_shipment_response(
 ) -> typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]:
     response = _response.deserialize()
     messages = error.parse_error_response(response, settings)
-    shipment = (
-        _extract_details(response, settings) if response.get("errors") is None else None
+    shipment = lib.identity(
+        _extract_details(response, settings, _response.ctx)
+        if response.get("errors") is None
+        else None
     )
 
     return shipment, messages
@@ -27,14 +28,10 @@ def parse_shipment_response(
 def _extract_details(
     data: dict,
     settings: provider_utils.Settings,
+    ctx: dict = None,
 ) -> models.ShipmentDetails:
     shipment = lib.to_object(shipping.ShipmentResponse, data)
-    label = lib.failsafe(
-        lambda: lib.request(
-            url=f"{settings.base_url}/v1/shipments/{shipment.id}/label?format=PDF",
-            decoder=lambda _: base64.encodebytes(_).decode("utf-8"),
-        )
-    )
+    label = (ctx or {}).get("label")
 
     return models.ShipmentDetails(
         carrier_id=settings.carrier_id,
@@ -30,13 +30,8 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
     shipment = lib.to_object(roadie.Shipment, data)
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if shipment.events[0].name in status.value
-        ),
-        provider_units.TrackingStatus.in_transit.name,
+    status = provider_units.find_tracking_status(
+        shipment.events[0].name, provider_units.TrackingStatus.in_transit.name
     )
 
     return models.TrackingDetails(
@@ -53,22 +48,8 @@ def _extract_details(
                 latitude=getattr(event.location, "latitude", None),
                 longitude=getattr(event.location, "longitude", None),
                 timestamp=lib.fiso_timestamp(event.occurred_at, current_format="%Y-%m-%dT%H:%M:%S.%fZ"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event.name in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.name in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event.name),
+                reason=provider_units.find_incident_reason(event.name),
             )
             for event in shipment.events
         ],
@@ -1,3 +1,5 @@
+import typing
+import karrio.lib as lib
 import karrio.core as core
 
 
@@ -17,3 +19,43 @@ class Settings(core.Settings):
     @property
     def tracking_url(self):
         return "https://track.roadie.com/id/{}"
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+def decode_tracking(ids: typing.List[str], response: str) -> typing.List[dict]:
+    """Decode a tracking chunk response, standing in an error for a failed chunk."""
+    try:
+        data = None if response is None else lib.to_dict(response)
+    except ValueError:
+        data = None
+
+    if data is None:
+        return [
+            dict(
+                errors=[
+                    dict(
+                        code="tracking_request_failed",
+                        message=f"Tracking request failed for {', '.join(ids)}",
+                    )
+                ]
+            )
+        ]
+
+    return data if isinstance(data, list) else [data]
+
+
+class ConnectionConfig(lib.Enum):
+    """Roadie connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
+    max_batch_size = lib.OptionEnum("max_batch_size", int)
+    max_url_length = lib.OptionEnum("max_url_length", int)
@@ -1,3 +1,4 @@
 from tests.roadie.test_rate import *
 from tests.roadie.test_tracking import *
 from tests.roadie.test_shipment import *
+from tests.roadie.test_fanout import *
@@ -0,0 +1,151 @@
+import json
+import threading
+import unittest
+import http.server
+import urllib.error
+import urllib.parse
+from unittest.mock import patch, PropertyMock
+from .test_tracking import TrackingResponse
+
+import karrio.lib as lib
+import karrio.sdk as karrio
+import karrio.core.models as models
+import karrio.mappers.roadie as provider
+import karrio.providers.roadie.fanout as fanout
+
+
+class TestRoadieTrackingChunks(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.server = StubServer()
+        self.patcher = patch.object(
+            provider.Settings,
+            "server_url",
+            new_callable=PropertyMock,
+            return_value=f"http://127.0.0.1:{self.server.server_port}",
+        )
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.server.stop()
+
+    def test_get_tracking_chunks_ids(self):
+        for count, requests in [(1, 1), (100, 2), (2000, 40)]:
+            self.server.requests.clear()
+            ids = [f"{_:06}" for _ in range(count)]
+
+            details, messages = track(create_gateway(), ids)
+
+            self.assertListEqual([_.tracking_number for _ in details], ids)
+            self.assertListEqual(messages, [])
+            self.assertEqual(len(self.server.requests), requests)
+            self.assertTrue(
+                all(len(_) <= fanout.DEFAULT_MAX_BATCH_SIZE for _ in self.server.requests)
+            )
+
+    def test_get_tracking_chunks_by_url_length(self):
+        gateway = create_gateway(max_url_length=100)
+        ids = [f"{_:020}" for _ in range(100)]
+
+        details, _ = track(gateway, ids)
+
+        self.assertListEqual([_.tracking_number for _ in details], ids)
+        self.assertTrue(all(len(_) <= 2 for _ in self.server.requests))
+        self.assertTrue(all(len(_) <= 100 for _ in self.server.urls))
+
+    def test_failed_chunk_does_not_fail_the_others(self):
+        ids = [f"{_:06}" for _ in range(100)]
+        ids[60] = "FAILED"
+
+        details, messages = track(create_gateway(), ids)
+
+        self.assertListEqual([_.tracking_number for _ in details], ids[:50])
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].code, "tracking_request_failed")
+        self.assertIn("FAILED", messages[0].message)
+
+    def test_network_error_fails_its_chunk_only(self):
+        ids = [f"{_:06}" for _ in range(100)]
+        ids[60] = "UNREACHABLE"
+        request = fanout.request
+
+        def send(settings, **kwargs):
+            if "UNREACHABLE" in kwargs["url"]:
+                raise urllib.error.URLError("connection refused")
+
+            return request(settings, **kwargs)
+
+        with patch.object(fanout, "request", side_effect=send):
+            details, messages = track(create_gateway(), ids)
+
+        self.assertListEqual([_.tracking_number for _ in details], ids[:50])
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].code, "tracking_request_failed")
+        self.assertIn("UNREACHABLE", messages[0].message)
+
+    def test_unexpected_error_is_raised(self):
+        with patch.object(fanout, "request", side_effect=KeyError("server_url")):
+            with self.assertRaises(KeyError):
+                track(create_gateway(), ["000001"])
+
+
+def create_gateway(**config):
+    return karrio.gateway["roadie"].create(dict(api_key="api_key", config=config))
+
+
+def track(gateway, ids):
+    return gateway.mapper.parse_tracking_response(
+        gateway.proxy.get_tracking(
+            gateway.mapper.create_tracking_request(
+                models.TrackingRequest(tracking_numbers=ids)
+            )
+        )
+    )
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests = []
+        self.urls = []
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs=dict(poll_interval=0.05), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        ids = query["ids"][0].split(",")
+        self.server.requests.append(ids)
+        self.server.urls.append(
+            f"http://127.0.0.1:{self.server.server_port}{self.path}"
+        )
+
+        if "FAILED" in ids:
+            status, payload = 414, b"<html>URI Too Long</html>"
+        else:
+            shipment = lib.to_dict(TrackingResponse)[0]
+            status, payload = 200, json.dumps(
+                [{**shipment, "tracking_number": _} for _ in ids]
+            ).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
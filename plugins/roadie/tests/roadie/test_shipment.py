@@ -37,6 +37,39 @@ class TestRoadieShipping(unittest.TestCase):
                 f"{gateway.settings.server_url}/v1/shipments",
             )
 
+    def test_create_shipment_retrieves_label(self):
+        with patch("karrio.mappers.roadie.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, "JVBERi0xLjQ="]
+            response = karrio.Shipment.create(self.ShipmentRequest).from_(gateway)
+
+            self.assertEqual(
+                mock.call_args[1]["url"],
+                f"{gateway.settings.server_url}/v1/shipments/152040/label?format=PDF",
+            )
+            self.assertEqual(
+                lib.to_dict(response.parse())[0]["docs"], {"label": "JVBERi0xLjQ="}
+            )
+            self.assertNotIn("trace", mock.call_args[1])
+
+    def test_create_shipment_without_label_on_network_error(self):
+        request = gateway.mapper.create_shipment_request(self.ShipmentRequest)
+
+        with patch("karrio.mappers.roadie.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, ConnectionResetError()]
+            response = gateway.proxy.create_shipment(request)
+
+            self.assertEqual(mock.call_count, 2)
+            self.assertIsNone(response.ctx["label"])
+
+    def test_create_shipment_raises_unexpected_label_errors(self):
+        request = gateway.mapper.create_shipment_request(self.ShipmentRequest)
+
+        with patch("karrio.mappers.roadie.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, RuntimeError("bug")]
+
+            with self.assertRaises(RuntimeError):
+                gateway.proxy.create_shipment(request)
+
     def test_cancel_shipment(self):
         with patch("karrio.mappers.roadie.proxy.lib.request") as mock:
             mock.return_value = "{}"
@@ -49,7 +82,7 @@ class TestRoadieShipping(unittest.TestCase):
 
     def test_parse_shipment_response(self):
         with patch("karrio.mappers.roadie.proxy.lib.request") as mock:
-            mock.return_value = ShipmentResponse
+            mock.side_effect = [ShipmentResponse, ""]
             parsed_response = (
                 karrio.Shipment.create(self.ShipmentRequest).from_(gateway).parse()
             )
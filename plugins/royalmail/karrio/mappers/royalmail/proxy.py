@@ -4,10 +4,10 @@ from karrio.core.utils import (
     request as http,
     Serializable,
     Deserializable,
-    exec_async,
 )
 from karrio.api.proxy import Proxy as BaseProxy
 from karrio.mappers.royalmail.settings import Settings
+import karrio.providers.royalmail.fanout as provider_fanout
 
 
 class Proxy(BaseProxy):
@@ -17,7 +17,9 @@ class Proxy(BaseProxy):
 
     def get_tracking(self, request: Serializable) -> Deserializable:
         def _get_tracking(mail_piece_id: str):
-            return http(
+            return provider_fanout.request(
+                self.settings,
+                send=http,
                 url=f"{self.settings.server_url}/mailpieces/v2/{mail_piece_id}/events",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -29,7 +31,9 @@ class Proxy(BaseProxy):
                 },
             )
 
-        responses: List[dict] = exec_async(_get_tracking, request.serialize())
+        responses: List[dict] = provider_fanout.run(
+            self.settings, _get_tracking, request.serialize()
+        )
         return Deserializable(
             responses, lambda res: [DP.to_dict(r) for r in res if any(r.strip())]
         )
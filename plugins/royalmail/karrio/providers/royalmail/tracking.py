@@ -43,14 +43,7 @@ def _extract_detail(data: dict, settings: Settings) -> TrackingDetails:
                 code=event.eventCode,
                 time=lib.flocaltime(event.eventDateTime, "%Y-%m-%dT%H:%M:%S%z"),
                 timestamp=lib.fiso_timestamp(event.eventDateTime, current_format="%Y-%m-%dT%H:%M:%S%z"),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event.eventCode in r.value
-                    ),
-                    None,
-                ),
+                reason=provider_units.find_incident_reason(event.eventCode),
             )
             for event in detail.events
         ],
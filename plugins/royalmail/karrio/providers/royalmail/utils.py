@@ -1,3 +1,4 @@
+import karrio.lib as lib
 from karrio.core import Settings as BaseSettings
 
 
@@ -23,3 +24,19 @@ class Settings(BaseSettings):
             if self.test_mode
             else "https://api.royalmail.net"
         )
+
+    @property
+    def connection_config(self) -> lib.units.Options:
+        return lib.to_connection_config(
+            self.config or {},
+            option_type=ConnectionConfig,
+        )
+
+
+class ConnectionConfig(lib.Enum):
+    """Royal Mail connection configuration options."""
+
+    # Tracking fan-out
+    max_in_flight = lib.OptionEnum("max_in_flight", int)
+    rate_limit = lib.OptionEnum("rate_limit", float)
+    max_retries = lib.OptionEnum("max_retries", int)
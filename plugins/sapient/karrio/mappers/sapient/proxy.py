@@ -1,9 +1,12 @@
 """Karrio SAPIENT client proxy."""
 
 import datetime
+import typing
 import karrio.lib as lib
 import karrio.api.proxy as proxy
 import karrio.core.errors as errors
+import karrio.core.models as models
+import karrio.providers.sapient.rate_index as provider_rate_index
 import karrio.providers.sapient.error as provider_error
 import karrio.mappers.sapient.settings as provider_settings
 import karrio.universal.mappers.rating_proxy as rating_proxy
@@ -57,7 +60,15 @@ class Proxy(rating_proxy.RatingMixinProxy, proxy.Proxy):
         return lib.Deserializable(token.get_state())
 
     def get_rates(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        return super().get_rates(request)
+        return provider_rate_index.get_rates(self.settings, request)
+
+    def get_rates_batch(
+        self, payloads: typing.Iterable[typing.Union[models.RateRequest, dict]]
+    ) -> typing.Iterator[
+        typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]
+    ]:
+        """Lazily rate a stream of rate requests against one rate index."""
+        return provider_rate_index.get_rates_batch(self.settings, payloads)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
         access_token = self.authenticate(request).deserialize()
@@ -12,9 +12,12 @@ def parse_error_response(
     **kwargs,
 ) -> typing.List[models.Message]:
     responses = response if isinstance(response, list) else [response]
-    errors: typing.List[dict] = sum(
-        [_["Errors"] for _ in responses if "Errors" in _], []
-    )
+    errors: typing.List[dict] = [
+        error
+        for _ in responses
+        if "Errors" in _
+        for error in _["Errors"]
+    ]
 
     return [
         models.Message(
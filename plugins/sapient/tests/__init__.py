@@ -1,2 +1,3 @@
 from tests.sapient.test_pickup import *
 from tests.sapient.test_shipment import *
+from tests.sapient.test_rate import *
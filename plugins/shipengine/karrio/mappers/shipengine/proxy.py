@@ -2,6 +2,7 @@
 
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.providers.shipengine.pool as provider_pool
 import karrio.mappers.shipengine.settings as provider_settings
 
 
@@ -11,7 +12,7 @@ class Proxy(proxy.Proxy):
     def get_rates(self, request: lib.Serializable) -> lib.Deserializable[str]:
         """Request shipping rates from multiple carriers via ShipEngine."""
 
-        response = lib.request(
+        response = self._request(
             url=f"{self.settings.server_url}/rates",
             data=lib.to_json(request.serialize()),
             trace=self.trace_as("json"),
@@ -24,7 +25,7 @@ class Proxy(proxy.Proxy):
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
         """Create a shipping label via ShipEngine."""
 
-        response = lib.request(
+        response = self._request(
             url=f"{self.settings.server_url}/labels",
             data=lib.to_json(request.serialize()),
             trace=self.trace_as("json"),
@@ -38,9 +39,10 @@ class Proxy(proxy.Proxy):
         """Get tracking information for shipments."""
 
         def _get_tracking(tracking_number: str):
-            return tracking_number, lib.request(
-                url=f"{self.settings.server_url}/tracking",
-                params={"tracking_number": tracking_number},
+            query = lib.to_query_string(dict(tracking_number=tracking_number))
+
+            return tracking_number, self._request(
+                url=f"{self.settings.server_url}/tracking?{query}",
                 trace=self.trace_as("json"),
                 method="GET",
                 headers=self.settings.auth_headers,
@@ -63,7 +65,7 @@ class Proxy(proxy.Proxy):
     def validate_address(self, request: lib.Serializable) -> lib.Deserializable[str]:
         """Validate addresses using ShipEngine."""
 
-        response = lib.request(
+        response = self._request(
             url=f"{self.settings.server_url}/addresses/validate",
             data=lib.to_json(request.serialize()),
             trace=self.trace_as("json"),
@@ -79,7 +81,7 @@ class Proxy(proxy.Proxy):
         data = request.serialize()
         label_id = data.get("label_id")
 
-        response = lib.request(
+        response = self._request(
             url=f"{self.settings.server_url}/labels/{label_id}/void",
             trace=self.trace_as("json"),
             method="PUT",
@@ -87,4 +89,19 @@ class Proxy(proxy.Proxy):
         )
 
         return lib.Deserializable(response, lib.to_dict)
-    
\ No newline at end of file
+    
+    def _request(self, **kwargs) -> str:
+        config = self.settings.connection_config
+
+        if config.keep_alive.state:
+            return provider_pool.request(
+                max_connections=(
+                    config.max_connections.state or provider_pool.DEFAULT_MAX_CONNECTIONS
+                ),
+                idle_timeout=(
+                    config.keep_alive_timeout.state or provider_pool.DEFAULT_IDLE_TIMEOUT
+                ),
+                **kwargs,
+            )
+
+        return lib.request(**kwargs)
@@ -16,6 +16,7 @@ import typing
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
+import karrio.providers.shipengine.decoder as provider_decoder
 import karrio.providers.shipengine.error as error
 import karrio.providers.shipengine.utils as provider_utils
 import karrio.providers.shipengine.units as provider_units
@@ -27,7 +28,7 @@ def parse_address_validation_response(
 ) -> typing.Tuple[models.AddressValidationDetails, typing.List[models.Message]]:
     response = _response.deserialize()
     messages = error.parse_error_response(response, settings)
-    validation_response = lib.to_object(shipengine_res.AddressValidationResponseType, response)
+    validation_response = provider_decoder.to_object(shipengine_res.AddressValidationResponseType, response)
 
     complete_address = lib.identity(
         models.Address(
@@ -4,6 +4,7 @@ import typing
 import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
+import karrio.providers.shipengine.decoder as provider_decoder
 import karrio.providers.shipengine.error as error
 import karrio.providers.shipengine.utils as provider_utils
 import karrio.providers.shipengine.units as provider_units
@@ -17,30 +18,31 @@ def parse_rate_response(
 ) -> typing.Tuple[typing.List[models.RateDetails], typing.List[models.Message]]:
     response = _response.deserialize()
     messages = error.parse_error_response(response, settings)
-    rate_response_obj = lib.to_object(shipengine_res.RateResponseType, response)
+    rate_response = provider_decoder.to_object(shipengine_res.RateResponseType, response).rate_response
+    response_rates = (rate_response.rates if rate_response else None) or []
 
-    # Update dynamic services
-    lib.identity(
-        provider_units.ShippingService.update_from_response(response.get("rate_response", {}))
-        if rate_response_obj.rate_response else None
+    # Record the discovered services without mutating the shared enum
+    provider_units.SERVICE_REGISTRY.add(
+        settings.carrier_id,
+        (
+            (
+                f"shipengine_{rate.carrier_code}_{rate.service_code}",
+                rate.service_type or rate.service_code,
+            )
+            for rate in response_rates
+            if rate.carrier_code and rate.service_code
+        ),
     )
 
-    rates = []
-    if rate_response_obj.rate_response and rate_response_obj.rate_response.rates:
-        rates = [
-            _extract_rate_details(lib.to_dict(rate), settings)
-            for rate in rate_response_obj.rate_response.rates
-        ]
+    rates = [_extract_rate_details(rate, settings) for rate in response_rates]
 
     return rates, messages
 
 
 def _extract_rate_details(
-    rate_data: dict,
+    rate: shipengine_res.RateType,
     settings: provider_utils.Settings,
 ) -> models.RateDetails:
-    rate = lib.to_object(shipengine_res.RateType, rate_data)
-    
     amounts = [
         rate.shipping_amount,
         rate.insurance_amount, 
@@ -3,6 +3,7 @@
 import typing
 import karrio.lib as lib
 import karrio.core.models as models
+import karrio.providers.shipengine.decoder as provider_decoder
 import karrio.providers.shipengine.error as error
 import karrio.providers.shipengine.utils as provider_utils
 import karrio.providers.shipengine.units as provider_units
@@ -16,7 +17,7 @@ def parse_shipment_response(
 ) -> typing.Tuple[models.ShipmentDetails, typing.List[models.Message]]:
     response = _response.deserialize()
     messages = error.parse_error_response(response, settings)
-    shipment = lib.to_object(shipengine_res.ShipmentResponseType, response)
+    shipment = provider_decoder.to_object(shipengine_res.ShipmentResponseType, response)
     
     return models.ShipmentDetails(
         carrier_id=settings.carrier_id,
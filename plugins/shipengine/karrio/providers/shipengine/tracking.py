@@ -3,6 +3,7 @@
 import typing
 import karrio.lib as lib
 import karrio.core.models as models
+import karrio.providers.shipengine.decoder as provider_decoder
 import karrio.providers.shipengine.error as error
 import karrio.providers.shipengine.utils as provider_utils
 import karrio.providers.shipengine.units as provider_units
@@ -16,13 +17,13 @@ def parse_tracking_response(
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _response.deserialize()
 
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=tracking_number)
-            for tracking_number, response in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for tracking_number, response in responses
+        for message in error.parse_error_response(
+            response, settings, tracking_number=tracking_number
+        )
+    ]
 
     tracking_details = [
         _extract_details(details, settings, tracking_number)
@@ -38,7 +39,7 @@ def _extract_details(
     settings: provider_utils.Settings,
     tracking_number: str = None,
 ) -> models.TrackingDetails:
-    tracking_details = lib.to_object(shipengine_res.TrackingResponseType, data)
+    tracking_details = provider_decoder.to_object(shipengine_res.TrackingResponseType, data)
     
     tracking_number = tracking_number or tracking_details.tracking_number or ""
     
@@ -54,33 +55,14 @@ def _extract_details(
                 event.country_code
             ])),
             timestamp=lib.fiso_timestamp(event.occurred_at, current_format="%Y-%m-%dT%H:%M:%SZ") if event.occurred_at else None,
-            status=next(
-                (
-                    s.name
-                    for s in list(provider_units.TrackingStatus)
-                    if event.event_code in s.value
-                ),
-                None,
-            ) if event.event_code else None,
-            reason=next(
-                (
-                    r.name
-                    for r in list(provider_units.TrackingIncidentReason)
-                    if event.event_code in r.value
-                ),
-                None,
-            ) if event.event_code else None,
+            status=provider_units.find_tracking_status(event.event_code) if event.event_code else None,
+            reason=provider_units.find_incident_reason(event.event_code) if event.event_code else None,
         )
         for event in (tracking_details.events or [])
     ]
 
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if tracking_details.status_code in status.value
-        ),
-        "in_transit",
+    status = provider_units.find_tracking_status(
+        tracking_details.status_code, "in_transit"
     )
 
     return models.TrackingDetails(
@@ -1,4 +1,8 @@
 
+import typing
+import functools
+import threading
+import collections
 import karrio.lib as lib
 import karrio.core.units as units
 
@@ -59,13 +63,75 @@ class ShippingService(lib.StrEnum):
         return services
 
     @classmethod
-    def update_from_response(cls, rates_response: dict):
-        """Dynamically add discovered services to enum."""
-        discovered = cls.discover_from_rates(rates_response)
+    def update_from_response(cls, rates_response: dict, carrier_id: str = None):
+        """Record the services discovered in a rate response for `carrier_id`."""
+        SERVICE_REGISTRY.add(carrier_id, cls.discover_from_rates(rates_response).items())
 
-        for key, value in discovered.items():
-            if not hasattr(cls, key):
-                setattr(cls, key, value)
+
+DEFAULT_MAX_DISCOVERED_SERVICES = 500
+DEFAULT_MAX_DISCOVERED_CARRIERS = 100
+
+
+class ServiceRegistry:
+    """Services discovered from rate responses, cached per carrier_id.
+
+    The enum is shared by every thread, so discovered services are kept here
+    behind a lock instead. Both the carriers and the services of a carrier are
+    bounded, evicting the least recently seen entries first.
+    """
+
+    def __init__(
+        self,
+        max_services: int = DEFAULT_MAX_DISCOVERED_SERVICES,
+        max_carriers: int = DEFAULT_MAX_DISCOVERED_CARRIERS,
+    ):
+        self.max_services = max_services
+        self.max_carriers = max_carriers
+        self._lock = threading.Lock()
+        self._carriers: typing.Dict[str, typing.Dict[str, str]] = (
+            collections.OrderedDict()
+        )
+
+    def add(
+        self,
+        carrier_id: typing.Optional[str],
+        services: typing.Iterable[typing.Tuple[str, str]],
+    ):
+        """Record `(service_key, service_name)` pairs, keeping the first name seen."""
+        services = list(services)
+
+        if not services:
+            return
+
+        with self._lock:
+            discovered = self._carriers.get(carrier_id)
+
+            if discovered is None:
+                discovered = self._carriers[carrier_id] = collections.OrderedDict()
+
+            self._carriers.move_to_end(carrier_id)
+
+            for key, name in services:
+                discovered.setdefault(key, name)
+                discovered.move_to_end(key)
+
+            while len(discovered) > self.max_services:
+                discovered.popitem(last=False)
+
+            while len(self._carriers) > self.max_carriers:
+                self._carriers.popitem(last=False)
+
+    def services(self, carrier_id: typing.Optional[str]) -> typing.Dict[str, str]:
+        """Return a copy of the services discovered for `carrier_id`."""
+        with self._lock:
+            return dict(self._carriers.get(carrier_id) or {})
+
+    def clear(self):
+        with self._lock:
+            self._carriers.clear()
+
+
+SERVICE_REGISTRY = ServiceRegistry()
 
 
 class ShippingOption(lib.Enum):
@@ -137,3 +203,20 @@ class WeightUnit(lib.Enum):
 class DimensionUnit(lib.Enum):
     CM = "centimeter"
     IN = "inch"
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
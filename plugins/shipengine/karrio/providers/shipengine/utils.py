@@ -103,3 +103,8 @@ class ConnectionConfig(lib.Enum):
     shipping_options = lib.OptionEnum("shipping_options", list)
     label_format = lib.OptionEnum("label_format", str, "PDF")
     label_size = lib.OptionEnum("label_size", str, "4x6")
+
+    # Connection pooling
+    keep_alive = lib.OptionEnum("keep_alive", bool)
+    max_connections = lib.OptionEnum("max_connections", int)
+    keep_alive_timeout = lib.OptionEnum("keep_alive_timeout", float)
@@ -0,0 +1,53 @@
+"""Benchmark the compiled ShipEngine decoders against `lib.to_object`.
+
+Run from the plugin directory with `python -m tests.shipengine.bench_decoder`.
+"""
+
+import timeit
+import karrio.lib as lib
+import karrio.providers.shipengine.decoder as provider_decoder
+import karrio.schemas.shipengine.rate_response as rating
+import karrio.schemas.shipengine.shipment_response as shipping
+import karrio.schemas.shipengine.tracking_response as tracking
+from tests.shipengine.test_rate import RateResponse
+from tests.shipengine.test_shipment import ShipmentResponse
+from tests.shipengine.test_tracking import TrackingResponse
+
+NUMBER = 200
+
+
+def main():
+    response = lib.to_dict(RateResponse)
+    rates = response["rate_response"]["rates"]
+    large_response = {
+        **response,
+        "rate_response": {
+            **response["rate_response"],
+            "rates": [
+                {**rates[index % len(rates)], "rate_id": f"se-{index}"}
+                for index in range(150)
+            ],
+        },
+    }
+
+    for name, object_type, data in [
+        ("rate response", rating.RateResponseType, response),
+        ("150 rates", rating.RateResponseType, large_response),
+        ("shipment", shipping.ShipmentResponseType, lib.to_dict(ShipmentResponse)),
+        ("tracking", tracking.TrackingResponseType, lib.to_dict(TrackingResponse)),
+    ]:
+        assert provider_decoder.to_object(object_type, data) == lib.to_object(
+            object_type, data
+        )
+        before = _best(lambda: lib.to_object(object_type, data))
+        after = _best(lambda: provider_decoder.to_object(object_type, data))
+
+        print(f"{name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms")
+
+
+def _best(func, number: int = NUMBER) -> float:
+    return min(timeit.repeat(func, number=number, repeat=7)) / number
+
+
+if __name__ == "__main__":
+    main()
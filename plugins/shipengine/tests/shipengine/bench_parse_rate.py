@@ -0,0 +1,94 @@
+"""Benchmark the ShipEngine rate response parsing.
+
+Run from the plugin directory with `python -m tests.shipengine.bench_parse_rate`.
+"""
+
+import time
+import timeit
+import concurrent.futures
+import karrio.lib as lib
+import karrio.providers.shipengine.rate as provider_rate
+import karrio.providers.shipengine.error as provider_error
+import karrio.providers.shipengine.units as provider_units
+import karrio.schemas.shipengine.rate_response as shipengine_res
+from tests.shipengine.fixture import gateway
+from tests.shipengine.test_rate import RateResponse
+
+NUMBER = 200
+RATES = 150
+THREADS = 16
+
+
+def main():
+    settings = gateway.settings
+    response = lib.to_dict(RateResponse)
+    rates = response["rate_response"]["rates"]
+    response = lib.to_json(
+        {
+            **response,
+            "rate_response": {
+                **response["rate_response"],
+                "rates": [
+                    {
+                        **rate,
+                        "rate_id": f"se-{index}",
+                        "service_code": f"{rate['service_code']}_{index}",
+                    }
+                    for index in range(RATES)
+                    for rate in [rates[index % len(rates)]]
+                ],
+            },
+        }
+    )
+
+    def parse():
+        return provider_rate.parse_rate_response(
+            lib.Deserializable(response, lib.to_dict), settings
+        )
+
+    def convert_three_times():
+        return _convert_three_times(
+            lib.Deserializable(response, lib.to_dict), settings
+        )
+
+    assert lib.to_dict(parse()) == lib.to_dict(convert_three_times())
+
+    for name, func in [
+        ("to_object, to_dict, to_object per rate", convert_three_times),
+        ("parse_rate_response", parse),
+    ]:
+        print(f"{RATES} rates ({name}): {_best(func) * 1000:.2f} ms per response")
+
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(lambda _: parse(), range(NUMBER)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{RATES} rates (parse_rate_response, {THREADS} threads): "
+        f"{NUMBER / elapsed:,.0f} responses/s, "
+        f"{len(provider_units.SERVICE_REGISTRY.services(settings.carrier_id))} "
+        "services registered"
+    )
+
+
+def _convert_three_times(_response, settings):
+    # the parsing used before the single typed pass, less the enum setattr
+    response = _response.deserialize()
+    messages = provider_error.parse_error_response(response, settings)
+    rate_response = lib.to_object(shipengine_res.RateResponseType, response)
+
+    return [
+        provider_rate._extract_rate_details(
+            lib.to_object(shipengine_res.RateType, lib.to_dict(rate)), settings
+        )
+        for rate in (rate_response.rate_response.rates or [])
+    ], messages
+
+
+def _best(func, number: int = NUMBER) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import json
+import threading
+import unittest
+import http.client
+import http.server
+import concurrent.futures
+import karrio.lib as lib
+import karrio.providers.shipengine.pool as pool
+
+
+class TestShipEngineConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.server = StubServer()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v2/shipments"
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_reuses_keep_alive_connection(self):
+        responses = [
+            pool.request(url=self.url, data='{"id": 1}', method="POST")
+            for _ in range(10)
+        ]
+
+        self.assertEqual(self.server.accepted_connections, 1)
+        self.assertDictEqual(
+            lib.to_dict(responses[-1]),
+            {"method": "POST", "path": "/v2/shipments", "body": '{"id": 1}'},
+        )
+
+    def test_unpooled_requests_open_a_connection_each(self):
+        for _ in range(3):
+            lib.request(url=self.url, method="GET")
+
+        self.assertEqual(self.server.accepted_connections, 3)
+
+    def test_idle_connections_expire(self):
+        for _ in range(3):
+            pool.request(url=self.url, method="GET", idle_timeout=0)
+
+        self.assertEqual(self.server.accepted_connections, 3)
+
+    def test_limits_connections_per_host(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: pool.request(url=self.url, method="GET", max_connections=2),
+                    range(40),
+                )
+            )
+
+        self.assertEqual(len(responses), 40)
+        self.assertLessEqual(self.server.accepted_connections, 2)
+
+    def test_retries_idempotent_requests_on_a_dropped_connection(self):
+        pool.request(url=self.url, method="GET")
+
+        with self.assertRaises(http.client.RemoteDisconnected):
+            pool.request(url=f"{self.url}?drop=1", method="GET")
+
+        # sent on the reused connection, then once more on a new one
+        self.assertEqual(self.server.dropped_requests, 2)
+
+    def test_does_not_resend_a_written_post(self):
+        pool.request(url=self.url, data='{"id": 1}', method="POST")
+
+        with self.assertRaises(http.client.RemoteDisconnected):
+            pool.request(url=f"{self.url}?drop=1", data='{"id": 1}', method="POST")
+
+        self.assertEqual(self.server.dropped_requests, 1)
+
+    def test_decodes_error_responses(self):
+        response = pool.request(url=f"{self.url}?status=422", method="GET")
+
+        self.assertDictEqual(lib.to_dict(response), {"error": {"code": "INVALID"}})
+        self.assertEqual(self.server.accepted_connections, 1)
+
+    def test_retries_throttled_responses(self):
+        response = pool.request(
+            url=f"{self.url}?status=429",
+            method="GET",
+            max_retries=2,
+            retry_delay=0,
+            retry_on_status=[429],
+        )
+
+        self.assertDictEqual(lib.to_dict(response), {"error": {"code": "THROTTLED"}})
+        self.assertEqual(self.server.throttled_requests, 3)
+
+    def test_exhausted_pool_times_out(self):
+        exhausted = pool.get_pool(self.url, max_connections=1, idle_timeout=1.5)
+        exhausted._slots.acquire()
+
+        try:
+            with self.assertRaises(TimeoutError):
+                pool.request(
+                    url=self.url,
+                    method="GET",
+                    timeout=0.1,
+                    max_connections=1,
+                    idle_timeout=1.5,
+                )
+        finally:
+            exhausted._slots.release()
+
+        self.assertEqual(self.server.accepted_connections, 0)
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.accepted_connections = 0
+        self.dropped_requests = 0
+        self.throttled_requests = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs=dict(poll_interval=0.05), daemon=True
+        )
+        self._thread.start()
+
+    def get_request(self):
+        connection = super().get_request()
+        with self._lock:
+            self.accepted_connections += 1
+
+        return connection
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+
+        if "drop=1" in self.path:
+            with self.server._lock:
+                self.server.dropped_requests += 1
+            self.close_connection = True
+            return
+
+        if "status=422" in self.path:
+            status, content = 422, {"error": {"code": "INVALID"}}
+        elif "status=429" in self.path:
+            with self.server._lock:
+                self.server.throttled_requests += 1
+            status, content = 429, {"error": {"code": "THROTTLED"}}
+        else:
+            status = 200
+            content = dict(method=self.command, path=self.path, body=body)
+
+        payload = json.dumps(content).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
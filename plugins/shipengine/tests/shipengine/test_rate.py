@@ -1,12 +1,14 @@
 """ShipEngine carrier rate tests."""
 
 import unittest
+import concurrent.futures
 from unittest.mock import patch, ANY
 from .fixture import gateway
 import logging
 import karrio.sdk as karrio
 import karrio.lib as lib
 import karrio.core.models as models
+import karrio.providers.shipengine.units as provider_units
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,69 @@ class TestShipEngineRating(unittest.TestCase):
             )
             self.assertListEqual(lib.to_dict(parsed_response), ParsedErrorResponse)
 
+    def test_parse_rate_response_discovers_services(self):
+        provider_units.SERVICE_REGISTRY.clear()
+
+        gateway.mapper.parse_rate_response(lib.Deserializable(RateResponse, lib.to_dict))
+
+        self.assertDictEqual(
+            provider_units.SERVICE_REGISTRY.services(gateway.settings.carrier_id),
+            {
+                "shipengine_ups_ups_ground": "UPS Ground",
+                "shipengine_fedex_fedex_2day": "FedEx 2Day",
+            },
+        )
+        self.assertFalse(
+            hasattr(provider_units.ShippingService, "shipengine_fedex_fedex_2day")
+        )
+
+    def test_parse_rate_response_concurrently(self):
+        registry = provider_units.ServiceRegistry(max_services=20, max_carriers=4)
+        gateways = [
+            karrio.gateway["shipengine"].create(
+                dict(id=f"carrier_{_}", carrier_id=f"carrier_{_}", api_key="key")
+            )
+            for _ in range(8)
+        ]
+        response = lib.to_dict(RateResponse)
+        responses = [
+            lib.to_json(
+                dict(
+                    rate_response=dict(
+                        rates=[
+                            {
+                                **rate,
+                                "service_code": f"{rate['service_code']}_{index}",
+                            }
+                            for rate in response["rate_response"]["rates"]
+                        ]
+                    )
+                )
+            )
+            for index in range(30)
+        ]
+
+        def parse(args):
+            gateway, response = args
+            return gateway.mapper.parse_rate_response(
+                lib.Deserializable(response, lib.to_dict)
+            )
+
+        with patch.object(provider_units, "SERVICE_REGISTRY", registry):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(
+                    executor.map(
+                        parse,
+                        [(gateway, _) for gateway in gateways for _ in responses],
+                    )
+                )
+
+        self.assertTrue(all(len(rates) == 2 and not messages for rates, messages in results))
+        self.assertEqual(len(registry._carriers), 4)
+        self.assertTrue(
+            all(len(registry.services(_.settings.carrier_id)) <= 20 for _ in gateways)
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
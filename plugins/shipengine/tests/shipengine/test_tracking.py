@@ -26,7 +26,7 @@ class TestShipEngineTracking(unittest.TestCase):
             karrio.Tracking.fetch(self.TrackingRequest).from_(gateway)
             self.assertEqual(
                 mock.call_args[1]["url"],
-                f"{gateway.settings.server_url}/tracking"
+                f"{gateway.settings.server_url}/tracking?tracking_number=1Z999AA1234567890",
             )
 
     def test_parse_tracking_response(self):
@@ -10,33 +10,31 @@ def parse_error_response(
 ) -> typing.List[models.Message]:
     responses = response if isinstance(response, list) else [response]
 
-    errors: typing.List[dict] = sum(
-        (
-            (
-                e["TollMessage"]["ErrorMessages"]["ErrorMessage"]
-                if any(
-                    e.get("TollMessage", {})
-                    .get("ErrorMessages", {})
-                    .get("ErrorMessage")
-                    or []
-                )
-                else [e]
+    errors: typing.List[dict] = [
+        error
+        for e in responses
+        if (
+            e.get("message") is not None
+            or e.get("Exception") is not None
+            or e.get("ExceptionMessage") is not None
+            or any(
+                e.get("TollMessage", {})
+                .get("ErrorMessages", {})
+                .get("ErrorMessage")
+                or []
             )
-            for e in responses
-            if (
-                e.get("message") is not None
-                or e.get("Exception") is not None
-                or e.get("ExceptionMessage") is not None
-                or any(
-                    e.get("TollMessage", {})
-                    .get("ErrorMessages", {})
-                    .get("ErrorMessage")
-                    or []
-                )
+        )
+        for error in (
+            e["TollMessage"]["ErrorMessages"]["ErrorMessage"]
+            if any(
+                e.get("TollMessage", {})
+                .get("ErrorMessages", {})
+                .get("ErrorMessage")
+                or []
             )
-        ),
-        [],
-    )
+            else [e]
+        )
+    ]
 
     return [
         models.Message(
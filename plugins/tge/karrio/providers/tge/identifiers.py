@@ -0,0 +1,116 @@
+"""TGE shipment ID and SSCC block allocation.
+
+Counters live in the shared system cache. Rather than reading, incrementing
+and writing them back for every shipment, each process atomically reserves
+a block of IDs (`incr` by the block size) and hands IDs out of it locally,
+so concurrent workers never share an ID and only touch the cache once per
+block. Blocks are kept small since the IDs left in a block are lost when the
+process exits.
+
+The counters are seeded once from the persisted `sscc_count`/`shipment_count`
+(or the configured range start). Raising them later, e.g. to move to a new
+SSCC range, makes the next reservation skip the shared counter ahead; the IDs
+left in blocks already reserved by running processes are still handed out.
+A counter cannot move back: delete its cache key to restart a lower range.
+"""
+
+import typing
+import threading
+import karrio.core.errors as errors
+
+DEFAULT_BLOCK_SIZE = 10
+
+
+class SharedStore(typing.Protocol):
+    """The atomic subset of a system cache (e.g. a Django cache) used here."""
+
+    def add(self, key: str, value: int, timeout: typing.Any = None) -> bool: ...
+
+    def incr(self, key: str, delta: int = 1) -> int: ...
+
+
+class BlockAllocator:
+    """Hand out consecutive IDs from blocks reserved in a shared store."""
+
+    def __init__(self, store: SharedStore, key: str, block_size: int):
+        self.store = store
+        self.key = key
+        self.block_size = block_size
+        self.next_id = 0
+        self.last_id = -1
+        self.lock = threading.Lock()
+
+    def allocate(
+        self, count: int, start: int = 0, end: int = None
+    ) -> typing.Tuple[typing.List[int], int]:
+        """Return `count` unused IDs and the last ID reserved so far.
+
+        `start` seeds the shared counter (the last ID already used) when the
+        store does not hold it yet. IDs past `end` are never handed out.
+        """
+        ids: typing.List[int] = []
+
+        with self.lock:
+            while len(ids) < count:
+                if self.next_id > self.last_id:
+                    self.last_id = reserve(
+                        self.store, self.key, start, self.block_size
+                    )
+                    self.next_id = self.last_id - self.block_size + 1
+
+                taken = min(count - len(ids), self.last_id - self.next_id + 1)
+                check_range(self.next_id + taken - 1, end)
+                ids.extend(range(self.next_id, self.next_id + taken))
+                self.next_id += taken
+
+            return ids, self.last_id
+
+
+def reserve(store: SharedStore, key: str, start: int, size: int) -> int:
+    """Atomically reserve the next `size` IDs and return the last of them."""
+    # seeds the counter once, a no-op when another process already did
+    store.add(key, start, timeout=None)
+    last_id = store.incr(key, size)
+
+    # `start` was raised past the shared counter since it was seeded: reserve
+    # enough more to hand out a whole block past it.
+    if last_id - size < start:
+        last_id = store.incr(key, max(start - last_id, 0) + size)
+
+    return last_id
+
+
+def check_range(last_id: int, end: typing.Optional[int]):
+    """Raise when an ID past the end of the configured range is requested."""
+    if end is not None and last_id > end:
+        raise errors.ShippingSDKError(
+            f"The identifier range is exhausted: {last_id} is past its end {end}"
+        )
+
+
+def shared_store(cache: typing.Any) -> typing.Optional[SharedStore]:
+    """Return the system cache behind a connection cache if it is atomic."""
+    for store in (cache, getattr(cache, "_cache", None)):
+        if callable(getattr(store, "add", None)) and callable(
+            getattr(store, "incr", None)
+        ):
+            return store
+
+    return None
+
+
+def allocator(store: SharedStore, key: str, block_size: int) -> BlockAllocator:
+    """Return this process' allocator for a counter, creating it on first use."""
+    with _lock:
+        _allocator = _allocators.get((id(store), key))
+
+        if _allocator is None or _allocator.block_size != block_size:
+            _allocator = _allocators[(id(store), key)] = BlockAllocator(
+                store, key, block_size
+            )
+
+        return _allocator
+
+
+_lock = threading.Lock()
+_allocators: typing.Dict[typing.Tuple[int, str], BlockAllocator] = {}
@@ -6,6 +6,7 @@ import datetime
 import karrio.lib as lib
 import karrio.core.models as models
 import karrio.providers.tge.error as provider_error
+import karrio.providers.tge.bundle as provider_bundle
 import karrio.providers.tge.utils as provider_utils
 import karrio.providers.tge.units as provider_units
 
@@ -23,13 +24,11 @@ def parse_manifest_response(
     ]
 
     shipment = _extract_details(toll_messages, settings) if any(toll_messages) else None
-    messages: typing.List[models.Message] = sum(
-        [
-            provider_error.parse_error_response(response, settings)
-            for response in responses
-        ],
-        start=[],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for response in responses
+        for message in provider_error.parse_error_response(response, settings)
+    ]
 
     return shipment, messages
 
@@ -39,14 +38,10 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.ManifestDetails:
     manifests = [lib.to_object(manifest.TollMessageType, _) for _ in data]
-    manifest_file = lib.bundle_base64(
-        sum(
-            (
-                [_.ResponseMessage for _ in _.ResponseMessages.ResponseMessage]
-                for _ in manifests
-            ),
-            start=[],
-        )
+    manifest_file = provider_bundle.bundle_base64(
+        message.ResponseMessage
+        for _ in manifests
+        for message in _.ResponseMessages.ResponseMessage
     )
 
     return models.ManifestDetails(
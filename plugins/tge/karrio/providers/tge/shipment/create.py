@@ -7,6 +7,7 @@ import karrio.lib as lib
 import karrio.core.units as units
 import karrio.core.models as models
 import karrio.providers.tge.error as error
+import karrio.providers.tge.bundle as provider_bundle
 import karrio.providers.tge.utils as provider_utils
 import karrio.providers.tge.units as provider_units
 
@@ -41,8 +42,8 @@ def _extract_details(
     label_type = ctx["label_type"]
     tracking_number = ctx["ShipmentID"]
     shipment_count = ctx["shipment_count"]
-    label = lib.bundle_base64(
-        [_.ResponseMessage for _ in shipment.ResponseMessages.ResponseMessage],
+    label = provider_bundle.bundle_base64(
+        (_.ResponseMessage for _ in shipment.ResponseMessages.ResponseMessage),
         format=label_type,
     )
 
@@ -41,6 +41,8 @@ class ConnectionConfig(lib.Enum):
     SSCC_range_end = lib.OptionEnum("SSCC_range_end", lib.to_int)
     SSCC_range_start = lib.OptionEnum("SSCC_range_start", lib.to_int)
 
+    identifier_block_size = lib.OptionEnum("identifier_block_size", lib.to_int)
+
 
 class ShippingService(lib.StrEnum):
     """Carrier specific services"""
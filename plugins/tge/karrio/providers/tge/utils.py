@@ -2,8 +2,10 @@ import base64
 import typing
 import jstruct
 import datetime
+import functools
 import karrio.lib as lib
 import karrio.core as core
+import karrio.providers.tge.identifiers as provider_identifiers
 
 
 class Settings(core.Settings):
@@ -50,10 +52,7 @@ class Settings(core.Settings):
     def next_shipment_identifiers(
         self, options: lib.units.Options, package_count: int
     ) -> typing.Tuple[str, list, int, int]:
-        # get state from cache
         cache_key = f"{self.carrier_name}|{self.api_key}"
-        state = self.connection_cache.get(cache_key) or {}
-
         sscc_gs1 = lib.to_int(lib.text(self.connection_config.SSCC_GS1.state) or "")
         ship_gs1 = lib.to_int(lib.text(self.connection_config.SHIP_GS1.state) or "")
         sscc_count = (
@@ -66,31 +65,62 @@ class Settings(core.Settings):
             if self.shipment_count is not None
             else lib.to_int(self.connection_config.SHIP_range_start.state) or 0
         )
+        sscc_range_end = lib.to_int(self.connection_config.SSCC_range_end.state)
+        store = provider_identifiers.shared_store(self.connection_cache)
+
+        # reserve ID blocks atomically when the system cache is shared
+        if store is not None:
+            block_size = (
+                self.connection_config.identifier_block_size.state
+                or provider_identifiers.DEFAULT_BLOCK_SIZE
+            )
+            # IDs given in the options leave their counter untouched
+            sscc_ids, _sscc_count = lib.identity(
+                ([], sscc_count)
+                if "tge_ssc_ids" in options
+                else provider_identifiers.allocator(
+                    store, f"{cache_key}|sscc_count", block_size
+                ).allocate(package_count, start=sscc_count, end=sscc_range_end)
+            )
+            shipment_ids, _shipment_count = lib.identity(
+                ([], shipment_count)
+                if "tge_shipment_ids" in options
+                else provider_identifiers.allocator(
+                    store, f"{cache_key}|shipment_count", block_size
+                ).allocate(package_count, start=shipment_count)
+            )
+        else:
+            sscc_ids = [sscc_count + _ for _ in range(1, package_count + 1)]
+
+            if "tge_ssc_ids" not in options:
+                provider_identifiers.check_range(
+                    sscc_count + package_count, sscc_range_end
+                )
+
+            shipment_ids = [shipment_count + _ for _ in range(1, package_count + 1)]
+            _sscc_count = sscc_count + package_count
+            _shipment_count = shipment_count + package_count
+
+            # save in cache
+            state = self.connection_cache.get(cache_key) or {}
+            self.connection_cache.set(
+                cache_key,
+                {
+                    **state,
+                    "sscc_count": _sscc_count,
+                    "shipment_count": _shipment_count,
+                },
+            )
 
         if "tge_ssc_ids" in options:
             SSCCs = options.tge_ssc_ids.state
         else:
-            SSCCs = [
-                f"00{calculate_sscc(sscc_gs1, sscc_count, _)}"
-                for _, __ in enumerate(range(package_count), start=1)
-            ]
+            SSCCs = [f"00{calculate_sscc(sscc_gs1, _, 0)}" for _ in sscc_ids]
 
         if "tge_shipment_ids" in options:
             ShipmentIDs = options.tge_shipment_ids.state
         else:
-            ShipmentIDs = [
-                f"{ship_gs1}{str(shipment_count + _).zfill(7)}"
-                for _, __ in enumerate(range(package_count), start=1)
-            ]
-
-        # save in cache
-        _sscc_count = sscc_count + package_count
-        _shipment_count = shipment_count + package_count
-
-        self.connection_cache.set(
-            cache_key,
-            {**state, "sscc_count": _sscc_count, "shipment_count": _shipment_count},
-        )
+            ShipmentIDs = [f"{ship_gs1}{str(_).zfill(7)}" for _ in shipment_ids]
 
         return (
             ShipmentIDs,
@@ -126,12 +156,54 @@ def next_pickup_date(
 
 
 def calculate_sscc(gs1, sscc: int, index: int) -> str:
-    _new_sscc = sscc + index
-    _current = [int(_) for _ in f"{gs1}{_new_sscc}".zfill(17)]
-    _odd_sum = sum([int(x) for _, x in enumerate(_current) if _ % 2 == 0])
-    _even_sum = sum([int(x) for _, x in enumerate(_current) if _ % 2 != 0])
-    _sscc_sum = (_odd_sum * 3) + _even_sum
-    _nearest_multiple_of_ten = _sscc_sum + 10 - (_sscc_sum % 10)
-    _digit = _nearest_multiple_of_ten - _sscc_sum
-
-    return f"{''.join([str(_) for _ in _current])}{_digit}".zfill(18)
+    _digits = f"{gs1}{sscc + index}".zfill(17)
+
+    return f"{_digits}{-_weighted_sum(_digits) % 10}".zfill(18)
+
+
+def calculate_ssccs(gs1, sscc: int, count: int) -> typing.List[str]:
+    """Return `calculate_sscc(gs1, sscc, index)` for every index in `range(count)`.
+
+    Serials sharing all but their last three digits are generated together:
+    the prefix is weighted once and joined to pre-computed suffixes (the
+    last three digits and the check digit), so the cost per SSCC is a
+    string concatenation.
+    """
+    ssccs: typing.List[str] = []
+    serial, end = sscc, sscc + count
+
+    while serial < end:
+        if serial < 1000:
+            ssccs.append(calculate_sscc(gs1, serial, 0))
+            serial += 1
+            continue
+
+        high, low = divmod(serial, 1000)
+        stop = min(end - high * 1000, 1000)
+        prefix = f"{gs1}{high}".zfill(14)
+        suffixes = _sscc_suffixes(_weighted_sum(prefix, start=3) % 10)
+
+        ssccs.extend(prefix + _ for _ in suffixes[low:stop])
+        serial += stop - low
+
+    return ssccs
+
+
+def _weighted_sum(digits: str, start: int = 0) -> int:
+    return sum(
+        SSCC_CHECK_WEIGHTS[(_ + start) % 2][int(digit)]
+        for _, digit in enumerate(reversed(digits))
+    )
+
+
+@functools.lru_cache(maxsize=10)
+def _sscc_suffixes(prefix_sum: int) -> typing.List[str]:
+    return [
+        f"{_:03d}{-(prefix_sum + SSCC_SUFFIX_SUMS[_]) % 10}" for _ in range(1000)
+    ]
+
+
+# GS1 check digit weighting (3, 1, 3, ... from the rightmost digit) by digit.
+SSCC_CHECK_WEIGHTS = [[_ * 3 for _ in range(10)], list(range(10))]
+# Weighted sums of every three digit serial suffix.
+SSCC_SUFFIX_SUMS = [_weighted_sum(f"{_:03d}") for _ in range(1000)]
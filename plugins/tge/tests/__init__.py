@@ -1,3 +1,5 @@
 from tests.tge.test_rate import *
 from tests.tge.test_shipment import *
 from tests.tge.test_manifest import *
+from tests.tge.test_bundle import *
+from tests.tge.test_identifiers import *
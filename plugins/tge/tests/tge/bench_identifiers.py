@@ -0,0 +1,60 @@
+"""Benchmark the TGE identifier allocation throughput.
+
+Run from the plugin directory with `python -m tests.tge.bench_identifiers`.
+"""
+
+import time
+import multiprocessing
+import karrio.sdk as karrio
+import karrio.lib as lib
+import karrio.providers.tge.units as provider_units
+from tests.tge.test_identifiers import SettingsData, SharedStore
+
+COUNT = 2_000
+PROCESSES = 4
+PACKAGES = 3
+
+
+def main():
+    with multiprocessing.Manager() as manager:
+        lock = manager.Lock()
+
+        for name, config in [
+            ("one ID per reservation", dict(identifier_block_size=1)),
+            ("blocks of 10", dict(identifier_block_size=10)),
+            ("blocks of 100", dict(identifier_block_size=100)),
+        ]:
+            store = SharedStore(manager.dict(), lock)
+            settings = {**SettingsData, "config": {**SettingsData["config"], **config}}
+            processes = [
+                multiprocessing.Process(target=allocate, args=(store, settings))
+                for _ in range(PROCESSES)
+            ]
+            start = time.perf_counter()
+
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name} ({PROCESSES} processes x {COUNT:,} shipments): "
+                f"{PROCESSES * COUNT / elapsed:,.0f} allocations/s"
+            )
+
+
+def allocate(store, settings_data: dict):
+    settings = karrio.gateway["tge"].create(
+        settings_data, cache=lib.Cache(store)
+    ).settings
+    options = lib.to_shipping_options(
+        {}, initializer=provider_units.shipping_options_initializer
+    )
+
+    for _ in range(COUNT):
+        settings.next_shipment_identifiers(options, PACKAGES)
+
+
+if __name__ == "__main__":
+    main()
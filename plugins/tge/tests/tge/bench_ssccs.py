@@ -0,0 +1,32 @@
+"""Benchmark the TGE batch SSCC generator.
+
+Run from the plugin directory with `python -m tests.tge.bench_ssccs`.
+"""
+
+import timeit
+import karrio.providers.tge.utils as provider_utils
+
+GS1 = 9327510
+SSCC = 341761001
+COUNT = 100_000
+
+
+def main():
+    for name, generate in [
+        (
+            "calculate_sscc loop",
+            lambda: [
+                provider_utils.calculate_sscc(GS1, SSCC, _) for _ in range(COUNT)
+            ],
+        ),
+        ("calculate_ssccs", lambda: provider_utils.calculate_ssccs(GS1, SSCC, COUNT)),
+    ]:
+        print(f"{name} ({COUNT:,} SSCCs): {_best(generate) * 1000:.1f} ms")
+
+
+def _best(func, number: int = 1) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import gc
+import io
+import base64
+import weakref
+import unittest
+from unittest.mock import patch
+import PyPDF2
+import PIL.Image
+import karrio.lib as lib
+import karrio.providers.tge.bundle as bundle
+from .test_shipment import ShipmentResponse
+
+
+class TestTGELabelBundle(unittest.TestCase):
+    def setUp(self):
+        self.label = lib.to_dict(ShipmentResponse)["TollMessage"]["ResponseMessages"][
+            "ResponseMessage"
+        ][0]["ResponseMessage"]
+
+    def test_bundle_pdfs(self):
+        labels = [self.label] * 3
+        expected = read_pdf(lib.bundle_base64(labels, "PDF"))
+
+        document = read_pdf(bundle.bundle_base64(iter(labels), "PDF"))
+
+        self.assertEqual(len(document.pages), len(expected.pages))
+        self.assertListEqual(
+            [page.extract_text() for page in document.pages],
+            [page.extract_text() for page in expected.pages],
+        )
+
+    def test_bundle_pdfs_releases_each_label(self):
+        readers = []
+        reader_type = PyPDF2.PdfReader
+
+        def read(*args, **kwargs):
+            reader = reader_type(*args, **kwargs)
+            readers.append(weakref.ref(reader))
+            return reader
+
+        with patch.object(bundle.PyPDF2, "PdfReader", side_effect=read):
+            output = bundle.bundle_base64([self.label] * 3, "PDF")
+
+        gc.collect()
+
+        self.assertEqual(len(read_pdf(output).pages), 3)
+        self.assertListEqual([_() for _ in readers], [None, None, None])
+
+    def test_bundle_zpls(self):
+        labels = [
+            base64.b64encode(f"^XA^FD{index}^FS^XZ".encode("utf-8")).decode("utf-8")
+            for index in range(3)
+        ]
+
+        self.assertEqual(
+            bundle.bundle_base64(labels, "ZPL"),
+            lib.bundle_base64(labels, "ZPL"),
+        )
+
+    def test_bundle_images(self):
+        labels = [create_png("red", (40, 20)), create_png("blue", (30, 50))]
+
+        self.assertEqual(
+            bundle.bundle_base64(labels, "PNG"),
+            lib.bundle_base64(labels, "PNG"),
+        )
+
+    def test_encode_chunks(self):
+        content = bytes(range(256)) * 10000
+
+        with patch_chunk_size(3 * 100):
+            encoded = bundle.encode_chunks(io.BytesIO(content))
+
+        self.assertEqual(encoded, base64.b64encode(content).decode("utf-8"))
+
+
+def read_pdf(b64_str: str) -> PyPDF2.PdfReader:
+    return PyPDF2.PdfReader(io.BytesIO(base64.b64decode(b64_str)), strict=True)
+
+
+def create_png(color: str, size: tuple) -> str:
+    buffer = io.BytesIO()
+    PIL.Image.new("RGB", size, color).save(buffer, "PNG")
+
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def patch_chunk_size(size: int):
+    return patch.object(bundle, "ENCODE_CHUNK_SIZE", size)
+
+
+if __name__ == "__main__":
+    unittest.main()
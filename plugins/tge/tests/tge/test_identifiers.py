@@ -0,0 +1,231 @@
+import random
+import unittest
+import multiprocessing
+from .fixture import gateway
+
+import karrio.sdk as karrio
+import karrio.lib as lib
+import karrio.core.errors as errors
+import karrio.providers.tge.units as provider_units
+import karrio.providers.tge.utils as provider_utils
+
+
+class TestTGEIdentifiers(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.store = LocalStore()
+        self.settings = karrio.gateway["tge"].create(
+            SettingsData, cache=lib.Cache(self.store)
+        ).settings
+        self.options = lib.to_shipping_options(
+            {}, initializer=provider_units.shipping_options_initializer
+        )
+
+    def test_next_shipment_identifiers_from_reserved_block(self):
+        first = self.settings.next_shipment_identifiers(self.options, 2)
+        second = self.settings.next_shipment_identifiers(self.options, 1)
+
+        self.assertListEqual(
+            [list(first), list(second)],
+            [
+                [
+                    ["8880419999995", "8880419999996"],
+                    ["00093275103417610023", "00093275103417610030"],
+                    10000004,
+                    341761011,
+                ],
+                [
+                    ["8880419999997"],
+                    ["00093275103417610047"],
+                    10000004,
+                    341761011,
+                ],
+            ],
+        )
+        self.assertDictEqual(
+            self.store.values,
+            {
+                "tge|api_key|sscc_count": 341761011,
+                "tge|api_key|shipment_count": 10000004,
+            },
+        )
+
+    def test_next_shipment_identifiers_spans_blocks(self):
+        ShipmentIDs, SSCCs, shipment_count, sscc_count = (
+            self.settings.next_shipment_identifiers(self.options, 25)
+        )
+
+        self.assertEqual(len(set(SSCCs)), 25)
+        self.assertEqual(SSCCs[-1], "00093275103417610269")
+        self.assertEqual((shipment_count, sscc_count), (10000024, 341761031))
+
+    def test_next_shipment_identifiers_keep_counters_of_given_ids(self):
+        options = lib.to_shipping_options(
+            dict(tge_ssc_ids=["00093275100000000001"], tge_shipment_ids=["888041"]),
+            initializer=provider_units.shipping_options_initializer,
+        )
+
+        result = self.settings.next_shipment_identifiers(options, 1)
+
+        self.assertListEqual(
+            list(result), [["888041"], ["00093275100000000001"], 9999994, 341761001]
+        )
+        self.assertDictEqual(self.store.values, {})
+
+    def test_next_shipment_identifiers_follow_a_raised_range_start(self):
+        self.settings.next_shipment_identifiers(self.options, 10)
+        settings = karrio.gateway["tge"].create(
+            {**SettingsData, "sscc_count": 341770000}, cache=lib.Cache(self.store)
+        ).settings
+
+        _, SSCCs, _, sscc_count = settings.next_shipment_identifiers(self.options, 1)
+
+        self.assertEqual(
+            SSCCs, [f"00{provider_utils.calculate_sscc(9327510, 341770001, 0)}"]
+        )
+        self.assertEqual(sscc_count, 341770010)
+
+    def test_next_shipment_identifiers_are_unique_across_processes(self):
+        with multiprocessing.Manager() as manager:
+            store = SharedStore(manager.dict(), manager.Lock())
+            results = manager.list()
+            processes = [
+                multiprocessing.Process(
+                    target=allocate_identifiers, args=(store, results, 200)
+                )
+                for _ in range(4)
+            ]
+
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            ShipmentIDs = [_ for ids, _ in results for _ in ids]
+            SSCCs = [_ for _, ids in results for _ in ids]
+
+        self.assertEqual(len(ShipmentIDs), 4 * 200 * 3)
+        self.assertEqual(len(set(ShipmentIDs)), len(ShipmentIDs))
+        self.assertEqual(len(set(SSCCs)), len(SSCCs))
+
+    def test_calculate_ssccs_matches_calculate_sscc(self):
+        generator = random.Random(20241018)
+        cases = [(9327510, 0, 1200), (9327510, 341761001, 2500)] + [
+            (
+                generator.randrange(10 ** generator.randrange(1, 12)),
+                generator.randrange(10 ** generator.randrange(1, 10)),
+                generator.randrange(1, 1500),
+            )
+            for _ in range(50)
+        ]
+
+        for gs1, sscc, count in cases:
+            self.assertListEqual(
+                provider_utils.calculate_ssccs(gs1, sscc, count),
+                [provider_utils.calculate_sscc(gs1, sscc, _) for _ in range(count)],
+                (gs1, sscc, count),
+            )
+
+    def test_next_shipment_identifiers_stop_at_the_sscc_range_end(self):
+        settings = karrio.gateway["tge"].create(
+            {
+                **SettingsData,
+                "config": {**SettingsData["config"], "SSCC_range_end": 341761015},
+            },
+            cache=lib.Cache(self.store),
+        ).settings
+        settings.next_shipment_identifiers(self.options, 14)
+
+        with self.assertRaisesRegex(errors.ShippingSDKError, "range is exhausted"):
+            settings.next_shipment_identifiers(self.options, 1)
+
+    def test_next_shipment_identifiers_stop_at_the_sscc_range_end_without_store(self):
+        settings = karrio.gateway["tge"].create(
+            {
+                **SettingsData,
+                "config": {**SettingsData["config"], "SSCC_range_end": 341761002},
+            }
+        ).settings
+
+        with self.assertRaisesRegex(errors.ShippingSDKError, "range is exhausted"):
+            settings.next_shipment_identifiers(self.options, 2)
+
+
+def allocate_identifiers(store, results, shipment_count: int):
+    settings = karrio.gateway["tge"].create(
+        SettingsData, cache=lib.Cache(store)
+    ).settings
+    options = lib.to_shipping_options(
+        {}, initializer=provider_units.shipping_options_initializer
+    )
+    allocations = [
+        settings.next_shipment_identifiers(options, 3)[:2]
+        for _ in range(shipment_count)
+    ]
+
+    results.append(
+        (
+            [_ for ids, __ in allocations for _ in ids],
+            [_ for __, ids in allocations for _ in ids],
+        )
+    )
+
+
+class LocalStore:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, **kwargs):
+        self.values[key] = value
+
+    def add(self, key, value, timeout=None):
+        if key in self.values:
+            return False
+
+        self.values[key] = value
+        return True
+
+    def incr(self, key, delta=1):
+        self.values[key] += delta
+        return self.values[key]
+
+
+class SharedStore(LocalStore):
+    def __init__(self, values, lock):
+        self.values = values
+        self.lock = lock
+
+    def add(self, key, value, timeout=None):
+        with self.lock:
+            return super().add(key, value, timeout)
+
+    def incr(self, key, delta=1):
+        with self.lock:
+            return super().incr(key, delta)
+
+
+SettingsData = dict(
+    **{
+        key: getattr(gateway.settings, key)
+        for key in [
+            "api_key",
+            "username",
+            "password",
+            "toll_username",
+            "toll_password",
+            "my_toll_token",
+            "my_toll_identity",
+            "account_code",
+            "shipment_count",
+            "sscc_count",
+        ]
+    },
+    config={**gateway.settings.config, "identifier_block_size": 10},
+)
+
+
+if __name__ == "__main__":
+    unittest.main()
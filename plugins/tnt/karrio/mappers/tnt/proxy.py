@@ -1,3 +1,5 @@
+import time
+import typing
 import urllib.parse
 import karrio.lib as lib
 import karrio.api.proxy as proxy
@@ -26,60 +28,69 @@ class Proxy(proxy.Proxy):
         return lib.Deserializable(response, lib.to_element)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable[str]:
-        ctx: dict = {}
-        shipment_response = lib.request(
-            url=f"{self.settings.server_url}/expressconnect/shipping/ship",
-            data=urllib.parse.urlencode(dict(xml_in=request.serialize())),
-            trace=self.trace_as("xml"),
-            method="POST",
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"Basic {self.settings.authorization}",
-            },
+        started_at = time.perf_counter()
+        skip_rendering = self.settings.connection_config.skip_label_rendering.state
+        shipment_response = self._send_request(
+            "/expressconnect/shipping/ship", dict(xml_in=request.serialize())
         )
+        response = lib.to_element(shipment_response)
+        timings: dict = dict(ship=_elapsed(started_at))
 
-        label_request = provider_utils.create_label_request(
-            shipment_response, self.settings, request.ctx
-        )
+        def retrieve_label(args: typing.Tuple[str, lib.Serializable]) -> dict:
+            consignment_number, label_request = args
+            stage = dict(consignment=consignment_number)
 
-        if label_request is not None:
-            label_response = lib.request(
-                url=f"{self.settings.server_url}/expresslabel/documentation/getlabel",
-                trace=self.trace_as("xml"),
-                method="POST",
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "Authorization": f"Basic {self.settings.authorization}",
-                },
-                data=urllib.parse.urlencode(dict(xml_in=label_request.serialize())),
+            started_at = time.perf_counter()
+            label_response = self._send_request(
+                "/expresslabel/documentation/getlabel",
+                dict(xml_in=label_request.serialize()),
             )
+            stage.update(label=_elapsed(started_at))
 
-            label_errors = provider_error.parse_error_response(
-                lib.to_element(label_response), self.settings
-            )
+            if provider_error.has_errors(lib.to_element(label_response)):
+                return stage
 
-            if not any(label_errors):
-                label = lib.request(
-                    url=f"{self.settings.server_url}/expresswebservices-website/app/render.html",
-                    trace=self.trace_as("xml"),
-                    method="POST",
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded",
-                        "Authorization": f"Basic {self.settings.authorization}",
-                    },
-                    data=urllib.parse.urlencode(
-                        dict(
-                            responseXml=label_response,
-                            documentType="routingLabel",
-                            contentType="pdf",
-                        ),
-                    ),
-                    decoder=lib.encode_base64,
+            if skip_rendering:
+                return dict(
+                    **stage, document=lib.encode_base64(label_response.encode("utf-8"))
                 )
 
-                ctx.update(label=label)
+            started_at = time.perf_counter()
+            document = self._send_request(
+                "/expresswebservices-website/app/render.html",
+                dict(
+                    responseXml=label_response,
+                    documentType="routingLabel",
+                    contentType="pdf",
+                ),
+                decoder=lib.encode_base64,
+            )
+
+            return dict(**stage, render=_elapsed(started_at), document=document)
 
-        return lib.Deserializable(shipment_response, lib.to_element, ctx=ctx)
+        stages = lib.run_asynchronously(
+            retrieve_label,
+            provider_utils.create_label_requests(response, request.ctx),
+        )
+        timings.update(
+            consignments=[
+                {key: value for key, value in stage.items() if key != "document"}
+                for stage in stages
+            ],
+            total=_elapsed(started_at),
+        )
+        self.trace_as("json")(timings, "timings")
+        documents = [stage["document"] for stage in stages if "document" in stage]
+
+        return lib.Deserializable(
+            shipment_response,
+            lambda _: response,
+            ctx=lib.identity(
+                dict(label_responses=documents)
+                if skip_rendering
+                else dict(labels=documents)
+            ),
+        )
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
         response = lib.request(
@@ -95,3 +106,21 @@ class Proxy(proxy.Proxy):
         )
 
         return lib.Deserializable(response, lib.to_element)
+
+    def _send_request(self, path: str, data: dict, **kwargs) -> str:
+        return lib.request(
+            url=f"{self.settings.server_url}{path}",
+            data=urllib.parse.urlencode(data),
+            trace=self.trace_as("xml"),
+            method="POST",
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Authorization": f"Basic {self.settings.authorization}",
+            },
+            **kwargs,
+        )
+
+
+def _elapsed(started_at: float) -> float:
+    """Milliseconds elapsed since `started_at`."""
+    return round((time.perf_counter() - started_at) * 1000, 3)
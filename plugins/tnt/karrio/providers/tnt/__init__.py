@@ -6,5 +6,6 @@ from karrio.providers.tnt.shipment import (
 )
 from karrio.providers.tnt.tracking import (
     parse_tracking_response,
+    stream_tracking_response,
     tracking_request,
 )
@@ -9,27 +9,36 @@ def parse_error_response(
     response,
     settings: provider_utils.Settings,
 ) -> typing.List[models.Message]:
-    structure_errors = lib.find_element("ErrorStructure", response)
-    broken_rules_nodes = lib.find_element("brokenRules", response)
-    broken_rule_nodes = lib.find_element("brokenRule", response)
-    runtime_errors = lib.find_element("runtime_error", response)
-    parse_errors = lib.find_element("parse_error", response)
-    ERRORS = lib.find_element("ERROR", response)
-    errors = lib.find_element("Error", response)
-    faults = lib.find_element("fault", response)
+    return parse_error_nodes(_error_nodes(response), settings)
+
+
+def parse_error_nodes(
+    error_nodes: typing.Iterable[lib.Element],
+    settings: provider_utils.Settings,
+) -> typing.List[models.Message]:
+    """Extract the messages of already located error elements."""
+    nodes: typing.Dict[str, typing.List[lib.Element]] = {tag: [] for tag in ERROR_TAGS}
+
+    for node in error_nodes:
+        nodes[node.tag.rpartition("}")[-1]].append(node)
 
     return [
-        *[_extract_structure_error(node, settings) for node in structure_errors],
-        *[_extract_broken_rules(node, settings) for node in broken_rules_nodes],
-        *[_extract_broken_rule(node, settings) for node in broken_rule_nodes],
-        *[_extract_runtime_error(node, settings) for node in runtime_errors],
-        *[_extract_parse_error(node, settings) for node in parse_errors],
-        *[_extract_structure_error(node, settings) for node in errors],
-        *[_extract_error(node, settings) for node in ERRORS],
-        *[_extract_faut(node, settings) for node in faults],
+        ERROR_EXTRACTORS[tag](node, settings)
+        for tag in ERROR_TAGS
+        for node in nodes[tag]
     ]
 
 
+def has_errors(response) -> bool:
+    """Return whether the response holds an error, stopping at the first one."""
+    return next(_error_nodes(response), None) is not None
+
+
+def _error_nodes(response) -> typing.Iterator[lib.Element]:
+    # a single traversal yielding the error elements in document order
+    return response.iterdescendants(*[f"{{*}}{tag}" for tag in ERROR_TAGS])
+
+
 def _extract_structure_error(
     node: lib.Element, settings: provider_utils.Settings
 ) -> models.Message:
@@ -146,3 +155,19 @@ def _extract_faut(
         # carrier error info
         code=lib.find_element("key", node, first=True).text,
     )
+
+
+# error tags in the order their messages are reported
+ERROR_EXTRACTORS: typing.Dict[
+    str, typing.Callable[[lib.Element, provider_utils.Settings], models.Message]
+] = {
+    "ErrorStructure": _extract_structure_error,
+    "brokenRules": _extract_broken_rules,
+    "brokenRule": _extract_broken_rule,
+    "runtime_error": _extract_runtime_error,
+    "parse_error": _extract_parse_error,
+    "Error": _extract_structure_error,
+    "ERROR": _extract_error,
+    "fault": _extract_faut,
+}
+ERROR_TAGS = list(ERROR_EXTRACTORS.keys())
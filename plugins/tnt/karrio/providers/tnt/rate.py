@@ -19,16 +19,11 @@ def parse_rate_response(
     services: typing.List[rating.ratedServices] = lib.find_element(
         "ratedServices", response, rating.ratedServices
     )
-    rates: typing.List[models.RateDetails] = sum(
-        [
-            [
-                _extract_details((rate, svc.currency), settings)
-                for rate in svc.ratedService
-            ]
-            for svc in services
-        ],
-        start=[],
-    )
+    rates: typing.List[models.RateDetails] = [
+        _extract_details((rate, svc.currency), settings)
+        for svc in services
+        for rate in svc.ratedService
+    ]
 
     return rates, messages
 
@@ -34,14 +34,31 @@ def _extract_detail(
     settings: provider_utils.Settings,
     ctx: dict,
 ) -> typing.Optional[models.ShipmentDetails]:
-    label = ctx.get("label")
+    label_type = "PDF"
+    label, *extra_labels = ctx.get("labels") or [None]
 
     return models.ShipmentDetails(
         carrier_name=settings.carrier_name,
         carrier_id=settings.carrier_id,
         tracking_number=detail.CONNUMBER,
         shipment_identifier=detail.CONREF,
-        docs=models.Documents(label=label),
+        label_type=label_type,
+        docs=models.Documents(
+            label=label,
+            extra_documents=[
+                models.ShippingDocument(
+                    category="label", format=label_type, base64=extra_label
+                )
+                for extra_label in extra_labels
+            ],
+        ),
+        meta=lib.identity(
+            # the unrendered getlabel XML, base64 encoded, when rendering is
+            # skipped with `skip_label_rendering`
+            dict(label_responses=ctx["label_responses"])
+            if ctx.get("label_responses")
+            else None
+        ),
     )
 
 
@@ -223,4 +240,11 @@ def shipment_request(
         ),
     )
 
-    return lib.Serializable(request, lib.to_xml, dict(payload=payload))
+    return lib.Serializable(
+        request,
+        lib.to_xml,
+        dict(
+            payload=payload,
+            label_consignment=provider_utils.label_consignment(payload, settings),
+        ),
+    )
@@ -1,17 +1,31 @@
 import karrio.schemas.tnt.tracking_request as tnt
 import karrio.schemas.tnt.tracking_response as tracking
 import typing
+import lxml.etree
 import karrio.lib as lib
 import karrio.core.models as models
 import karrio.providers.tnt.error as provider_error
 import karrio.providers.tnt.utils as provider_utils
 import karrio.providers.tnt.units as provider_units
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def parse_tracking_response(
     _response: lib.Deserializable[lib.Element],
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
+    if settings.connection_config.stream_tracking.state:
+        try:
+            streamed = list(stream_tracking_response(_response, settings))
+
+            return (
+                [detail for details, _ in streamed for detail in details],
+                [message for _, messages in streamed for message in messages],
+            )
+        except lxml.etree.XMLSyntaxError:
+            pass  # not well-formed XML, leave it to the lenient DOM parser below
+
     response = _response.deserialize()
     messages = provider_error.parse_error_response(response, settings)
     tracking_details = [
@@ -22,6 +36,51 @@ def parse_tracking_response(
     return tracking_details, messages
 
 
+def stream_tracking_response(
+    _response: lib.Deserializable[lib.Element],
+    settings: provider_utils.Settings,
+) -> typing.Iterator[
+    typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]
+]:
+    """Parse the raw tracking response incrementally without building its DOM.
+
+    The details of every consignment are yielded as soon as the element is
+    parsed, then discarded. The error messages are yielded last, in the order
+    `parse_error_response` reports them.
+    """
+    error_nodes: typing.List[lib.Element] = []
+
+    for node in _iterparse(_response.value, "Consignment", *provider_error.ERROR_TAGS):
+        if node.tag.rpartition("}")[-1] != "Consignment":
+            # the DOM parse only looks at the descendants of the root
+            if node.getparent() is not None:
+                error_nodes.append(node)
+            continue
+
+        yield [_extract_detail(node, settings)], []
+
+        node.clear()
+        while node.getprevious() is not None:
+            del node.getparent()[0]
+
+    yield [], provider_error.parse_error_nodes(error_nodes, settings)
+
+
+def _iterparse(
+    text: typing.Union[str, bytes], *tags: str
+) -> typing.Iterator[lib.Element]:
+    parser = lxml.etree.XMLPullParser(
+        events=("end",), tag=[f"{{*}}{tag}" for tag in tags]
+    )
+
+    for start in range(0, len(text), STREAM_CHUNK_SIZE):
+        parser.feed(text[start : start + STREAM_CHUNK_SIZE])
+        yield from (node for _, node in parser.read_events())
+
+    parser.close()
+    yield from (node for _, node in parser.read_events())
+
+
 def _extract_detail(
     node: dict, settings: provider_utils.Settings
 ) -> models.TrackingDetails:
@@ -45,22 +104,8 @@ def _extract_detail(
                     lib.text(status.LocalEventDate.valueOf_, status.LocalEventTime.valueOf_, separator=" "),
                     current_format="%Y%m%d %H%M",
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if status.StatusCode in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if status.StatusCode in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(status.StatusCode),
+                reason=provider_units.find_incident_reason(status.StatusCode),
             )
             for status in events
         ],
@@ -1,5 +1,7 @@
 """ TNT Native Types """
 
+import typing
+import functools
 import karrio.lib as lib
 
 PRESET_DEFAULTS = dict(dimension_unit="CM", weight_unit="KG")
@@ -95,6 +97,8 @@ class PaymentType(lib.StrEnum):
 class ConnectionConfig(lib.Enum):
     app_id = lib.OptionEnum("app_id")
     email_from = lib.OptionEnum("email_from")
+    skip_label_rendering = lib.OptionEnum("skip_label_rendering", bool)
+    stream_tracking = lib.OptionEnum("stream_tracking", bool)
 
 
 class ShippingService(lib.StrEnum):
@@ -180,3 +184,20 @@ def shipping_options_initializer(
     return lib.units.ShippingOptions(
         _options, ShippingOption, items_filter=items_filter
     )
+
+
+@functools.lru_cache(maxsize=1024)
+def find_code(enum_type: typing.Type[lib.Enum], code: typing.Any) -> typing.Optional[str]:
+    """Return the name of the enum member listing the code (`lib.Enum.find`).
+
+    Results are cached as tracking responses repeat the same few codes.
+    """
+    return enum_type.find(code).name
+
+
+def find_tracking_status(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingStatus, code) or default
+
+
+def find_incident_reason(code: typing.Any, default: str = None) -> typing.Optional[str]:
+    return find_code(TrackingIncidentReason, code) or default
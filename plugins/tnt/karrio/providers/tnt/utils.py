@@ -1,5 +1,6 @@
 import karrio.schemas.tnt.label_request as tnt
 import karrio.schemas.tnt.shipping_response as shipping
+import copy
 import typing
 import base64
 import karrio.lib as lib
@@ -41,122 +42,172 @@ class Settings(core.Settings):
         )
 
 
-def create_label_request(
-    shipment_response: str,
+def label_consignment(
+    payload: models.ShipmentRequest,
     settings: Settings,
-    ctx: dict,
-) -> typing.Optional[lib.Serializable]:
-    import karrio.providers.tnt.units as provider_units
+) -> tnt.labelConsignmentsType:
+    """Build the label request consignment of a shipment request.
 
-    payload: models.ShipmentRequest = ctx.get("payload")
-    response = lib.to_element(shipment_response)
-    consignment = lib.find_element("CONNUMBER", response, first=True)
-    groupcode = lib.find_element("GROUPCODE", response, first=True)
-    price: shipping.document = lib.find_element(
-        "PRICE", response, shipping.PRICE, first=True
-    )
-
-    if consignment is None or groupcode is None or price is None:
-        return None
+    The consignment number, group code and price are only known once the
+    shipment is created; `create_label_requests` fills them in.
+    """
+    import karrio.providers.tnt.units as provider_units
 
     shipper = lib.to_address(payload.shipper)
     recipient = lib.to_address(payload.recipient)
     packages = lib.to_packages(payload.parcels)
     customs = lib.to_customs_info(payload.customs)
 
-    request = tnt.labelRequest(
-        consignment=[
-            tnt.labelConsignmentsType(
-                key="1",
-                consignmentIdentity=tnt.consignmentIdentityType(
-                    consignmentNumber=getattr(consignment, "text", None),
-                    customerReference=payload.reference,
+    return tnt.labelConsignmentsType(
+        key="1",
+        consignmentIdentity=tnt.consignmentIdentityType(
+            consignmentNumber=None,
+            customerReference=payload.reference,
+        ),
+        collectionDateTime=None,
+        sender=tnt.nameAndAddressRequestType(
+            name=recipient.contact,
+            addressLine1=shipper.street,
+            addressLine2=shipper.address_line2,
+            addressLine3=None,
+            town=shipper.city,
+            exactMatch=None,
+            province=shipper.state_code,
+            postcode=shipper.postal_code,
+            country=shipper.country_code,
+        ),
+        delivery=tnt.nameAndAddressRequestType(
+            name=recipient.contact,
+            addressLine1=recipient.street,
+            addressLine2=recipient.address_line2,
+            addressLine3=None,
+            town=recipient.city,
+            exactMatch=None,
+            province=recipient.state_code,
+            postcode=recipient.postal_code,
+            country=recipient.country_code,
+        ),
+        contact=tnt.contactType(
+            name=shipper.person_name,
+            telephoneNumber=shipper.phone_number,
+            emailAddress=shipper.email,
+        ),
+        product=None,
+        account=tnt.accountType(
+            accountNumber=settings.account_number,
+            accountCountry=settings.account_country_code,
+        ),
+        cashAmount=None,
+        cashCurrency=None,
+        cashType=None,
+        ncolNumber=None,
+        specialInstructions=None,
+        bulkShipment="N",
+        customControlled=("N" if payload.customs is None else "Y"),
+        termsOfPayment=provider_units.PaymentType.map(
+            getattr(payload.payment, "paidby", "sender")
+        ).value,
+        totalNumberOfPieces=len(packages),
+        pieceLine=[
+            tnt.pieceLineType(
+                identifier=1,
+                goodsDescription=package.parcel.description,
+                barcodeForCustomer="Y",
+                pieceMeasurements=tnt.measurementsType(
+                    length=package.length.M,
+                    width=package.width.M,
+                    height=package.height.M,
+                    weight=package.weight.KG,
                 ),
-                collectionDateTime=None,
-                sender=tnt.nameAndAddressRequestType(
-                    name=recipient.contact,
-                    addressLine1=shipper.street,
-                    addressLine2=shipper.address_line2,
-                    addressLine3=None,
-                    town=shipper.city,
-                    exactMatch=None,
-                    province=shipper.state_code,
-                    postcode=shipper.postal_code,
-                    country=shipper.country_code,
+                pieces=(
+                    [
+                        tnt.pieceType(
+                            sequenceNumbers=(index + 1),
+                            pieceReference=piece.sku or piece.hs_code,
+                        )
+                        for index, piece in enumerate(
+                            (
+                                package.items
+                                if len(package.items) > 0
+                                else customs.commodities
+                            ),
+                            start=1,
+                        )
+                    ]
+                    if len(package.items) > 0 or len(customs.commodities) > 0
+                    else None
                 ),
-                delivery=tnt.nameAndAddressRequestType(
-                    name=recipient.contact,
-                    addressLine1=recipient.street,
-                    addressLine2=recipient.address_line2,
-                    addressLine3=None,
-                    town=recipient.city,
-                    exactMatch=None,
-                    province=recipient.state_code,
-                    postcode=recipient.postal_code,
-                    country=recipient.country_code,
-                ),
-                contact=tnt.contactType(
-                    name=shipper.person_name,
-                    telephoneNumber=shipper.phone_number,
-                    emailAddress=shipper.email,
-                ),
-                product=tnt.productType(
-                    lineOfBusiness=None,
-                    groupId=getattr(groupcode, "text", None),
-                    subGroupId=None,
-                    id=price.SERVICE,
-                    type_=price.SERVICEDESC,
-                    option=price.OPTION,
-                ),
-                account=tnt.accountType(
-                    accountNumber=settings.account_number,
-                    accountCountry=settings.account_country_code,
-                ),
-                cashAmount=price.RATE,
-                cashCurrency=price.CURRENCY,
-                cashType=None,
-                ncolNumber=None,
-                specialInstructions=None,
-                bulkShipment="N",
-                customControlled=("N" if payload.customs is None else "Y"),
-                termsOfPayment=provider_units.PaymentType.map(
-                    getattr(payload.payment, "paidby", "sender")
-                ).value,
-                totalNumberOfPieces=len(packages),
-                pieceLine=[
-                    tnt.pieceLineType(
-                        identifier=1,
-                        goodsDescription=package.parcel.description,
-                        barcodeForCustomer="Y",
-                        pieceMeasurements=tnt.measurementsType(
-                            length=package.length.M,
-                            width=package.width.M,
-                            height=package.height.M,
-                            weight=package.weight.KG,
-                        ),
-                        pieces=(
-                            [
-                                tnt.pieceType(
-                                    sequenceNumbers=(index + 1),
-                                    pieceReference=piece.sku or piece.hs_code,
-                                )
-                                for index, piece in enumerate(
-                                    (
-                                        package.items
-                                        if len(package.items) > 0
-                                        else customs.commodities
-                                    ),
-                                    start=1,
-                                )
-                            ]
-                            if len(package.items) > 0 or len(customs.commodities) > 0
-                            else None
-                        ),
-                    )
-                    for package in packages
-                ],
             )
-        ]
+            for package in packages
+        ],
+    )
+
+
+def create_label_requests(
+    response: lib.Element,
+    ctx: dict,
+) -> typing.List[typing.Tuple[str, lib.Serializable]]:
+    """Return a `(consignment number, label request)` per created consignment.
+
+    The shipment response tree is walked once to collect the group code, the
+    created consignments and their prices. A price is matched to its
+    consignment by RATEID, which TNT sets to the consignment CONREF; the
+    product and cash amount are left unset when no price matches.
+    """
+    template: tnt.labelConsignmentsType = ctx.get("label_consignment")
+    groupcode, creates, prices = None, [], {}
+
+    for node in response.iter():
+        tag = node.tag.rsplit("}", 1)[-1] if isinstance(node.tag, str) else None
+
+        if tag == "GROUPCODE" and groupcode is None:
+            groupcode = node.text
+        elif tag == "CREATE":
+            creates.append(lib.to_object(shipping.CREATE, node))
+        elif tag == "PRICE":
+            price = lib.to_object(shipping.PRICE, node)
+            prices.setdefault(price.RATEID, price)
+
+    if template is None or groupcode is None:
+        return []
+
+    requests = []
+
+    for create in creates:
+        if create.SUCCESS != "Y" or create.CONNUMBER is None:
+            continue
+
+        requests.append(
+            (
+                create.CONNUMBER,
+                _label_request(template, create, groupcode, prices.get(create.CONREF)),
+            )
+        )
+
+    return requests
+
+
+def _label_request(
+    template: tnt.labelConsignmentsType,
+    create: shipping.CREATE,
+    groupcode: str,
+    price: typing.Optional[shipping.PRICE],
+) -> lib.Serializable:
+    consignment = copy.deepcopy(template)
+    consignment.consignmentIdentity.consignmentNumber = create.CONNUMBER
+
+    if price is None:
+        return lib.Serializable(tnt.labelRequest(consignment=[consignment]), lib.to_xml)
+
+    consignment.product = tnt.productType(
+        lineOfBusiness=None,
+        groupId=groupcode,
+        subGroupId=None,
+        id=price.SERVICE,
+        type_=price.SERVICEDESC,
+        option=price.OPTION,
     )
+    consignment.cashAmount = price.RATE
+    consignment.cashCurrency = price.CURRENCY
 
-    return lib.Serializable(request, lib.to_xml)
+    return lib.Serializable(tnt.labelRequest(consignment=[consignment]), lib.to_xml)
@@ -0,0 +1,67 @@
+"""Benchmark the TNT error collector against one XPath search per error tag.
+
+Run from the plugin directory with `python -m tests.tnt.bench_errors`.
+"""
+
+import timeit
+import karrio.lib as lib
+import karrio.providers.tnt.error as provider_error
+from tests.tnt.fixture import gateway
+from tests.tnt.test_rate import RateResponse
+from tests.tnt.test_shipment import LabelResponse, ShipmentResponse
+from tests.tnt.test_tracking import TRACKING_ERROR_RESPONSE, TRACKING_RESPONSE
+
+NUMBER = 2_000
+CONSIGNMENTS = 500
+
+
+def main():
+    settings = gateway.settings
+    consignment = lib.to_xml(lib.to_element(TRACKING_RESPONSE).find("Consignment"))
+    documents = [
+        ("tracking", lib.to_element(TRACKING_RESPONSE), NUMBER),
+        ("shipment", lib.to_element(ShipmentResponse), NUMBER),
+        ("label", lib.to_element(LabelResponse), NUMBER),
+        ("rate", lib.to_element(RateResponse), NUMBER),
+        ("error", lib.to_element(TRACKING_ERROR_RESPONSE), NUMBER),
+        (
+            f"tracking x {CONSIGNMENTS} consignments",
+            lib.to_element(
+                "<TrackResponse>"
+                + consignment * CONSIGNMENTS
+                + "</TrackResponse>"
+            ),
+            50,
+        ),
+    ]
+
+    for name, document, number in documents:
+        assert lib.to_dict(search_per_tag(document, settings)) == lib.to_dict(
+            provider_error.parse_error_response(document, settings)
+        )
+
+        per_tag = _best(lambda: search_per_tag(document, settings), number)
+        collected = _best(
+            lambda: provider_error.parse_error_response(document, settings), number
+        )
+        print(
+            f"{name} ({number:,} iterations): "
+            f"per tag {per_tag * 1000:.0f} ms, single pass {collected * 1000:.0f} ms"
+        )
+
+
+def search_per_tag(document: lib.Element, settings):
+    # the former parse_error_response, one document search per error tag
+    return [
+        provider_error.ERROR_EXTRACTORS[tag](node, settings)
+        for tag in provider_error.ERROR_TAGS
+        for node in lib.find_element(tag, document)
+    ]
+
+
+def _best(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3))
+
+
+if __name__ == "__main__":
+    main()
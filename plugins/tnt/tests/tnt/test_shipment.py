@@ -1,4 +1,5 @@
 import unittest
+import urllib.parse
 from unittest.mock import patch, ANY
 from .fixture import gateway
 
@@ -44,6 +45,104 @@ class TestTNTShipping(unittest.TestCase):
 
             self.assertListEqual(lib.to_dict(parsed_response), ParsedShipmentResponse)
 
+    def test_create_shipment_without_label_rendering(self):
+        gateway_without_rendering = karrio.gateway["tnt"].create(
+            dict(
+                username="username",
+                password="password",
+                account_number="3230493849304",
+                config=dict(skip_label_rendering=True),
+            )
+        )
+
+        with patch("karrio.mappers.tnt.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, LabelResponse]
+            parsed_response = (
+                karrio.Shipment.create(self.ShipmentRequest)
+                .from_(gateway_without_rendering)
+                .parse()
+            )
+
+            self.assertEqual(len(mock.call_args_list), 2)
+            self.assertDictEqual(lib.to_dict(parsed_response)[0]["docs"], {})
+            self.assertEqual(lib.to_dict(parsed_response)[0]["label_type"], "PDF")
+            self.assertListEqual(
+                lib.to_dict(parsed_response)[0]["meta"]["label_responses"],
+                [lib.encode_base64(LabelResponse.encode("utf-8"))],
+            )
+
+    def test_create_shipment_requires_a_successful_create(self):
+        with patch("karrio.mappers.tnt.proxy.lib.request") as mock:
+            mock.side_effect = [FailedCreateShipmentResponse]
+            shipment, _ = (
+                karrio.Shipment.create(self.ShipmentRequest).from_(gateway).parse()
+            )
+
+            self.assertIsNone(shipment)
+            self.assertEqual(len(mock.call_args_list), 1)
+
+    def test_label_request_without_a_matching_price(self):
+        with patch("karrio.mappers.tnt.proxy.lib.request") as mock:
+            mock.side_effect = [
+                ShipmentResponse.replace(
+                    "<RATEID>ref01_008</RATEID>", "<RATEID>other</RATEID>"
+                ),
+                LabelResponse,
+                RenderLabelResponse,
+            ]
+            karrio.Shipment.create(self.ShipmentRequest).from_(gateway)
+            label_request = lib.to_element(
+                urllib.parse.parse_qs(mock.call_args_list[1][1]["data"])["xml_in"][0]
+            )
+
+            self.assertIsNone(lib.find_element("product", label_request, first=True))
+            self.assertIsNone(lib.find_element("cashAmount", label_request, first=True))
+
+    def test_create_multi_consignment_shipment(self):
+        with patch("karrio.mappers.tnt.proxy.lib.request") as mock:
+            mock.side_effect = lambda url, data, **_: (
+                MultiConsignmentShipmentResponse
+                if url.endswith("/ship")
+                else LabelResponse if url.endswith("/getlabel") else data[-20:]
+            )
+            parsed_response = (
+                karrio.Shipment.create(self.ShipmentRequest).from_(gateway).parse()
+            )
+            label_requests = [
+                lib.to_element(urllib.parse.parse_qs(call[1]["data"])["xml_in"][0])
+                for call in mock.call_args_list
+                if call[1]["url"].endswith("/getlabel")
+            ]
+
+            self.assertListEqual(
+                sorted(
+                    lib.find_element("consignmentNumber", _, first=True).text
+                    for _ in label_requests
+                ),
+                ["GE000003364GB", "GE000003365GB"],
+            )
+            self.assertEqual(
+                len(lib.to_dict(parsed_response)[0]["docs"]["extra_documents"]), 1
+            )
+
+    def test_create_shipment_traces_stage_timings(self):
+        with patch("karrio.mappers.tnt.proxy.lib.request") as mock:
+            mock.side_effect = [ShipmentResponse, LabelResponse, RenderLabelResponse]
+            with patch.object(gateway.settings, "trace_as") as trace_as:
+                karrio.Shipment.create(self.ShipmentRequest).from_(gateway)
+
+            timings = next(
+                call[0][0]
+                for call in trace_as.return_value.call_args_list
+                if call[0][1] == "timings"
+            )
+
+            self.assertListEqual(sorted(timings.keys()), ["consignments", "ship", "total"])
+            self.assertListEqual(
+                sorted(timings["consignments"][0].keys()),
+                ["consignment", "label", "render"],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -134,6 +233,7 @@ ParsedShipmentResponse = [
         "carrier_id": "tnt",
         "carrier_name": "tnt",
         "docs": {"label": ANY},
+        "label_type": "PDF",
         "shipment_identifier": "ref01_008",
         "tracking_number": "GE000003364GB",
     },
@@ -373,6 +473,52 @@ ShipmentResponse = """<?xml version="1.0" encoding="utf-8" standalone="yes"?>
 </document>
 """
 
+FailedCreateShipmentResponse = """<?xml version="1.0" encoding="utf-8" standalone="yes"?>
+<document>
+    <GROUPCODE>1736</GROUPCODE>
+    <CREATE>
+        <CONREF>ref01_008</CONREF>
+        <CONNUMBER>GE000003364GB</CONNUMBER>
+        <SUCCESS>N</SUCCESS>
+    </CREATE>
+</document>
+"""
+
+MultiConsignmentShipmentResponse = """<?xml version="1.0" encoding="utf-8" standalone="yes"?>
+<document>
+    <GROUPCODE>1736</GROUPCODE>
+    <CREATE>
+        <CONREF>ref01_008</CONREF>
+        <CONNUMBER>GE000003364GB</CONNUMBER>
+        <SUCCESS>Y</SUCCESS>
+    </CREATE>
+    <CREATE>
+        <CONREF>ref01_009</CONREF>
+        <CONNUMBER>GE000003365GB</CONNUMBER>
+        <SUCCESS>Y</SUCCESS>
+    </CREATE>
+    <RATE>
+        <PRICE>
+            <RATEID>ref01_008</RATEID>
+            <SERVICE>15N</SERVICE>
+            <SERVICEDESC>Express</SERVICEDESC>
+            <OPTION>IN</OPTION>
+            <CURRENCY>GBP</CURRENCY>
+            <RATE>996.61</RATE>
+            <RESULT>Y</RESULT>
+        </PRICE>
+        <PRICE>
+            <RATEID>ref01_009</RATEID>
+            <SERVICE>15N</SERVICE>
+            <SERVICEDESC>Express</SERVICEDESC>
+            <CURRENCY>GBP</CURRENCY>
+            <RATE>120.00</RATE>
+            <RESULT>Y</RESULT>
+        </PRICE>
+    </RATE>
+</document>
+"""
+
 LabelResponse = """<?xml version="1.0" encoding="UTF-8"?>
 <labelResponse>
     <consignment key="CON1">
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch
 from .fixture import gateway
+import karrio.lib as lib
+import karrio.sdk as karrio
 from karrio.core.utils import DP
 from karrio.core.models import TrackingRequest
 from karrio.sdk import Tracking
@@ -37,6 +39,39 @@ class TestTNTTracking(unittest.TestCase):
                 PARSED_TRACKING_ERROR,
             )
 
+    def test_parse_streamed_tracking_response(self):
+        streaming_gateway = karrio.gateway["tnt"].create(
+            dict(
+                username="username",
+                password="password",
+                account_number="3230493849304",
+                config=dict(stream_tracking=True),
+            )
+        )
+
+        for response, expected in [
+            (TRACKING_RESPONSE, PARSED_TRACKING_RESPONSE),
+            (TRACKING_ERROR_RESPONSE, PARSED_TRACKING_ERROR),
+        ]:
+            parsed_response = streaming_gateway.mapper.parse_tracking_response(
+                lib.Deserializable(response, lib.to_element)
+            )
+
+            self.assertListEqual(DP.to_dict(parsed_response), DP.to_dict(expected))
+
+    def test_stream_tracking_response(self):
+        streamed = list(
+            gateway.mapper.stream_tracking_response(
+                lib.Deserializable(TRACKING_RESPONSE, lib.to_element)
+            )
+        )
+
+        self.assertListEqual(
+            [[_.tracking_number for _ in details] for details, _ in streamed],
+            [["123456782"], ["123456782"], ["22222222"], []],
+        )
+        self.assertListEqual(streamed[-1][1], [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -60,14 +60,7 @@ def _extract_details(
             })
 
     # Map carrier status to karrio standard tracking status
-    mapped_status = next(
-        (
-            status_enum.name
-            for status_enum in list(provider_units.TrackingStatus)
-            if status in status_enum.value
-        ),
-        status,
-    )
+    mapped_status = provider_units.find_tracking_status(status, status)
 
     return models.TrackingDetails(
         carrier_id=settings.carrier_id,
@@ -83,22 +76,8 @@ def _extract_details(
                 timestamp=lib.fiso_timestamp(
                     lib.text(event["date"], event["time"], separator=" ")
                 ),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if event["code"] in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if event["code"] in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(event["code"]),
+                reason=provider_units.find_incident_reason(event["code"]),
             )
             for event in events
         ],
@@ -5,6 +5,7 @@ import karrio.lib as lib
 import karrio.api.proxy as proxy
 import karrio.providers.zoom2u.error as provider_error
 import karrio.providers.zoom2u.utils as provider_utils
+import karrio.providers.zoom2u.fanout as provider_fanout
 import karrio.mappers.zoom2u.settings as provider_settings
 
 
@@ -62,7 +63,8 @@ class Proxy(proxy.Proxy):
 
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable[str]:
         def _get_tracking(reference: str):
-            return reference, lib.request(
+            return reference, provider_fanout.request(
+                self.settings,
                 url=f"{self.settings.server_url}/api/v1/delivery/status/{reference}",
                 trace=self.trace_as("json"),
                 method="GET",
@@ -73,8 +75,8 @@ class Proxy(proxy.Proxy):
                 on_error=provider_error.parse_http_response,
             )
 
-        responses: typing.List[typing.Tuple[str, str]] = lib.run_concurently(
-            _get_tracking, request.serialize()
+        responses: typing.List[typing.Tuple[str, str]] = provider_fanout.run(
+            self.settings, _get_tracking, request.serialize()
         )
 
         return lib.Deserializable(
@@ -13,14 +13,12 @@ def parse_tracking_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     responses = _responses.deserialize()
-    messages: typing.List[models.Message] = sum(
-        [
-            error.parse_error_response(response, settings, tracking_number=_)
-            for _, response in responses
-            if response.get("message") is not None
-        ],
-        [],
-    )
+    messages: typing.List[models.Message] = [
+        message
+        for _, response in responses
+        if response.get("message") is not None
+        for message in error.parse_error_response(response, settings, tracking_number=_)
+    ]
 
     tracking_details = [
         _extract_details(response, settings)
@@ -36,13 +34,8 @@ def _extract_details(
     settings: provider_utils.Settings,
 ) -> models.TrackingDetails:
     tracking = lib.to_object(locate2u.TrackingResponseType, data)
-    status = next(
-        (
-            status.name
-            for status in list(provider_units.TrackingStatus)
-            if tracking.status in status.value
-        ),
-        provider_units.TrackingStatus.in_transit.name,
+    status = provider_units.find_tracking_status(
+        tracking.status, provider_units.TrackingStatus.in_transit.name
     )
 
     return models.TrackingDetails(
@@ -58,22 +51,8 @@ def _extract_details(
                     tracking.statusChangeDateTime, "%Y-%m-%dT%H:%M:%S.%fZ"
                 ),
                 timestamp=lib.fiso_timestamp(tracking.statusChangeDateTime, current_format="%Y-%m-%dT%H:%M:%S.%fZ"),
-                status=next(
-                    (
-                        s.name
-                        for s in list(provider_units.TrackingStatus)
-                        if tracking.status in s.value
-                    ),
-                    None,
-                ),
-                reason=next(
-                    (
-                        r.name
-                        for r in list(provider_units.TrackingIncidentReason)
-                        if tracking.status in r.value
-                    ),
-                    None,
-                ),
+                status=provider_units.find_tracking_status(tracking.status),
+                reason=provider_units.find_incident_reason(tracking.status),
             )
         ],
         delivered=(status == "delivered"),